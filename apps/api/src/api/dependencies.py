@@ -0,0 +1,58 @@
+"""Shared route dependencies."""
+
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from redis.asyncio import Redis
+from supabase import Client
+
+from src.api.middleware.auth import CurrentUser
+from src.core.cache import get_cache
+from src.core.supabase import get_supabase_client
+from src.repositories.client_profile import ClientProfileRepository
+from src.schemas.client_profile import ClientProfile
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def get_active_profile(
+    request: Request,
+    user: CurrentUser,
+    supabase: Annotated[Client, Depends(get_supabase_client)],
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> ClientProfile:
+    """
+    Get the current user's active client profile.
+
+    The profile is looked up once per request and kept on ``request.state``,
+    so every dependency and handler in the request shares the same row.
+
+    Raises:
+        HTTPException: 400 if the user has no active profile.
+    """
+    profile: ClientProfile | None = getattr(request.state, "active_profile", None)
+    if profile is not None:
+        return profile
+
+    try:
+        profile = await ClientProfileRepository(supabase, redis=redis).get_active(user.id)
+    except Exception as e:
+        logger.exception("get_active_profile_failed", user_id=user.id, error=str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to load active client profile",
+        ) from e
+
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No active client profile. Please select a profile first.",
+        )
+
+    request.state.active_profile = profile
+    return profile
+
+
+# Type alias for cleaner route signatures
+ActiveProfile = Annotated[ClientProfile, Depends(get_active_profile)]
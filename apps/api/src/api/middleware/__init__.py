@@ -4,22 +4,34 @@ from src.api.middleware.auth import (
     AuthenticatedUser,
     CurrentUser,
     OptionalUser,
+    RequireRole,
     get_current_user,
     get_optional_user,
     require_role,
 )
-from src.api.middleware.logging import LoggingMiddleware
+from src.api.middleware.health import HealthCheckMiddleware
+from src.api.middleware.logging import (
+    LoggingMiddleware,
+    SafeHeaders,
+    start_log_writer,
+    stop_log_writer,
+)
 from src.api.middleware.rate_limit import RateLimiter, rate_limit_voice, voice_rate_limiter
 
 __all__ = [
     "AuthenticatedUser",
     "CurrentUser",
     "OptionalUser",
+    "HealthCheckMiddleware",
     "LoggingMiddleware",
+    "SafeHeaders",
     "get_current_user",
     "get_optional_user",
     "require_role",
+    "RequireRole",
     "RateLimiter",
     "rate_limit_voice",
     "voice_rate_limiter",
+    "start_log_writer",
+    "stop_log_writer",
 ]
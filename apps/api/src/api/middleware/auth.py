@@ -1,17 +1,20 @@
 """
 Authentication middleware for FastAPI.
 
-Provides JWT validation via Supabase Auth and user context extraction.
+Provides local verification of Supabase-issued JWTs and user context extraction.
 """
 
+import hashlib
+import time
 from dataclasses import dataclass
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from supabase import Client
+from jose import JWTError, jwt
 
-from src.core.supabase import get_supabase_client
+from src.core.supabase import get_supabase_jwt_secret
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +23,29 @@ logger = get_logger(__name__)
 security = HTTPBearer(auto_error=True)
 optional_security = HTTPBearer(auto_error=False)
 
+# Supabase signs access tokens with the project JWT secret
+JWT_ALGORITHMS = ["HS256"]
+JWT_AUDIENCE = "authenticated"
+
+# Validated tokens are cached so repeat requests skip signature verification
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE_MAXSIZE = 10_000
+
+# Sent with every 401 for a rejected token; built once, shared read-only
+_INVALID_TOKEN_DETAIL = "Invalid or expired token"
+_INVALID_TOKEN_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+
+def _invalid_token() -> HTTPException:
+    """Build the 401 raised for a rejected token."""
+    # A new exception per raise: a shared instance would carry the
+    # cause and traceback of whichever request raised it last
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=_INVALID_TOKEN_DETAIL,
+        headers=_INVALID_TOKEN_HEADERS,
+    )
+
 
 @dataclass
 class AuthenticatedUser:
@@ -35,16 +61,62 @@ class AuthenticatedUser:
         return self.role == "admin"
 
 
+# blake2b(token) -> (user, monotonic expiry); raw tokens are never stored
+_token_cache: dict[bytes, tuple[AuthenticatedUser, float]] = {}
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash a bearer token into a compact cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _token_ttl(payload: dict[str, Any]) -> float:
+    """Get how long a verified token may be cached, capped by its ``exp`` claim."""
+    try:
+        return min(TOKEN_CACHE_TTL_SECONDS, float(payload["exp"]) - time.time())
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def _cache_user(token: str, user: AuthenticatedUser, payload: dict[str, Any]) -> None:
+    """Cache a validated user until the token's TTL elapses."""
+    ttl = _token_ttl(payload)
+    if ttl <= 0:
+        return
+
+    if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _token_cache.pop(next(iter(_token_cache)), None)
+
+    _token_cache[_token_cache_key(token)] = (user, time.monotonic() + ttl)
+
+
+def _get_cached_user(token: str) -> AuthenticatedUser | None:
+    """Get a cached user for a token if present and not expired."""
+    key = _token_cache_key(token)
+    entry = _token_cache.get(key)
+    if entry is None:
+        return None
+
+    user, expires_at = entry
+    if time.monotonic() >= expires_at:
+        _token_cache.pop(key, None)
+        return None
+
+    return user
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    supabase: Annotated[Client, Depends(get_supabase_client)],
 ) -> AuthenticatedUser:
     """
     Validate JWT token and extract authenticated user.
 
+    The token signature, expiry and audience are verified locally against
+    the Supabase JWT secret, so no network call is made per request.
+
     Args:
         credentials: Bearer token from Authorization header.
-        supabase: Supabase client instance.
 
     Returns:
         AuthenticatedUser with id and email.
@@ -52,45 +124,47 @@ async def get_current_user(
     Raises:
         HTTPException: 401 if token is invalid or expired.
     """
+    cached_user = _get_cached_user(credentials.credentials)
+    if cached_user is not None:
+        return cached_user
+
     try:
-        # Validate token with Supabase
-        response = supabase.auth.get_user(credentials.credentials)
+        payload = jwt.decode(
+            credentials.credentials,
+            get_supabase_jwt_secret(),
+            algorithms=JWT_ALGORITHMS,
+            audience=JWT_AUDIENCE,
+        )
 
-        if response.user is None:
-            logger.warning("auth_failed", reason="no_user_in_response")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if not payload.get("sub"):
+            logger.warning("auth_failed", reason="no_subject_in_token")
+            raise _invalid_token()
 
-        user = response.user
         logger.info(
             "auth_success",
-            user_id=user.id,
-            email=user.email,
+            user_id=payload["sub"],
+            email=payload.get("email"),
         )
 
-        return AuthenticatedUser(
-            id=user.id,
-            email=user.email or "",
-            role=user.user_metadata.get("role", "user") if user.user_metadata else "user",
+        user_metadata = payload.get("user_metadata") or {}
+        authenticated_user = AuthenticatedUser(
+            id=payload["sub"],
+            email=payload.get("email") or "",
+            role=user_metadata.get("role", "user"),
         )
+        _cache_user(credentials.credentials, authenticated_user, payload)
+
+        return authenticated_user
 
     except HTTPException:
         raise
-    except Exception as e:
+    except JWTError as e:
         logger.warning("auth_failed", reason="token_validation_error", error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from e
+        raise _invalid_token() from e
 
 
 async def get_optional_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(optional_security)],
-    supabase: Annotated[Client, Depends(get_supabase_client)],
 ) -> AuthenticatedUser | None:
     """
     Optionally validate JWT token if provided.
@@ -99,7 +173,6 @@ async def get_optional_user(
 
     Args:
         credentials: Optional Bearer token from Authorization header.
-        supabase: Supabase client instance.
 
     Returns:
         AuthenticatedUser if valid token provided, None otherwise.
@@ -108,45 +181,61 @@ async def get_optional_user(
         return None
 
     try:
-        return await get_current_user(credentials, supabase)
+        return await get_current_user(credentials)
     except HTTPException:
         # For optional auth, return None instead of raising
         return None
 
 
-def require_role(required_role: str):
+class RequireRole:
     """
-    Create a dependency that requires a specific user role.
+    Dependency that requires a specific user role.
 
-    Args:
-        required_role: The role required to access the endpoint.
+    Admins pass every role check. Instances are shared per role via
+    ``require_role`` so FastAPI can dedupe them within a request.
+    """
 
-    Returns:
-        Dependency function that validates role.
+    __slots__ = ("role", "_forbidden_detail")
 
-    Example:
-        @app.get("/admin")
-        async def admin_only(user: AuthenticatedUser = Depends(require_role("admin"))):
-            return {"message": "Admin access granted"}
-    """
+    def __init__(self, role: str) -> None:
+        self.role = role
+        self._forbidden_detail = f"Role '{role}' required"
 
-    async def role_checker(
+    async def __call__(
+        self,
         user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     ) -> AuthenticatedUser:
-        if user.role != required_role and not user.is_admin:
+        if user.role != self.role and not user.is_admin:
             logger.warning(
                 "permission_denied",
                 user_id=user.id,
-                required_role=required_role,
+                required_role=self.role,
                 user_role=user.role,
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Role '{required_role}' required",
+                detail=self._forbidden_detail,
             )
         return user
 
-    return role_checker
+
+@lru_cache
+def require_role(required_role: str) -> RequireRole:
+    """
+    Get the dependency that requires a specific user role.
+
+    Args:
+        required_role: The role required to access the endpoint.
+
+    Returns:
+        Shared RequireRole dependency for the role.
+
+    Example:
+        @app.get("/admin")
+        async def admin_only(user: AuthenticatedUser = Depends(require_role("admin"))):
+            return {"message": "Admin access granted"}
+    """
+    return RequireRole(required_role)
 
 
 # Type aliases for cleaner route signatures
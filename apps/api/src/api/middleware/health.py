@@ -0,0 +1,44 @@
+"""
+Health probe short-circuit middleware.
+
+Container orchestrators hit the health endpoints every few seconds per pod.
+Answering them at the outermost middleware skips CORS, compression, request
+logging and routing for every probe.
+"""
+
+from collections.abc import Awaitable, Callable, Mapping
+
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+ProbeHandler = Callable[[], Awaitable[Response]]
+
+
+class HealthCheckMiddleware:
+    """
+    Middleware that serves health probes without entering the app.
+
+    Other requests are passed through untouched. The probe routes should
+    still be registered on the app so they appear in the OpenAPI schema.
+    """
+
+    def __init__(self, app: ASGIApp, probes: Mapping[str, ProbeHandler]) -> None:
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap.
+            probes: Handlers keyed by exact request path.
+        """
+        self.app = app
+        self._probes = dict(probes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            probe = self._probes.get(scope["path"])
+            if probe is not None:
+                response = await probe()
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
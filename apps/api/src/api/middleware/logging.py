@@ -2,21 +2,30 @@
 Request/response logging middleware for FastAPI.
 
 Logs HTTP requests with method, path, status code, and duration.
+
+Log records are pushed onto a bounded in-memory queue and emitted by a
+background task, so rendering and handler I/O stay off the request path.
 """
 
+import asyncio
+import contextlib
+import logging
+import secrets
 import time
-import uuid
-from collections.abc import Callable
 from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from src.utils.logging import bind_contextvars, clear_contextvars, get_logger
+from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Level checks go through the stdlib logger, which works whether or not
+# structlog has been configured for stdlib yet
+_level_logger = logging.getLogger(__name__)
+
 # Headers that should not be logged
 SENSITIVE_HEADERS = frozenset({
     "authorization",
@@ -27,6 +36,9 @@ SENSITIVE_HEADERS = frozenset({
     "set-cookie",
 })
 
+# ASGI header names are lowercase bytes, so raw headers match without .lower()
+_SENSITIVE_HEADERS_RAW = frozenset(name.encode("latin-1") for name in SENSITIVE_HEADERS)
+
 # Paths that should have minimal logging (health checks, etc.)
 QUIET_PATHS = frozenset({
     "/health",
@@ -35,89 +47,248 @@ QUIET_PATHS = frozenset({
     "/favicon.ico",
 })
 
+# Longer paths can't be quiet, so most requests skip the set lookup entirely
+_QUIET_MAX_LEN = max(map(len, QUIET_PATHS))
+
+# Maximum number of pending log records before new ones are dropped
+LOG_QUEUE_MAXSIZE = 10_000
+
+# Maximum number of records emitted per drain iteration
+LOG_BATCH_SIZE = 100
+
+# (level, event, fields)
+LogRecord = tuple[str, str, dict[str, Any]]
+
+_log_queue: asyncio.Queue[LogRecord] | None = None
+_log_writer_task: asyncio.Task[None] | None = None
+dropped_log_records = 0
+
+
+def _emit(record: LogRecord) -> None:
+    """Write a single queued record through the real logger."""
+    level, event, fields = record
+    getattr(logger, level)(event, **fields)
+
+
+async def _drain_log_queue(queue: asyncio.Queue[LogRecord]) -> None:
+    """Emit queued log records in batches until cancelled."""
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        for record in batch:
+            # A bad record must never take down the writer
+            with contextlib.suppress(Exception):
+                _emit(record)
+
+
+def start_log_writer() -> None:
+    """Create the log queue and start the background writer task."""
+    global _log_queue, _log_writer_task
+    if _log_writer_task is not None:
+        return
+    _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    _log_writer_task = asyncio.create_task(_drain_log_queue(_log_queue))
+
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware that logs request/response information."""
+async def stop_log_writer() -> None:
+    """Stop the background writer and flush any pending records."""
+    global _log_queue, _log_writer_task
+    if _log_writer_task is None or _log_queue is None:
+        return
+
+    _log_writer_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _log_writer_task
+
+    while not _log_queue.empty():
+        _emit(_log_queue.get_nowait())
+
+    _log_queue = None
+    _log_writer_task = None
+
+
+def enqueue_log(level: str, event: str, **fields: Any) -> None:
+    """
+    Queue a log record for the background writer.
+
+    Falls back to logging inline when the writer is not running (e.g. in
+    tests or scripts). Records are dropped when the queue is full.
+
+    Args:
+        level: Logger method name (info, warning, ...).
+        event: Event name.
+        **fields: Structured fields for the record.
+    """
+    global dropped_log_records
+    if _log_queue is None:
+        _emit((level, event, fields))
+        return
+
+    try:
+        _log_queue.put_nowait((level, event, fields))
+    except asyncio.QueueFull:
+        dropped_log_records += 1
+
+
+class LoggingMiddleware:
+    """
+    Middleware that logs request/response information.
+
+    Implemented as a plain ASGI middleware rather than BaseHTTPMiddleware,
+    which runs every request through an extra task group and Request/Response
+    wrappers.
+    """
 
     def __init__(self, app: ASGIApp) -> None:
         """Initialize the logging middleware."""
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Any],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log metrics."""
-        # Generate request ID for correlation
-        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Bind request context for all logs in this request
-        bind_contextvars(
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-        )
+        path = scope["path"]
+        method = scope["method"]
+        headers = Headers(scope=scope)
 
         # Skip detailed logging for quiet paths
-        is_quiet = request.url.path in QUIET_PATHS
+        is_quiet = len(path) <= _QUIET_MAX_LEN and path in QUIET_PATHS
+        request_id = headers.get("x-request-id")
+
+        # Uncorrelated quiet requests (health probes) bypass timing, request
+        # IDs and header injection; only failures are logged
+        if is_quiet and not request_id:
+
+            async def send_quiet(message: Message) -> None:
+                if message["type"] == "http.response.start" and message["status"] >= 400:
+                    enqueue_log(
+                        "warning",
+                        "request_completed",
+                        method=method,
+                        path=path,
+                        status_code=message["status"],
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_quiet)
+            return
+
+        # Generate request ID for correlation
+        if not request_id:
+            request_id = secrets.token_hex(16)
+
+        # Expose the correlation ID to route handlers as request.state.request_id;
+        # log records carry the request context explicitly
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["x-request-id"] = request_id
+            await send(message)
 
         start_time = time.perf_counter()
 
         try:
-            # Log incoming request (skip for quiet paths)
-            if not is_quiet:
-                logger.info(
+            # Log incoming request (skip for quiet paths, and skip building
+            # the record at all when info logs would be filtered out)
+            if not is_quiet and _level_logger.isEnabledFor(logging.INFO):
+                client = scope.get("client")
+                enqueue_log(
+                    "info",
                     "request_started",
-                    query_string=str(request.query_params) if request.query_params else None,
-                    client_host=request.client.host if request.client else None,
-                    user_agent=request.headers.get("user-agent"),
+                    request_id=request_id,
+                    method=method,
+                    path=path,
+                    query_string=scope["query_string"].decode("latin-1") or None,
+                    client_host=client[0] if client else None,
+                    user_agent=headers.get("user-agent"),
                 )
 
             # Process the request
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
 
             # Calculate duration
             duration_ms = (time.perf_counter() - start_time) * 1000
 
-            # Add request ID to response headers
-            response.headers["x-request-id"] = request_id
-
             # Log completed request
-            log_func = logger.info if response.status_code < 400 else logger.warning
-            if not is_quiet or response.status_code >= 400:
-                log_func(
+            if not is_quiet or status_code >= 400:
+                enqueue_log(
+                    "info" if status_code < 400 else "warning",
                     "request_completed",
-                    status_code=response.status_code,
+                    request_id=request_id,
+                    method=method,
+                    path=path,
+                    status_code=status_code,
                     duration_ms=round(duration_ms, 2),
                 )
 
-            return response
-
         except Exception as exc:
             duration_ms = (time.perf_counter() - start_time) * 1000
             logger.exception(
                 "request_failed",
+                request_id=request_id,
+                method=method,
+                path=path,
                 duration_ms=round(duration_ms, 2),
                 error=str(exc),
+                headers=SafeHeaders(scope["headers"]),
             )
             raise
 
-        finally:
-            clear_contextvars()
 
+def _filter_raw_headers(raw: list[tuple[bytes, bytes]]) -> dict[str, str]:
+    """Decode raw ASGI headers, replacing sensitive values."""
+    return {
+        key.decode("latin-1"): (
+            "[FILTERED]" if key in _SENSITIVE_HEADERS_RAW else value.decode("latin-1")
+        )
+        for key, value in raw
+    }
+
+
+class SafeHeaders:
+    """
+    Log field that renders request headers with sensitive values filtered.
+
+    Holds the raw header list and only decodes and filters it when the log
+    record is actually rendered, so dropped or filtered records cost nothing.
+    """
+
+    __slots__ = ("_raw",)
 
-def get_safe_headers(request: Request) -> dict[str, str]:
+    def __init__(self, raw: list[tuple[bytes, bytes]]) -> None:
+        self._raw = raw
+
+    def __structlog__(self) -> dict[str, str]:
+        # Lets JSONRenderer emit the headers as an object rather than a repr
+        return _filter_raw_headers(self._raw)
+
+    def __repr__(self) -> str:
+        return repr(_filter_raw_headers(self._raw))
+
+    __str__ = __repr__
+
+
+def get_safe_headers(request: Request) -> SafeHeaders:
     """
-    Get request headers with sensitive values filtered.
+    Get request headers with sensitive values filtered, for use as a log field.
 
     Args:
         request: The FastAPI request object.
 
     Returns:
-        Dictionary of header names to values with sensitive headers filtered.
+        Headers that are decoded and filtered only when the record is rendered.
     """
-    return {
-        key: "[FILTERED]" if key.lower() in SENSITIVE_HEADERS else value
-        for key, value in request.headers.items()
-    }
+    return SafeHeaders(request.headers.raw)
@@ -2,17 +2,32 @@
 
 import logging
 import time
-from collections import defaultdict
 from threading import Lock
-from typing import Callable
 
-from fastapi import HTTPException, Request, status
+from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
+# Number of lock stripes; must be a power of two
+_NUM_SHARDS = 16
+
 
 class RateLimiter:
-    """Simple in-memory rate limiter using sliding window algorithm.
+    """Simple in-memory rate limiter using token bucket algorithm.
+
+    Each user gets a bucket holding up to ``requests_per_minute`` tokens that
+    refills continuously over ``window_seconds``. Every check is O(1).
+
+    Time is measured with ``time.monotonic_ns()`` so wall-clock adjustments
+    cannot drain or freeze buckets. Token balances are kept as integer
+    credit where one token equals ``window_ns`` credit, so refill is pure
+    integer arithmetic.
+
+    Buckets are striped across independently locked shards so that
+    concurrent requests from different users rarely contend. Each shard
+    drops buckets idle for a full window (they are back at capacity, so
+    forgetting them is lossless) at most once per window, keeping memory
+    bounded by recently active users.
 
     Thread-safe implementation suitable for single-process deployments.
     For distributed deployments, consider Redis-based rate limiting.
@@ -31,15 +46,42 @@ class RateLimiter:
         """
         self.max_requests = requests_per_minute
         self.window_seconds = window_seconds
-        self._requests: dict[str, list[float]] = defaultdict(list)
-        self._lock = Lock()
-
-    def _clean_old_requests(self, user_id: str, current_time: float) -> None:
-        """Remove requests outside the current window."""
-        cutoff = current_time - self.window_seconds
-        self._requests[user_id] = [
-            t for t in self._requests[user_id] if t > cutoff
+        self._window_ns = window_seconds * 1_000_000_000
+        self._capacity = requests_per_minute * self._window_ns
+        # Each shard maps user_id -> (credit, last_refill_ns)
+        self._shards: list[tuple[Lock, dict[str, tuple[int, int]]]] = [
+            (Lock(), {}) for _ in range(_NUM_SHARDS)
         ]
+        self._next_sweep_ns = [0] * _NUM_SHARDS
+
+    def _shard_index(self, user_id: str) -> int:
+        """Get the index of the shard responsible for a user."""
+        return hash(user_id) & (_NUM_SHARDS - 1)
+
+    def _sweep(self, buckets: dict[str, tuple[int, int]], now_ns: int) -> None:
+        """Drop buckets that have been idle for at least one window.
+
+        Must be called with the shard lock held.
+        """
+        cutoff_ns = now_ns - self._window_ns
+        stale = [user_id for user_id, (_, last) in buckets.items() if last <= cutoff_ns]
+        for user_id in stale:
+            del buckets[user_id]
+
+    def _refill(
+        self,
+        buckets: dict[str, tuple[int, int]],
+        user_id: str,
+        now_ns: int,
+    ) -> int:
+        """Return the user's credit refilled up to the current time."""
+        # Unknown users start from a full bucket refilled "now", so the
+        # first request takes the same path as every other
+        credit, last_refill_ns = buckets.get(user_id, (self._capacity, now_ns))
+        return min(
+            self._capacity,
+            credit + (now_ns - last_refill_ns) * self.max_requests,
+        )
 
     def check_rate_limit(self, user_id: str) -> tuple[bool, int]:
         """Check if request is allowed and record it.
@@ -50,19 +92,24 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, remaining_requests)
         """
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
+        index = self._shard_index(user_id)
+        lock, buckets = self._shards[index]
 
-        with self._lock:
-            self._clean_old_requests(user_id, current_time)
-            current_count = len(self._requests[user_id])
+        with lock:
+            if now_ns >= self._next_sweep_ns[index]:
+                self._sweep(buckets, now_ns)
+                self._next_sweep_ns[index] = now_ns + self._window_ns
 
-            if current_count >= self.max_requests:
-                remaining = 0
-                return False, remaining
+            credit = self._refill(buckets, user_id, now_ns)
 
-            self._requests[user_id].append(current_time)
-            remaining = self.max_requests - current_count - 1
-            return True, remaining
+            if credit < self._window_ns:
+                buckets[user_id] = (credit, now_ns)
+                return False, 0
+
+            credit -= self._window_ns
+            buckets[user_id] = (credit, now_ns)
+            return True, credit // self._window_ns
 
     def get_retry_after(self, user_id: str) -> int:
         """Get seconds until next request is allowed.
@@ -73,13 +120,18 @@ class RateLimiter:
         Returns:
             Seconds until rate limit resets
         """
-        if not self._requests.get(user_id):
+        now_ns = time.monotonic_ns()
+        lock, buckets = self._shards[self._shard_index(user_id)]
+
+        with lock:
+            credit = self._refill(buckets, user_id, now_ns)
+
+        if credit >= self._window_ns:
             return 0
 
-        oldest_request = min(self._requests[user_id])
-        current_time = time.time()
-        retry_after = self.window_seconds - (current_time - oldest_request)
-        return max(1, int(retry_after))
+        # Ceiling division: seconds until one full token has accrued
+        deficit = self._window_ns - credit
+        return max(1, -(-deficit // (self.max_requests * 1_000_000_000)))
 
 
 # Voice-specific rate limiter (10 requests per minute)
@@ -0,0 +1,113 @@
+"""Response classes shared by API routers."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Naive datetimes are treated as UTC and all datetimes are emitted in
+    RFC 3339 form with a ``Z`` suffix.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    """Wrap already-serialized JSON so it is sent without re-encoding."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+# Clients must revalidate on every use, so edits show up immediately; an
+# unchanged resource costs only a 304
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+# For resources that can no longer change; clients reuse them without asking
+IMMUTABLE_CACHE_CONTROL = "private, max-age=3600, immutable"
+
+
+def make_etag(data: bytes) -> str:
+    """
+    Build a weak ETag from a hash of the given bytes.
+
+    ETags are weak because compression middleware may re-encode the body.
+    """
+    return f'W/"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as required for If-None-Match
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(
+    request: Request, etag: str, cache_control: str = ETAG_CACHE_CONTROL
+) -> Response | None:
+    """
+    Get a 304 response if the client already holds the given ETag.
+
+    Lets handlers that can fingerprint a resource cheaply skip building it.
+
+    Args:
+        request: Incoming request, checked for If-None-Match.
+        etag: Current ETag of the resource.
+        cache_control: Cache-Control header to send with the 304.
+
+    Returns:
+        Empty 304 response, or None if the client's copy is stale or missing.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": cache_control},
+        )
+    return None
+
+
+def etag_json_response(
+    request: Request,
+    body: bytes,
+    etag: str | None = None,
+    cache_control: str = ETAG_CACHE_CONTROL,
+) -> Response:
+    """
+    Send serialized JSON with an ETag, or 304 if the client already has it.
+
+    Args:
+        request: Incoming request, checked for If-None-Match.
+        body: Serialized JSON body.
+        etag: ETag for the body. Defaults to a hash of the body, so it
+            changes exactly when the representation does.
+        cache_control: Cache-Control header for the response.
+
+    Returns:
+        200 response with the body, or an empty 304 response.
+    """
+    etag = etag or make_etag(body)
+    response = not_modified(request, etag, cache_control)
+    if response is not None:
+        return response
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
@@ -1,12 +1,17 @@
 """Analytics routes."""
 
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Annotated
 
+import asyncpg
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from redis.asyncio import Redis
 from supabase import Client
 
 from src.api.middleware.auth import CurrentUser
+from src.core.cache import get_cache
+from src.core.db_pool import get_pool
 from src.core.supabase import get_supabase_client
 from src.repositories.client_profile import ClientProfileRepository
 from src.schemas.analytics import (
@@ -24,18 +29,34 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
 
+# The service and repository are stateless wrappers around the client, so
+# one instance is kept per client rather than rebuilt on every request
+@lru_cache(maxsize=8)
+def _analytics_service_for(supabase: Client) -> AnalyticsService:
+    return AnalyticsService(supabase)
+
+
+@lru_cache(maxsize=8)
+def _profile_repository_for(
+    supabase: Client, pool: asyncpg.Pool | None, redis: Redis
+) -> ClientProfileRepository:
+    return ClientProfileRepository(supabase, pool, redis)
+
+
 def get_analytics_service(
     supabase: Annotated[Client, Depends(get_supabase_client)],
 ) -> AnalyticsService:
     """Get analytics service instance."""
-    return AnalyticsService(supabase)
+    return _analytics_service_for(supabase)
 
 
 def get_profile_repository(
     supabase: Annotated[Client, Depends(get_supabase_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
+    redis: Annotated[Redis, Depends(get_cache)],
 ) -> ClientProfileRepository:
     """Get client profile repository instance."""
-    return ClientProfileRepository(supabase)
+    return _profile_repository_for(supabase, pool, redis)
 
 
 @router.get("/profile", response_model=ProfileAnalyticsResponse)
@@ -194,7 +215,7 @@ async def get_specific_profile_analytics(
     )
 
     try:
-        # Verify ownership
+        # Verify ownership before any analytics query runs
         profile = await profile_repo.get_by_id(profile_id, user.id)
         if not profile:
             raise HTTPException(
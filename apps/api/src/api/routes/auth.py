@@ -4,14 +4,15 @@ Authentication routes for user registration, login, and session management.
 Wraps Supabase Auth for consistent API responses.
 """
 
-from typing import Annotated
+import asyncio
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr, Field
 from supabase import Client
 
 from src.api.middleware.auth import CurrentUser
-from src.core.supabase import get_supabase_client
+from src.core.supabase import get_supabase_auth_client
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -68,6 +69,35 @@ class MessageResponse(BaseModel):
     message: str
 
 
+def _build_auth_response(response: Any) -> AuthResponse:
+    """
+    Build an AuthResponse from a Supabase auth response.
+
+    The values come from Supabase's already-typed response, so the models
+    are constructed without re-running field validation.
+
+    Args:
+        response: Supabase auth response with both user and session set.
+
+    Returns:
+        AuthResponse with tokens and user information.
+    """
+    session = response.session
+    user = response.user
+    created_at = user.created_at
+    return AuthResponse.model_construct(
+        access_token=session.access_token,
+        refresh_token=session.refresh_token,
+        token_type="bearer",
+        expires_in=session.expires_in or 3600,
+        user=UserResponse.model_construct(
+            id=user.id,
+            email=user.email or "",
+            created_at=created_at.isoformat() if created_at else None,
+        ),
+    )
+
+
 # =============================================================================
 # Routes
 # =============================================================================
@@ -76,7 +106,7 @@ class MessageResponse(BaseModel):
 @router.post("/register", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     request: RegisterRequest,
-    supabase: Annotated[Client, Depends(get_supabase_client)],
+    supabase: Annotated[Client, Depends(get_supabase_auth_client)],
 ) -> AuthResponse:
     """
     Register a new user account.
@@ -87,7 +117,8 @@ async def register(
     logger.info("registration_attempt", email=request.email)
 
     try:
-        response = supabase.auth.sign_up(
+        response = await asyncio.to_thread(
+            supabase.auth.sign_up,
             {
                 "email": request.email,
                 "password": request.password,
@@ -111,16 +142,7 @@ async def register(
 
         logger.info("registration_success", user_id=response.user.id)
 
-        return AuthResponse(
-            access_token=response.session.access_token,
-            refresh_token=response.session.refresh_token,
-            expires_in=response.session.expires_in or 3600,
-            user=UserResponse(
-                id=response.user.id,
-                email=response.user.email or "",
-                created_at=response.user.created_at,
-            ),
-        )
+        return _build_auth_response(response)
 
     except HTTPException:
         raise
@@ -143,7 +165,7 @@ async def register(
 @router.post("/login", response_model=AuthResponse)
 async def login(
     request: LoginRequest,
-    supabase: Annotated[Client, Depends(get_supabase_client)],
+    supabase: Annotated[Client, Depends(get_supabase_auth_client)],
 ) -> AuthResponse:
     """
     Authenticate user and return access tokens.
@@ -153,7 +175,8 @@ async def login(
     logger.info("login_attempt", email=request.email)
 
     try:
-        response = supabase.auth.sign_in_with_password(
+        response = await asyncio.to_thread(
+            supabase.auth.sign_in_with_password,
             {
                 "email": request.email,
                 "password": request.password,
@@ -169,16 +192,7 @@ async def login(
 
         logger.info("login_success", user_id=response.user.id)
 
-        return AuthResponse(
-            access_token=response.session.access_token,
-            refresh_token=response.session.refresh_token,
-            expires_in=response.session.expires_in or 3600,
-            user=UserResponse(
-                id=response.user.id,
-                email=response.user.email or "",
-                created_at=response.user.created_at,
-            ),
-        )
+        return _build_auth_response(response)
 
     except HTTPException:
         raise
@@ -193,7 +207,7 @@ async def login(
 @router.post("/refresh", response_model=AuthResponse)
 async def refresh_token(
     request: RefreshRequest,
-    supabase: Annotated[Client, Depends(get_supabase_client)],
+    supabase: Annotated[Client, Depends(get_supabase_auth_client)],
 ) -> AuthResponse:
     """
     Refresh access token using refresh token.
@@ -203,7 +217,7 @@ async def refresh_token(
     logger.info("token_refresh_attempt")
 
     try:
-        response = supabase.auth.refresh_session(request.refresh_token)
+        response = await asyncio.to_thread(supabase.auth.refresh_session, request.refresh_token)
 
         if response.user is None or response.session is None:
             logger.warning("token_refresh_failed", reason="invalid_refresh_token")
@@ -214,16 +228,7 @@ async def refresh_token(
 
         logger.info("token_refresh_success", user_id=response.user.id)
 
-        return AuthResponse(
-            access_token=response.session.access_token,
-            refresh_token=response.session.refresh_token,
-            expires_in=response.session.expires_in or 3600,
-            user=UserResponse(
-                id=response.user.id,
-                email=response.user.email or "",
-                created_at=response.user.created_at,
-            ),
-        )
+        return _build_auth_response(response)
 
     except HTTPException:
         raise
@@ -238,7 +243,7 @@ async def refresh_token(
 @router.post("/logout", response_model=MessageResponse)
 async def logout(
     _user: CurrentUser,
-    supabase: Annotated[Client, Depends(get_supabase_client)],
+    supabase: Annotated[Client, Depends(get_supabase_auth_client)],
 ) -> MessageResponse:
     """
     Log out the current user.
@@ -248,7 +253,7 @@ async def logout(
     logger.info("logout_attempt", user_id=_user.id)
 
     try:
-        supabase.auth.sign_out()
+        await asyncio.to_thread(supabase.auth.sign_out)
         logger.info("logout_success", user_id=_user.id)
         return MessageResponse(message="Successfully logged out.")
     except Exception as e:
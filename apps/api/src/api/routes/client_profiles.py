@@ -1,15 +1,33 @@
 """Client profile routes."""
 
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
 from supabase import Client
 
 from src.api.middleware.auth import CurrentUser
+from src.api.responses import ORJSONResponse, etag_json_response, json_response
+from src.core.cache import (
+    cache_get,
+    cache_hget,
+    cache_hset,
+    cache_set,
+    client_profile_active_key,
+    client_profile_by_id_key,
+    client_profile_list_key,
+    get_cache,
+    invalidate_client_profile_cache,
+)
+from src.core.db_pool import get_pool
 from src.core.supabase import get_supabase_client
 from src.repositories.client_profile import ClientProfileRepository
 from src.repositories.conversation import ConversationRepository
 from src.schemas.client_profile import (
+    ClientProfile,
     ClientProfileCreate,
     ClientProfileListResponse,
     ClientProfileResponse,
@@ -18,34 +36,103 @@ from src.schemas.client_profile import (
 from src.schemas.conversation import (
     ConversationDetailResponse,
     ConversationListResponse,
-    ConversationSummaryResponse,
+    ConversationSummary,
 )
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/client-profiles", tags=["Client Profiles"])
+router = APIRouter(
+    prefix="/client-profiles",
+    tags=["Client Profiles"],
+    default_response_class=ORJSONResponse,
+)
+
+
+# Repositories are stateless wrappers around the client, so one instance is
+# kept per client rather than rebuilt on every request
+@lru_cache(maxsize=8)
+def _client_profile_repository_for(
+    supabase: Client, pool: asyncpg.Pool | None, redis: Redis
+) -> ClientProfileRepository:
+    return ClientProfileRepository(supabase, pool, redis)
+
+
+@lru_cache(maxsize=8)
+def _conversation_repository_for(
+    supabase: Client, pool: asyncpg.Pool | None, redis: Redis
+) -> ConversationRepository:
+    return ConversationRepository(supabase, pool, redis)
+
+
+# Response fields are a subset of ClientProfile's attributes
+_RESPONSE_FIELDS = tuple(ClientProfileResponse.model_fields)
+
+
+def _to_response(profile: ClientProfile) -> ClientProfileResponse:
+    """
+    Build a response from a repository profile without re-validating it.
+
+    The repository already returns validated ClientProfile models, so the
+    fields are copied as-is.
+    """
+    return ClientProfileResponse.model_construct(
+        **{field: getattr(profile, field) for field in _RESPONSE_FIELDS}
+    )
+
+
+def _to_json(profile: ClientProfile) -> bytes:
+    """Serialize a profile response in a single pass by pydantic-core."""
+    return _to_response(profile).model_dump_json().encode()
+
+
+# Lists are serialized straight from the repository models, picking out the
+# response fields, instead of building a ClientProfileResponse per profile
+_PROFILE_LIST_ADAPTER = TypeAdapter(list[ClientProfile])
+_PROFILE_LIST_INCLUDE = {"__all__": set(_RESPONSE_FIELDS)}
+
+
+def _list_to_json(profiles: list[ClientProfile]) -> bytes:
+    """Serialize profiles in the ClientProfileListResponse shape."""
+    items = _PROFILE_LIST_ADAPTER.dump_json(profiles, include=_PROFILE_LIST_INCLUDE)
+    return b'{"profiles":%b,"total":%d}' % (items, len(profiles))
+
+
+# Summaries carry exactly the ConversationSummaryResponse fields
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(list[ConversationSummary])
+
+
+def _conversation_list_to_json(conversations: list[ConversationSummary]) -> bytes:
+    """Serialize conversation summaries in the ConversationListResponse shape."""
+    items = _CONVERSATION_LIST_ADAPTER.dump_json(conversations)
+    return b'{"conversations":%b,"total":%d}' % (items, len(conversations))
 
 
 def get_client_profile_repository(
     supabase: Annotated[Client, Depends(get_supabase_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
+    redis: Annotated[Redis, Depends(get_cache)],
 ) -> ClientProfileRepository:
     """Get client profile repository instance."""
-    return ClientProfileRepository(supabase)
+    return _client_profile_repository_for(supabase, pool, redis)
 
 
 def get_conversation_repository(
     supabase: Annotated[Client, Depends(get_supabase_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
+    redis: Annotated[Redis, Depends(get_cache)],
 ) -> ConversationRepository:
     """Get conversation repository instance."""
-    return ConversationRepository(supabase)
+    return _conversation_repository_for(supabase, pool, redis)
 
 
 @router.get("", response_model=ClientProfileListResponse)
 async def list_client_profiles(
+    request: Request,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
-) -> ClientProfileListResponse:
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> Response:
     """
     List all client profiles for the authenticated user.
 
@@ -53,28 +140,18 @@ async def list_client_profiles(
     """
     logger.info("list_client_profiles_request", user_id=user.id)
 
+    cache_key = client_profile_list_key(user.id)
+    cached = await cache_get(redis, cache_key)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
     try:
         profiles = await repo.list_by_user(user.id)
 
-        return ClientProfileListResponse(
-            profiles=[
-                ClientProfileResponse(
-                    id=p.id,
-                    user_id=p.user_id,
-                    company_name=p.company_name,
-                    industry=p.industry,
-                    ideal_customer_profile=p.ideal_customer_profile,
-                    services=p.services,
-                    additional_context=p.additional_context,
-                    scoring_weight_overrides=p.scoring_weight_overrides,
-                    is_active=p.is_active,
-                    created_at=p.created_at,
-                    updated_at=p.updated_at,
-                )
-                for p in profiles
-            ],
-            total=len(profiles),
-        )
+        body = _list_to_json(profiles)
+        await cache_set(redis, cache_key, body)
+
+        return etag_json_response(request, body)
     except Exception as e:
         logger.exception("list_client_profiles_failed", user_id=user.id, error=str(e))
         raise HTTPException(
@@ -88,7 +165,8 @@ async def create_client_profile(
     request: ClientProfileCreate,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
-) -> ClientProfileResponse:
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> Response:
     """
     Create a new client profile.
 
@@ -98,20 +176,9 @@ async def create_client_profile(
 
     try:
         profile = await repo.create(user.id, request)
+        await invalidate_client_profile_cache(redis, user.id)
 
-        return ClientProfileResponse(
-            id=profile.id,
-            user_id=profile.user_id,
-            company_name=profile.company_name,
-            industry=profile.industry,
-            ideal_customer_profile=profile.ideal_customer_profile,
-            services=profile.services,
-            additional_context=profile.additional_context,
-            scoring_weight_overrides=profile.scoring_weight_overrides,
-            is_active=profile.is_active,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        return json_response(_to_json(profile), status.HTTP_201_CREATED)
     except Exception as e:
         logger.exception("create_client_profile_failed", user_id=user.id, error=str(e))
         raise HTTPException(
@@ -123,9 +190,11 @@ async def create_client_profile(
 @router.get("/{profile_id}", response_model=ClientProfileResponse)
 async def get_client_profile(
     profile_id: str,
+    request: Request,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
-) -> ClientProfileResponse:
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> Response:
     """
     Get a specific client profile by ID.
 
@@ -133,6 +202,11 @@ async def get_client_profile(
     """
     logger.info("get_client_profile_request", profile_id=profile_id, user_id=user.id)
 
+    cache_key = client_profile_by_id_key(user.id)
+    cached = await cache_hget(redis, cache_key, profile_id)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
     try:
         profile = await repo.get_by_id(profile_id, user.id)
 
@@ -142,19 +216,10 @@ async def get_client_profile(
                 detail="Client profile not found",
             )
 
-        return ClientProfileResponse(
-            id=profile.id,
-            user_id=profile.user_id,
-            company_name=profile.company_name,
-            industry=profile.industry,
-            ideal_customer_profile=profile.ideal_customer_profile,
-            services=profile.services,
-            additional_context=profile.additional_context,
-            scoring_weight_overrides=profile.scoring_weight_overrides,
-            is_active=profile.is_active,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        body = _to_json(profile)
+        await cache_hset(redis, cache_key, profile_id, body)
+
+        return etag_json_response(request, body)
     except HTTPException:
         raise
     except Exception as e:
@@ -171,7 +236,8 @@ async def update_client_profile(
     request: ClientProfileUpdate,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
-) -> ClientProfileResponse:
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> Response:
     """
     Update a client profile.
 
@@ -188,19 +254,9 @@ async def update_client_profile(
                 detail="Client profile not found",
             )
 
-        return ClientProfileResponse(
-            id=profile.id,
-            user_id=profile.user_id,
-            company_name=profile.company_name,
-            industry=profile.industry,
-            ideal_customer_profile=profile.ideal_customer_profile,
-            services=profile.services,
-            additional_context=profile.additional_context,
-            scoring_weight_overrides=profile.scoring_weight_overrides,
-            is_active=profile.is_active,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        await invalidate_client_profile_cache(redis, user.id)
+
+        return json_response(_to_json(profile))
     except HTTPException:
         raise
     except Exception as e:
@@ -216,6 +272,7 @@ async def delete_client_profile(
     profile_id: str,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
+    redis: Annotated[Redis, Depends(get_cache)],
 ) -> None:
     """
     Delete a client profile.
@@ -233,6 +290,8 @@ async def delete_client_profile(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Client profile not found",
             )
+
+        await invalidate_client_profile_cache(redis, user.id)
     except HTTPException:
         raise
     except Exception as e:
@@ -248,7 +307,8 @@ async def activate_client_profile(
     profile_id: str,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
-) -> ClientProfileResponse:
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> Response:
     """
     Set a client profile as the active profile.
 
@@ -265,19 +325,9 @@ async def activate_client_profile(
                 detail="Client profile not found",
             )
 
-        return ClientProfileResponse(
-            id=profile.id,
-            user_id=profile.user_id,
-            company_name=profile.company_name,
-            industry=profile.industry,
-            ideal_customer_profile=profile.ideal_customer_profile,
-            services=profile.services,
-            additional_context=profile.additional_context,
-            scoring_weight_overrides=profile.scoring_weight_overrides,
-            is_active=profile.is_active,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        await invalidate_client_profile_cache(redis, user.id)
+
+        return json_response(_to_json(profile))
     except HTTPException:
         raise
     except Exception as e:
@@ -290,9 +340,11 @@ async def activate_client_profile(
 
 @router.get("/active", response_model=ClientProfileResponse | None)
 async def get_active_client_profile(
+    request: Request,
     user: CurrentUser,
     repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
-) -> ClientProfileResponse | None:
+    redis: Annotated[Redis, Depends(get_cache)],
+) -> Response:
     """
     Get the currently active client profile for the user.
 
@@ -300,25 +352,18 @@ async def get_active_client_profile(
     """
     logger.info("get_active_client_profile_request", user_id=user.id)
 
+    cache_key = client_profile_active_key(user.id)
+    cached = await cache_get(redis, cache_key)
+    if cached is not None:
+        return etag_json_response(request, cached)
+
     try:
         profile = await repo.get_active(user.id)
 
-        if not profile:
-            return None
-
-        return ClientProfileResponse(
-            id=profile.id,
-            user_id=profile.user_id,
-            company_name=profile.company_name,
-            industry=profile.industry,
-            ideal_customer_profile=profile.ideal_customer_profile,
-            services=profile.services,
-            additional_context=profile.additional_context,
-            scoring_weight_overrides=profile.scoring_weight_overrides,
-            is_active=profile.is_active,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
+        body = _to_json(profile) if profile else b"null"
+        await cache_set(redis, cache_key, body)
+
+        return etag_json_response(request, body)
     except Exception as e:
         logger.exception("get_active_client_profile_failed", user_id=user.id, error=str(e))
         raise HTTPException(
@@ -333,7 +378,7 @@ async def list_profile_conversations(
     user: CurrentUser,
     profile_repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
     conversation_repo: Annotated[ConversationRepository, Depends(get_conversation_repository)],
-) -> ConversationListResponse:
+) -> Response:
     """
     List all conversations for a client profile.
 
@@ -353,20 +398,7 @@ async def list_profile_conversations(
         # Get conversations
         conversations = await conversation_repo.list_by_profile(profile_id, user.id)
 
-        return ConversationListResponse(
-            conversations=[
-                ConversationSummaryResponse(
-                    id=c.id,
-                    status=c.status,
-                    message_count=len(c.messages),
-                    extracted_profile=c.extracted_profile,
-                    started_at=c.started_at,
-                    completed_at=c.completed_at,
-                )
-                for c in conversations
-            ],
-            total=len(conversations),
-        )
+        return json_response(_conversation_list_to_json(conversations))
     except HTTPException:
         raise
     except Exception as e:
@@ -384,7 +416,7 @@ async def get_profile_conversation(
     user: CurrentUser,
     profile_repo: Annotated[ClientProfileRepository, Depends(get_client_profile_repository)],
     conversation_repo: Annotated[ConversationRepository, Depends(get_conversation_repository)],
-) -> ConversationDetailResponse:
+) -> Response:
     """
     Get detailed conversation history.
 
@@ -421,16 +453,9 @@ async def get_profile_conversation(
                 detail="Conversation not found",
             )
 
-        return ConversationDetailResponse(
-            id=conversation.id,
-            user_id=conversation.user_id,
-            client_profile_id=conversation.client_profile_id,
-            status=conversation.status,
-            messages=conversation.messages,
-            extracted_profile=conversation.extracted_profile,
-            started_at=conversation.started_at,
-            completed_at=conversation.completed_at,
-        )
+        body = ConversationDetailResponse.model_validate(conversation).model_dump_json().encode()
+
+        return json_response(body)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,12 +1,17 @@
 """Conversation routes for onboarding flow."""
 
+from functools import lru_cache
 from typing import Annotated
-from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncpg
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from redis.asyncio import Redis
 from supabase import Client
 
 from src.api.middleware.auth import CurrentUser, OptionalUser
+from src.api.responses import ORJSONResponse
+from src.core.cache import get_cache, invalidate_client_profile_cache
+from src.core.db_pool import get_pool
 from src.core.supabase import get_supabase_admin_client, get_supabase_client
 from src.schemas.conversation import (
     Conversation,
@@ -18,18 +23,35 @@ from src.schemas.conversation import (
 )
 from src.services.conversation_agent import ConversationAgent
 from src.services.llm_service import LLMService
+from src.utils.ids import new_id
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/conversations", tags=["Conversations"])
+router = APIRouter(
+    prefix="/conversations",
+    tags=["Conversations"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@lru_cache(maxsize=1)
+def _llm_service() -> LLMService:
+    """Get the shared LLM service (its provider chain is built once)."""
+    return LLMService()
+
+
+@lru_cache(maxsize=8)
+def _conversation_agent_for(supabase: Client, pool: asyncpg.Pool | None) -> ConversationAgent:
+    return ConversationAgent(supabase, _llm_service(), pool)
 
 
 def get_conversation_agent(
     supabase: Annotated[Client, Depends(get_supabase_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
 ) -> ConversationAgent:
     """Get conversation agent instance."""
-    return ConversationAgent(supabase, LLMService())
+    return _conversation_agent_for(supabase, pool)
 
 
 @router.post("", response_model=ConversationResponse, status_code=status.HTTP_201_CREATED)
@@ -46,13 +68,7 @@ async def start_conversation(
     try:
         conversation = await agent.start_conversation()
 
-        return ConversationResponse(
-            id=conversation.id,
-            status=conversation.status,
-            messages=conversation.messages,
-            started_at=conversation.started_at,
-            completed_at=conversation.completed_at,
-        )
+        return ConversationResponse.model_validate(conversation)
     except Exception as e:
         logger.exception("start_conversation_failed", error=str(e))
         raise HTTPException(
@@ -83,7 +99,7 @@ async def send_message(
         )
 
         return MessageResponse(
-            id=str(uuid4()),  # Message ID
+            id=new_id(),  # Message ID
             content=response_msg.content,
             role=response_msg.role,
             timestamp=response_msg.timestamp,
@@ -131,13 +147,7 @@ async def get_conversation(
                 detail="Conversation not found",
             )
 
-        return ConversationResponse(
-            id=conversation.id,
-            status=conversation.status,
-            messages=conversation.messages,
-            started_at=conversation.started_at,
-            completed_at=conversation.completed_at,
-        )
+        return ConversationResponse.model_validate(conversation)
 
     except HTTPException:
         raise
@@ -154,6 +164,9 @@ async def convert_conversation(
     conversation_id: str,
     user: CurrentUser,
     supabase: Annotated[Client, Depends(get_supabase_admin_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
+    redis: Annotated[Redis, Depends(get_cache)],
+    background: BackgroundTasks,
 ) -> ConvertResponse:
     """
     Convert a completed conversation to a client profile.
@@ -164,9 +177,9 @@ async def convert_conversation(
     logger.info("convert_conversation_request", conversation_id=conversation_id, user_id=user.id)
 
     try:
-        from src.repositories.conversation import ConversationRepository
+        from src.repositories.conversation import CONVERTIBLE_STATUSES, ConversationRepository
 
-        repo = ConversationRepository(supabase)
+        repo = ConversationRepository(supabase, pool, redis)
         conversation = await repo.get_by_id(conversation_id)
 
         if not conversation:
@@ -175,7 +188,7 @@ async def convert_conversation(
                 detail="Conversation not found",
             )
 
-        if conversation.status not in [ConversationStatus.COMPLETED, ConversationStatus.IN_PROGRESS]:
+        if conversation.status not in CONVERTIBLE_STATUSES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Conversation cannot be converted (status: {conversation.status.value})",
@@ -188,7 +201,7 @@ async def convert_conversation(
             )
 
         # Create client profile
-        profile_id = str(uuid4())
+        profile_id = new_id()
         profile_data = {
             "id": profile_id,
             "user_id": user.id,
@@ -201,13 +214,20 @@ async def convert_conversation(
             "is_active": True,
         }
 
-        # Insert profile
-        supabase.table("client_profiles").insert(profile_data).execute()
-
-        # Link conversation to user and profile
-        await repo.link_to_user(conversation_id, user.id, profile_id)
-
-        logger.info(
+        # Insert profile and link the conversation to it in one transaction
+        try:
+            await repo.convert_to_client_profile(conversation_id, user.id, profile_data)
+        except ValueError as e:
+            # Converted (or deleted) by a concurrent request since the check above
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Conversation was already converted",
+            ) from e
+        await invalidate_client_profile_cache(redis, user.id)
+
+        # Nothing else needs to wait on the log record
+        background.add_task(
+            logger.info,
             "conversation_converted",
             conversation_id=conversation_id,
             user_id=user.id,
@@ -1,43 +1,142 @@
 """Health check endpoints for monitoring and container orchestration."""
 
-from datetime import UTC, datetime
+import asyncio
+import os
+import signal
+import threading
+import time
+from functools import lru_cache
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
 
-router = APIRouter(tags=["Health"])
+from src.api.responses import ORJSONResponse
+
+router = APIRouter(tags=["Health"], default_response_class=ORJSONResponse)
+
+# Probe bodies are constant, so they are serialized once. Each request still
+# gets its own Response because middleware may append to its headers.
+_LIVE_BODY = b'{"status":"alive"}'
+_READY_BODY = b'{"status":"ready"}'
+_NOT_READY_BODY = b'{"status":"shutting_down"}'
+
+# Probe results must never be served from an intermediary cache
+_PROBE_HEADERS = {"Cache-Control": "no-store"}
+
+# /health body, rebuilt at most once per second: (epoch second, body)
+_health_body: tuple[int, bytes] = (0, b"")
+
+# Cleared on SIGTERM, while the server still accepts connections, so load
+# balancers see the 503 and stop routing here before shutdown begins. The
+# server only accepts connections once startup has finished, so there is no
+# earlier not-ready window to cover.
+_ready = True
+
+
+def set_ready(ready: bool) -> None:
+    """Set whether the readiness probe reports this instance as ready."""
+    global _ready
+    _ready = ready
+
+
+@lru_cache
+def get_shutdown_drain_seconds() -> float:
+    """Get how long readiness fails after SIGTERM before shutdown starts."""
+    return float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "5"))
+
+
+def _begin_shutdown() -> None:
+    """Start the server's own graceful shutdown."""
+    # uvicorn shuts down gracefully on SIGINT; SIGTERM is taken over below
+    signal.raise_signal(signal.SIGINT)
+
+
+def install_drain_handler() -> None:
+    """
+    Fail readiness on SIGTERM and delay shutdown by the drain period.
+
+    The server stops accepting connections as soon as it starts shutting
+    down, so a probe can only see the 503 if readiness fails first. A
+    second SIGTERM shuts down without waiting. Does nothing if the drain
+    period is 0 or signals cannot be handled here (e.g. outside the main
+    thread).
+    """
+    delay = get_shutdown_drain_seconds()
+    if delay <= 0 or threading.current_thread() is not threading.main_thread():
+        return
+
+    loop = asyncio.get_running_loop()
+    timer: asyncio.TimerHandle | None = None
+
+    def on_sigterm() -> None:
+        nonlocal timer
+        if timer is None:
+            set_ready(False)
+            timer = loop.call_later(delay, _begin_shutdown)
+        else:
+            timer.cancel()
+            _begin_shutdown()
+
+    try:
+        loop.add_signal_handler(signal.SIGTERM, on_sigterm)
+    except (NotImplementedError, RuntimeError):
+        return
+
+
+def _probe_response(body: bytes, status_code: int = 200) -> Response:
+    """Wrap a pre-serialized probe body in an uncacheable response."""
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers=_PROBE_HEADERS,
+    )
 
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """
     Comprehensive health check for monitoring.
 
+    The timestamp has one-second resolution.
+
     Returns:
         Health status with timestamp.
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    global _health_body
+    now = int(time.time())
+    if _health_body[0] != now:
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now))
+        _health_body = (now, b'{"status":"healthy","timestamp":"%s"}' % timestamp.encode())
+    return _probe_response(_health_body[1])
 
 
 @router.get("/health/live")
-async def liveness() -> dict[str, str]:
+async def liveness() -> Response:
     """
     Simple liveness probe for k8s/docker.
 
     Returns:
         Alive status.
     """
-    return {"status": "alive"}
+    return _probe_response(_LIVE_BODY)
 
 
 @router.get("/health/ready")
-async def readiness() -> dict[str, str]:
+async def readiness() -> Response:
     """
     Readiness probe - can we serve traffic?
 
     Returns:
-        Ready status.
+        Ready status, or 503 once SIGTERM has been received.
     """
-    return {"status": "ready"}
+    if not _ready:
+        return _probe_response(_NOT_READY_BODY, status.HTTP_503_SERVICE_UNAVAILABLE)
+    return _probe_response(_READY_BODY)
+
+
+# Served by HealthCheckMiddleware ahead of the middleware stack
+PROBES = {
+    "/health": health_check,
+    "/health/live": liveness,
+    "/health/ready": readiness,
+}
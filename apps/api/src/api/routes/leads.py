@@ -1,74 +1,209 @@
 """Lead routes."""
 
-from typing import Annotated
+import csv
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from supabase import Client
 
+from src.api.dependencies import ActiveProfile
 from src.api.middleware.auth import CurrentUser
+from src.api.responses import (
+    ORJSONResponse,
+    etag_json_response,
+    json_response,
+    make_etag,
+    not_modified,
+)
+from src.core.db_pool import get_pool
 from src.core.supabase import get_supabase_client
-from src.repositories.client_profile import ClientProfileRepository
 from src.repositories.lead import LeadRepository
 from src.schemas.lead import (
+    CompanySize,
+    Lead,
     LeadAccuracy,
     LeadDetailResponse,
     LeadListResponse,
     LeadResponse,
+    LeadSortField,
     LeadSource,
     LeadStatus,
     LeadUpdate,
 )
+from src.utils.cursor import decode_cursor, encode_cursor
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/leads", tags=["Leads"])
+router = APIRouter(prefix="/leads", tags=["Leads"], default_response_class=ORJSONResponse)
+
+
+# Leads fetched per query while streaming an export
+EXPORT_PAGE_SIZE = 500
+
+EXPORT_HEADER = [
+    "Name",
+    "Email",
+    "Phone",
+    "Company",
+    "Company Size",
+    "Intent Score",
+    "Source",
+    "Status",
+    "Accuracy",
+    "Source URL",
+    "Created At",
+]
+
+
+class _Echo:
+    """File-like object whose write returns its input, so csv rows can be yielded."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+# Export cell for each enum member (and a missing accuracy). A dict lookup is
+# several times cheaper than Enum.value, which goes through a descriptor.
+_CSV_ENUM_VALUES: dict[Any, str] = {
+    None: "",
+    **{
+        member: member.value
+        for enum in (CompanySize, LeadSource, LeadStatus, LeadAccuracy)
+        for member in enum
+    },
+}
+
+
+def _lead_csv_row(lead: Lead) -> tuple[Any, ...]:
+    """Build the export CSV row for a lead."""
+    return (
+        lead.name,
+        lead.email or "",
+        lead.phone or "",
+        lead.company,
+        _CSV_ENUM_VALUES[lead.company_size],
+        lead.intent_score,
+        _CSV_ENUM_VALUES[lead.source],
+        _CSV_ENUM_VALUES[lead.status],
+        _CSV_ENUM_VALUES[lead.accuracy],
+        lead.source_url or "",
+        lead.created_at.isoformat(),
+    )
+
+
+def _content_disposition(filename: str) -> str:
+    """
+    Build an attachment Content-Disposition header for a file name.
+
+    Non-ASCII names are sent percent-encoded in ``filename*`` (RFC 6266)
+    with an ASCII-only ``filename`` fallback, since header values must be
+    latin-1.
+    """
+    fallback = filename.encode("ascii", "replace").decode().replace("?", "_")
+    if fallback == filename:
+        return f'attachment; filename="{filename}"'
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+
+async def _export_csv(
+    lead_repo: LeadRepository,
+    user_id: str,
+    client_profile_id: str,
+    status: LeadStatus | None,
+    source: LeadSource | None,
+    min_score: float | None,
+) -> AsyncIterator[str]:
+    """
+    Yield the export CSV one page of leads at a time.
+
+    The header goes out with the first page rather than on its own, so
+    every chunk is large enough for gzip to compress well.
+    """
+    writerow = csv.writer(_Echo()).writerow
+
+    count = 0
+    rows: list[str] = [writerow(EXPORT_HEADER)]
+    try:
+        async for lead in lead_repo.iter_by_profile(
+            client_profile_id,
+            status=status,
+            source=source,
+            min_score=min_score,
+            chunk_size=EXPORT_PAGE_SIZE,
+        ):
+            rows.append(writerow(_lead_csv_row(lead)))
+            count += 1
+            if count % EXPORT_PAGE_SIZE == 0:
+                yield "".join(rows)
+                rows.clear()
+
+        if rows:
+            yield "".join(rows)
+    except Exception as e:
+        # Headers are already sent, so the client sees a truncated download
+        logger.exception("export_leads_failed", user_id=user_id, rows=count, error=str(e))
+        raise
+
+    logger.info("leads_exported", user_id=user_id, count=count)
 
 
 def get_lead_repository(
     supabase: Annotated[Client, Depends(get_supabase_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
 ) -> LeadRepository:
     """Get lead repository instance."""
-    return LeadRepository(supabase)
-
-
-def get_profile_repository(
-    supabase: Annotated[Client, Depends(get_supabase_client)],
-) -> ClientProfileRepository:
-    """Get client profile repository instance."""
-    return ClientProfileRepository(supabase)
+    return LeadRepository(supabase, pool)
 
 
 @router.get("", response_model=LeadListResponse)
 async def list_leads(
+    request: Request,
     user: CurrentUser,
     lead_repo: Annotated[LeadRepository, Depends(get_lead_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
+    active_profile: ActiveProfile,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     status: LeadStatus | None = None,
     source: LeadSource | None = None,
     min_score: float | None = Query(default=None, ge=0, le=100),
-    sort_by: str = Query(default="intent_score", regex="^(intent_score|created_at|company|name)$"),
+    sort_by: LeadSortField = LeadSortField.INTENT_SCORE,
     sort_desc: bool = True,
-) -> LeadListResponse:
+    exact_count: bool = False,
+    cursor: str | None = None,
+) -> Response:
     """
     List leads for the user's active client profile.
 
     Supports filtering by status, source, and minimum score.
-    Results are paginated and sortable.
+    Results are paginated and sortable; large totals are estimated unless
+    exact_count is set. Full pages carry a next_cursor; passing it back as
+    cursor fetches the following page in constant time, in place of page.
+    Clients sending a current ETag get a 304 without the leads being queried.
     """
-    logger.info("list_leads_request", user_id=user.id)
+    logger.debug("list_leads_request", user_id=user.id)
 
-    try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile. Please select a profile first.",
-            )
+                detail="Invalid cursor",
+            ) from e
+
+    try:
+        # The version lookup is far cheaper than the page query
+        version = await lead_repo.get_list_version(active_profile.id)
+        etag = make_etag(f"{active_profile.id}|{version}|{request.url.query}".encode())
+        unchanged = not_modified(request, etag)
+        if unchanged is not None:
+            return unchanged
 
         leads, total = await lead_repo.list_by_profile(
             client_profile_id=active_profile.id,
@@ -79,34 +214,24 @@ async def list_leads(
             min_score=min_score,
             sort_by=sort_by,
             sort_desc=sort_desc,
+            exact_count=exact_count,
+            after=after,
         )
 
-        return LeadListResponse(
-            leads=[
-                LeadResponse(
-                    id=lead.id,
-                    client_profile_id=lead.client_profile_id,
-                    search_id=lead.search_id,
-                    name=lead.name,
-                    email=lead.email,
-                    phone=lead.phone,
-                    company=lead.company,
-                    company_size=lead.company_size,
-                    intent_score=lead.intent_score,
-                    score_breakdown=lead.score_breakdown,
-                    source=lead.source,
-                    source_url=lead.source_url,
-                    status=lead.status,
-                    accuracy=lead.accuracy,
-                    created_at=lead.created_at,
-                    updated_at=lead.updated_at,
-                )
-                for lead in leads
-            ],
+        next_cursor = None
+        if len(leads) == page_size:
+            last = leads[-1]
+            next_cursor = encode_cursor(getattr(last, sort_by.value), last.id)
+
+        body = LeadListResponse(
+            leads=[LeadResponse.model_validate(lead) for lead in leads],
             total=total,
             page=page,
             page_size=page_size,
-        )
+            next_cursor=next_cursor,
+        ).model_dump_json().encode()
+
+        return etag_json_response(request, body, etag)
 
     except HTTPException:
         raise
@@ -122,7 +247,7 @@ async def list_leads(
 async def export_leads(
     user: CurrentUser,
     lead_repo: Annotated[LeadRepository, Depends(get_lead_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
+    active_profile: ActiveProfile,
     status_filter: LeadStatus | None = Query(default=None, alias="status"),
     source: LeadSource | None = None,
     min_score: float | None = Query(default=None, ge=0, le=100),
@@ -130,77 +255,27 @@ async def export_leads(
     """
     Export leads to CSV format.
 
-    Returns all leads matching the filters as a downloadable CSV file.
+    Returns all leads matching the filters as a downloadable CSV file. Rows
+    are fetched and sent a page at a time, so memory stays bounded however
+    many leads match.
     """
-    logger.info("export_leads_request", user_id=user.id)
+    logger.debug("export_leads_request", user_id=user.id)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile. Please select a profile first.",
-            )
-
-        # Get all leads (no pagination for export)
-        leads, _ = await lead_repo.list_by_profile(
-            client_profile_id=active_profile.id,
-            page=1,
-            page_size=10000,  # Large limit for export
-            status=status_filter,
-            source=source,
-            min_score=min_score,
-        )
-
-        # Generate CSV
-        import csv
-        import io
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            "Name",
-            "Email",
-            "Phone",
-            "Company",
-            "Company Size",
-            "Intent Score",
-            "Source",
-            "Status",
-            "Accuracy",
-            "Source URL",
-            "Created At",
-        ])
-
-        # Data rows
-        for lead in leads:
-            writer.writerow([
-                lead.name,
-                lead.email or "",
-                lead.phone or "",
-                lead.company,
-                lead.company_size.value,
-                lead.intent_score,
-                lead.source.value,
-                lead.status.value,
-                lead.accuracy.value if lead.accuracy else "",
-                lead.source_url or "",
-                lead.created_at.isoformat(),
-            ])
-
-        output.seek(0)
-        content = output.getvalue()
-
-        logger.info("leads_exported", user_id=user.id, count=len(leads))
-
         return StreamingResponse(
-            iter([content]),
+            _export_csv(
+                lead_repo,
+                user_id=user.id,
+                client_profile_id=active_profile.id,
+                status=status_filter,
+                source=source,
+                min_score=min_score,
+            ),
             media_type="text/csv",
             headers={
-                "Content-Disposition": f'attachment; filename="leads_{active_profile.company_name.replace(" ", "_")}.csv"'
+                "Content-Disposition": _content_disposition(
+                    f"leads_{active_profile.filename_safe_company}.csv"
+                )
             },
         )
 
@@ -217,56 +292,34 @@ async def export_leads(
 @router.get("/{lead_id}", response_model=LeadDetailResponse)
 async def get_lead(
     lead_id: str,
+    request: Request,
     user: CurrentUser,
     lead_repo: Annotated[LeadRepository, Depends(get_lead_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
-) -> LeadDetailResponse:
+    active_profile: ActiveProfile,
+) -> Response:
     """
     Get detailed information about a specific lead.
 
     Includes status history and raw data.
     """
-    logger.info("get_lead_request", lead_id=lead_id, user_id=user.id)
+    logger.debug("get_lead_request", lead_id=lead_id, user_id=user.id)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile.",
-            )
-
-        lead = await lead_repo.get_by_id(lead_id, active_profile.id)
-        if not lead:
+        # The history is embedded in the lead query, so it is only read for
+        # leads in the active profile
+        found = await lead_repo.get_by_id_with_history(lead_id, active_profile.id)
+        if not found:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Lead not found",
             )
 
-        # Get status history
-        status_history = await lead_repo.get_status_history(lead_id)
-
-        return LeadDetailResponse(
-            id=lead.id,
-            client_profile_id=lead.client_profile_id,
-            search_id=lead.search_id,
-            name=lead.name,
-            email=lead.email,
-            phone=lead.phone,
-            company=lead.company,
-            company_size=lead.company_size,
-            intent_score=lead.intent_score,
-            score_breakdown=lead.score_breakdown,
-            source=lead.source,
-            source_url=lead.source_url,
-            status=lead.status,
-            accuracy=lead.accuracy,
-            created_at=lead.created_at,
-            updated_at=lead.updated_at,
-            raw_data=lead.raw_data,
-            status_history=status_history,
-        )
+        lead, status_history = found
+        detail = LeadDetailResponse.model_validate(lead)
+        detail.status_history = status_history
+        body = detail.model_dump_json().encode()
+
+        return etag_json_response(request, body)
 
     except HTTPException:
         raise
@@ -284,24 +337,16 @@ async def update_lead(
     request: LeadUpdate,
     user: CurrentUser,
     lead_repo: Annotated[LeadRepository, Depends(get_lead_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
-) -> LeadResponse:
+    active_profile: ActiveProfile,
+) -> Response:
     """
     Update a lead's status, accuracy, or contact information.
 
     Status changes are recorded in history.
     """
-    logger.info("update_lead_request", lead_id=lead_id, user_id=user.id)
+    logger.debug("update_lead_request", lead_id=lead_id, user_id=user.id)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile.",
-            )
-
         lead = await lead_repo.update(lead_id, active_profile.id, request)
         if not lead:
             raise HTTPException(
@@ -309,24 +354,7 @@ async def update_lead(
                 detail="Lead not found",
             )
 
-        return LeadResponse(
-            id=lead.id,
-            client_profile_id=lead.client_profile_id,
-            search_id=lead.search_id,
-            name=lead.name,
-            email=lead.email,
-            phone=lead.phone,
-            company=lead.company,
-            company_size=lead.company_size,
-            intent_score=lead.intent_score,
-            score_breakdown=lead.score_breakdown,
-            source=lead.source,
-            source_url=lead.source_url,
-            status=lead.status,
-            accuracy=lead.accuracy,
-            created_at=lead.created_at,
-            updated_at=lead.updated_at,
-        )
+        return json_response(LeadResponse.model_validate(lead).model_dump_json().encode())
 
     except HTTPException:
         raise
@@ -343,24 +371,16 @@ async def delete_lead(
     lead_id: str,
     user: CurrentUser,
     lead_repo: Annotated[LeadRepository, Depends(get_lead_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
+    active_profile: ActiveProfile,
 ) -> None:
     """
     Delete a lead.
 
     This also deletes the lead's status history.
     """
-    logger.info("delete_lead_request", lead_id=lead_id, user_id=user.id)
+    logger.debug("delete_lead_request", lead_id=lead_id, user_id=user.id)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile.",
-            )
-
         deleted = await lead_repo.delete(lead_id, active_profile.id)
         if not deleted:
             raise HTTPException(
@@ -2,12 +2,20 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import asyncpg
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from supabase import Client
 
+from src.api.dependencies import ActiveProfile
 from src.api.middleware.auth import CurrentUser
+from src.api.responses import (
+    IMMUTABLE_CACHE_CONTROL,
+    ORJSONResponse,
+    etag_json_response,
+    json_response,
+)
+from src.core.db_pool import get_pool
 from src.core.supabase import get_supabase_client
-from src.repositories.client_profile import ClientProfileRepository
 from src.repositories.search import SearchRepository
 from src.schemas.search import (
     Search,
@@ -17,25 +25,23 @@ from src.schemas.search import (
     SearchStatus,
     SearchType,
 )
+from src.utils.cursor import decode_cursor, encode_cursor
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
-router = APIRouter(prefix="/searches", tags=["Searches"])
+router = APIRouter(prefix="/searches", tags=["Searches"], default_response_class=ORJSONResponse)
+
+# Searches in these states never change again
+TERMINAL_STATUSES = frozenset({SearchStatus.COMPLETED, SearchStatus.FAILED, SearchStatus.CANCELLED})
 
 
 def get_search_repository(
     supabase: Annotated[Client, Depends(get_supabase_client)],
+    pool: Annotated[asyncpg.Pool | None, Depends(get_pool)],
 ) -> SearchRepository:
     """Get search repository instance."""
-    return SearchRepository(supabase)
-
-
-def get_profile_repository(
-    supabase: Annotated[Client, Depends(get_supabase_client)],
-) -> ClientProfileRepository:
-    """Get client profile repository instance."""
-    return ClientProfileRepository(supabase)
+    return SearchRepository(supabase, pool)
 
 
 def _to_response(search: Search) -> SearchResponse:
@@ -59,38 +65,52 @@ def _to_response(search: Search) -> SearchResponse:
 
 @router.get("", response_model=SearchListResponse)
 async def list_searches(
+    request: Request,
     user: CurrentUser,
     search_repo: Annotated[SearchRepository, Depends(get_search_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
+    active_profile: ActiveProfile,
     status_filter: SearchStatus | None = Query(default=None, alias="status"),
     limit: int = Query(default=20, ge=1, le=100),
-) -> SearchListResponse:
+    cursor: str | None = None,
+) -> Response:
     """
     List searches for the user's active client profile.
 
-    Returns recent searches ordered by start time descending.
+    Returns recent searches ordered by start time descending. Full pages
+    carry a next_cursor; passing it back as cursor lists older searches.
     """
-    logger.info("list_searches_request", user_id=user.id)
+    logger.debug("list_searches_request", user_id=user.id)
 
-    try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile. Please select a profile first.",
-            )
+                detail="Invalid cursor",
+            ) from e
 
+    try:
         searches = await search_repo.list_by_profile(
             client_profile_id=active_profile.id,
             status=status_filter,
             limit=limit,
+            after=after,
         )
 
-        return SearchListResponse(
+        next_cursor = None
+        if len(searches) == limit:
+            last = searches[-1]
+            next_cursor = encode_cursor(last.started_at, last.id)
+
+        body = SearchListResponse(
             searches=[_to_response(s) for s in searches],
             total=len(searches),
-        )
+            next_cursor=next_cursor,
+        ).model_dump_json().encode()
+
+        return etag_json_response(request, body)
 
     except HTTPException:
         raise
@@ -106,27 +126,19 @@ async def list_searches(
 async def create_search(
     user: CurrentUser,
     search_repo: Annotated[SearchRepository, Depends(get_search_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
+    active_profile: ActiveProfile,
     search_type: SearchType = SearchType.AUTONOMOUS,
     quality_setting: float = Query(default=0.7, ge=0, le=1),
-) -> SearchResponse:
+) -> Response:
     """
     Create a new search for the active client profile.
 
     Returns 202 Accepted as search execution happens asynchronously.
     The search orchestration service will pick up the search and execute it.
     """
-    logger.info("create_search_request", user_id=user.id, search_type=search_type.value)
+    logger.debug("create_search_request", user_id=user.id, search_type=search_type.value)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile. Please select a profile first.",
-            )
-
         # Check for existing in-progress search
         existing = await search_repo.list_by_profile(
             client_profile_id=active_profile.id,
@@ -148,7 +160,10 @@ async def create_search(
         )
 
         logger.info("search_created", search_id=search.id, user_id=user.id)
-        return _to_response(search)
+        return json_response(
+            _to_response(search).model_dump_json().encode(),
+            status_code=status.HTTP_202_ACCEPTED,
+        )
 
     except HTTPException:
         raise
@@ -163,26 +178,20 @@ async def create_search(
 @router.get("/{search_id}", response_model=SearchResponse)
 async def get_search(
     search_id: str,
+    request: Request,
     user: CurrentUser,
     search_repo: Annotated[SearchRepository, Depends(get_search_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
-) -> SearchResponse:
+    active_profile: ActiveProfile,
+) -> Response:
     """
     Get search status and results.
 
-    Returns detailed information about a specific search.
+    Returns detailed information about a specific search. Finished searches
+    can be cached by the client; others are revalidated on every poll.
     """
-    logger.info("get_search_request", search_id=search_id, user_id=user.id)
+    logger.debug("get_search_request", search_id=search_id, user_id=user.id)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile.",
-            )
-
         search = await search_repo.get_by_id(search_id, active_profile.id)
         if not search:
             raise HTTPException(
@@ -190,7 +199,10 @@ async def get_search(
                 detail="Search not found",
             )
 
-        return _to_response(search)
+        body = _to_response(search).model_dump_json().encode()
+        if search.status in TERMINAL_STATUSES:
+            return etag_json_response(request, body, cache_control=IMMUTABLE_CACHE_CONTROL)
+        return etag_json_response(request, body)
 
     except HTTPException:
         raise
@@ -207,24 +219,16 @@ async def cancel_search(
     search_id: str,
     user: CurrentUser,
     search_repo: Annotated[SearchRepository, Depends(get_search_repository)],
-    profile_repo: Annotated[ClientProfileRepository, Depends(get_profile_repository)],
-) -> SearchResponse:
+    active_profile: ActiveProfile,
+) -> Response:
     """
     Cancel an in-progress search.
 
     Only searches with status PENDING or IN_PROGRESS can be cancelled.
     """
-    logger.info("cancel_search_request", search_id=search_id, user_id=user.id)
+    logger.debug("cancel_search_request", search_id=search_id, user_id=user.id)
 
     try:
-        # Get active profile
-        active_profile = await profile_repo.get_active(user.id)
-        if not active_profile:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No active client profile.",
-            )
-
         # Get search and verify ownership
         search = await search_repo.get_by_id(search_id, active_profile.id)
         if not search:
@@ -248,7 +252,7 @@ async def cancel_search(
             )
 
         logger.info("search_cancelled", search_id=search_id, user_id=user.id)
-        return _to_response(cancelled)
+        return json_response(_to_response(cancelled).model_dump_json().encode())
 
     except HTTPException:
         raise
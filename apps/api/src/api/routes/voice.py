@@ -1,7 +1,8 @@
 """Voice API routes for STT and TTS."""
 
 import logging
-from typing import Annotated
+from pathlib import PurePath
+from typing import Annotated, Final
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import StreamingResponse
@@ -23,6 +24,24 @@ router = APIRouter(prefix="/voice", tags=["voice"])
 # Maximum audio file size (10MB)
 MAX_AUDIO_SIZE = 10 * 1024 * 1024
 
+# Bytes read from the upload at a time while enforcing MAX_AUDIO_SIZE
+AUDIO_READ_CHUNK_SIZE = 64 * 1024
+
+# Audio format for each accepted MIME type
+_CONTENT_TYPE_FORMATS: Final[dict[str, str]] = {
+    "audio/webm": "webm",
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav",
+    "audio/mp3": "mp3",
+    "audio/mpeg": "mp3",
+    "audio/ogg": "ogg",
+    "audio/flac": "flac",
+}
+
+# File extensions accepted when the content type is missing or generic
+_SUPPORTED_EXTENSIONS: Final = frozenset({"webm", "wav", "mp3", "ogg", "flac"})
+
 
 def get_audio_format_from_content_type(content_type: str | None, filename: str | None) -> str:
     """Determine audio format from content type or filename.
@@ -38,25 +57,15 @@ def get_audio_format_from_content_type(content_type: str | None, filename: str |
         HTTPException: If format cannot be determined or is unsupported
     """
     # Try content type first
-    content_type_map = {
-        "audio/webm": "webm",
-        "audio/wav": "wav",
-        "audio/wave": "wav",
-        "audio/x-wav": "wav",
-        "audio/mp3": "mp3",
-        "audio/mpeg": "mp3",
-        "audio/ogg": "ogg",
-        "audio/flac": "flac",
-    }
-
-    if content_type and content_type.lower() in content_type_map:
-        return content_type_map[content_type.lower()]
+    if content_type:
+        audio_format = _CONTENT_TYPE_FORMATS.get(content_type.lower())
+        if audio_format:
+            return audio_format
 
     # Try filename extension
     if filename:
-        ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
-        supported_formats = ["webm", "wav", "mp3", "ogg", "flac"]
-        if ext in supported_formats:
+        ext = PurePath(filename).suffix.lower().removeprefix(".")
+        if ext in _SUPPORTED_EXTENSIONS:
             return ext
 
     raise HTTPException(
@@ -91,13 +100,21 @@ async def transcribe_audio(
     user_id = current_user.get("id", "unknown")
     rate_limit_voice(user_id)
 
-    # Check file size
-    audio_data = await audio.read()
-    if len(audio_data) > MAX_AUDIO_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"Audio file too large. Maximum size: {MAX_AUDIO_SIZE // (1024 * 1024)}MB",
-        )
+    # Check file size, reading in chunks so an oversized upload is rejected
+    # without being loaded into memory
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Audio file too large. Maximum size: {MAX_AUDIO_SIZE // (1024 * 1024)}MB",
+    )
+    if audio.size is not None and audio.size > MAX_AUDIO_SIZE:
+        raise too_large
+
+    buffer = bytearray()
+    while chunk := await audio.read(AUDIO_READ_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > MAX_AUDIO_SIZE:
+            raise too_large
+    audio_data = bytes(buffer)
 
     if not audio_data:
         raise HTTPException(
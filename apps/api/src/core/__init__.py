@@ -1,6 +1,21 @@
 """Core modules for Vantage API."""
 
+from src.core.cache import close_cache, get_cache
+from src.core.db_pool import close_pool, get_pool
 from src.core.sentry import init_sentry
-from src.core.supabase import get_supabase_admin_client, get_supabase_client
+from src.core.supabase import (
+    get_supabase_admin_client,
+    get_supabase_auth_client,
+    get_supabase_client,
+)
 
-__all__ = ["init_sentry", "get_supabase_client", "get_supabase_admin_client"]
+__all__ = [
+    "init_sentry",
+    "get_supabase_client",
+    "get_supabase_admin_client",
+    "get_supabase_auth_client",
+    "get_pool",
+    "close_pool",
+    "get_cache",
+    "close_cache",
+]
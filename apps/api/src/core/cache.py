@@ -0,0 +1,191 @@
+"""
+Redis-backed response cache.
+
+Provides a shared async Redis client and cache-aside helpers. Cache errors
+are logged and treated as misses so Redis being unavailable never fails a
+request.
+"""
+
+import os
+from functools import lru_cache
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default time-to-live for cached entries
+CACHE_TTL_SECONDS = 300
+
+# A stalled or unreachable Redis costs a request at most this long per
+# command before it is treated as a miss, instead of the OS TCP timeout
+REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS = 0.25
+REDIS_SOCKET_TIMEOUT_SECONDS = 0.25
+
+_redis: Redis | None = None
+
+
+@lru_cache
+def get_redis_url() -> str:
+    """Get Redis URL from environment."""
+    url = os.getenv("REDIS_URL")
+    if not url:
+        raise ValueError("REDIS_URL environment variable is required")
+    return url
+
+
+async def get_cache() -> Redis:
+    """
+    Get the shared Redis client, creating it on first use.
+
+    The client is backed by a connection pool shared across requests.
+    Commands time out quickly and are not retried, so a slow Redis only
+    turns into cache misses.
+
+    Returns:
+        Redis client instance.
+    """
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(
+            get_redis_url(),
+            socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            retry_on_timeout=False,
+        )
+    return _redis
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client if it was created."""
+    global _redis
+    if _redis is None:
+        return
+
+    await _redis.aclose()
+    _redis = None
+
+
+async def cache_get(redis: Redis, key: str) -> bytes | None:
+    """
+    Get a cached value.
+
+    Args:
+        redis: Redis client.
+        key: Cache key.
+
+    Returns:
+        Cached bytes, or None on a miss or cache error.
+    """
+    try:
+        return await redis.get(key)
+    except RedisError as e:
+        logger.warning("cache_get_failed", key=key, error=str(e))
+        return None
+
+
+async def cache_set(redis: Redis, key: str, value: bytes, ttl: int = CACHE_TTL_SECONDS) -> None:
+    """
+    Store a value in the cache.
+
+    Args:
+        redis: Redis client.
+        key: Cache key.
+        value: Serialized value.
+        ttl: Time-to-live in seconds.
+    """
+    try:
+        await redis.set(key, value, ex=ttl)
+    except RedisError as e:
+        logger.warning("cache_set_failed", key=key, error=str(e))
+
+
+async def cache_hget(redis: Redis, key: str, field: str) -> bytes | None:
+    """
+    Get a field from a cached hash.
+
+    Args:
+        redis: Redis client.
+        key: Hash key.
+        field: Field within the hash.
+
+    Returns:
+        Cached bytes, or None on a miss or cache error.
+    """
+    try:
+        return await redis.hget(key, field)
+    except RedisError as e:
+        logger.warning("cache_get_failed", key=key, field=field, error=str(e))
+        return None
+
+
+async def cache_hset(
+    redis: Redis, key: str, field: str, value: bytes, ttl: int = CACHE_TTL_SECONDS
+) -> None:
+    """
+    Store a field in a cached hash and refresh the hash's TTL.
+
+    Args:
+        redis: Redis client.
+        key: Hash key.
+        field: Field within the hash.
+        value: Serialized value.
+        ttl: Time-to-live in seconds for the whole hash.
+    """
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, field, value)
+            pipe.expire(key, ttl)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning("cache_set_failed", key=key, field=field, error=str(e))
+
+
+async def cache_delete(redis: Redis, *keys: str) -> None:
+    """
+    Invalidate cached entries.
+
+    Args:
+        redis: Redis client.
+        *keys: Cache keys to delete.
+    """
+    try:
+        await redis.delete(*keys)
+    except RedisError as e:
+        logger.warning("cache_delete_failed", keys=keys, error=str(e))
+
+
+# Client profile keys are per user so invalidation never needs a key scan.
+# Profiles fetched by ID live in one hash per user, so activating a profile
+# (which flips is_active on the others) invalidates them all in one delete.
+def client_profile_list_key(user_id: str) -> str:
+    """Get the cache key for a user's client profile list."""
+    return f"v1:cp:list:{user_id}"
+
+
+def client_profile_active_key(user_id: str) -> str:
+    """Get the cache key for a user's active client profile."""
+    return f"v1:cp:active:{user_id}"
+
+
+def client_profile_by_id_key(user_id: str) -> str:
+    """Get the cache key for the hash of a user's client profiles by ID."""
+    return f"v1:cp:id:{user_id}"
+
+
+async def invalidate_client_profile_cache(redis: Redis, user_id: str) -> None:
+    """
+    Drop every cached client profile view for a user.
+
+    Args:
+        redis: Redis client.
+        user_id: User whose profiles changed.
+    """
+    await cache_delete(
+        redis,
+        client_profile_list_key(user_id),
+        client_profile_active_key(user_id),
+        client_profile_by_id_key(user_id),
+    )
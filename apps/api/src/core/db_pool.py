@@ -0,0 +1,105 @@
+"""
+Direct Postgres connection pool for hot query paths.
+
+PostgREST round-trips are fine for most operations, but frequently hit
+reads and multi-statement writes can go straight to Postgres through a
+shared asyncpg pool. The pool is opt-in: it is only created when
+SUPABASE_DB_URL is set, and that URL must point at the Postgres database
+behind the Supabase project (not the local DATABASE_URL database), since
+the rest of each repository still goes through PostgREST. Without it,
+repositories get no pool and use their PostgREST paths throughout.
+"""
+
+import asyncio
+import json
+import os
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+POOL_MIN_SIZE = 10
+POOL_MAX_SIZE = 50
+POOL_MAX_INACTIVE_CONNECTION_LIFETIME = 300
+
+_pool: asyncpg.Pool | None = None
+_pool_lock = asyncio.Lock()
+
+
+@lru_cache
+def get_database_url() -> str | None:
+    """Get the Supabase Postgres connection string, if direct access is enabled."""
+    return os.getenv("SUPABASE_DB_URL") or None
+
+
+@lru_cache
+def uses_pgbouncer() -> bool:
+    """Check whether connections go through PgBouncer in transaction mode."""
+    return os.getenv("SUPABASE_DB_PGBOUNCER", "").lower() == "true"
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects, matching PostgREST."""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
+async def get_pool() -> asyncpg.Pool | None:
+    """
+    Get the shared connection pool, creating it on first use.
+
+    Returns:
+        asyncpg connection pool, or None if SUPABASE_DB_URL is not set.
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    url = get_database_url()
+    if url is None:
+        return None
+
+    async with _pool_lock:
+        if _pool is None:
+            _pool = await asyncpg.create_pool(
+                url,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+                # PgBouncer in transaction mode can't keep prepared statements
+                statement_cache_size=0 if uses_pgbouncer() else 100,
+                init=_init_connection,
+            )
+            logger.info("db_pool_created", min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE)
+
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the shared connection pool if it was created."""
+    global _pool
+    if _pool is None:
+        return
+
+    await _pool.close()
+    _pool = None
+    logger.info("db_pool_closed")
+
+
+def record_to_dict(record: asyncpg.Record) -> dict[str, Any]:
+    """
+    Convert an asyncpg record to a PostgREST-style row dict.
+
+    UUID columns are returned as strings, as PostgREST does.
+    """
+    return {key: str(value) if isinstance(value, UUID) else value for key, value in record.items()}
@@ -7,12 +7,9 @@ Initializes Sentry with integrations for FastAPI, Celery, SQLAlchemy, and httpx.
 import os
 from typing import Any
 
-import sentry_sdk
-from sentry_sdk.integrations.celery import CeleryIntegration
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.httpx import HttpxIntegration
-from sentry_sdk.integrations.logging import LoggingIntegration
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+# Request headers and body fields whose values never leave the process
+_SENSITIVE_HEADERS = frozenset({"authorization", "cookie", "x-api-key", "x-auth-token"})
+_SENSITIVE_FIELDS = frozenset({"password", "token", "secret", "api_key", "credit_card"})
 
 
 def _scrub_sensitive_data(event: dict[str, Any], hint: dict[str, Any]) -> dict[str, Any] | None:
@@ -26,22 +23,21 @@ def _scrub_sensitive_data(event: dict[str, Any], hint: dict[str, Any]) -> dict[s
     Returns:
         The scrubbed event or None to drop the event.
     """
+    request = event.get("request")
+    if not request:
+        return event
+
     # Filter authorization headers
-    if "request" in event and "headers" in event["request"]:
-        headers = event["request"]["headers"]
-        sensitive_keys = ["authorization", "cookie", "x-api-key", "x-auth-token"]
-        for key in sensitive_keys:
-            if key in headers:
-                headers[key] = "[FILTERED]"
+    headers = request.get("headers")
+    if headers:
+        for key in _SENSITIVE_HEADERS.intersection(headers):
+            headers[key] = "[FILTERED]"
 
     # Filter sensitive data from request body
-    if "request" in event and "data" in event["request"]:
-        data = event["request"]["data"]
-        if isinstance(data, dict):
-            sensitive_fields = ["password", "token", "secret", "api_key", "credit_card"]
-            for field in sensitive_fields:
-                if field in data:
-                    data[field] = "[FILTERED]"
+    data = request.get("data")
+    if isinstance(data, dict):
+        for field in _SENSITIVE_FIELDS.intersection(data):
+            data[field] = "[FILTERED]"
 
     return event
 
@@ -59,6 +55,15 @@ def init_sentry() -> None:
     if not dsn:
         return  # Skip initialization if no DSN configured
 
+    # Imported here: the SDK and its integrations (which pull in SQLAlchemy
+    # and Celery) add noticeable startup time and are unused without a DSN
+    import sentry_sdk
+    from sentry_sdk.integrations.celery import CeleryIntegration
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.httpx import HttpxIntegration
+    from sentry_sdk.integrations.logging import LoggingIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
     environment = os.getenv("ENVIRONMENT", "development")
     traces_sample_rate = 0.1 if environment == "production" else 1.0
 
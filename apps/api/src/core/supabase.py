@@ -4,16 +4,34 @@ Supabase client configuration for FastAPI.
 Provides dependency injection for Supabase client instances.
 """
 
+import asyncio
+import contextvars
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Generator
-
-from supabase import Client, create_client
+from typing import TYPE_CHECKING, Any, Generator
 
 from src.utils.logging import get_logger
 
+# The supabase SDK (with httpx, postgrest, gotrue, realtime and storage)
+# takes a few hundred ms to import, so it is loaded when the first client is
+# created rather than by everything that imports the repositories
+if TYPE_CHECKING:
+    import httpx
+    from postgrest import APIResponse
+    from supabase import Client
+
 logger = get_logger(__name__)
 
+# Connection pool shared by the cached Supabase clients
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+# Idle connections are kept open for reuse this long, well past the gap
+# between requests under steady traffic
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+# Startup does not wait longer than this for the warm-up request
+WARMUP_TIMEOUT_SECONDS = 5.0
+
 
 @lru_cache
 def get_supabase_url() -> str:
@@ -42,19 +60,111 @@ def get_supabase_service_key() -> str:
     return key
 
 
-def get_supabase_client() -> Generator[Client, None, None]:
+@lru_cache
+def get_supabase_jwt_secret() -> str:
+    """Get Supabase JWT secret used to verify access tokens."""
+    secret = os.getenv("SUPABASE_JWT_SECRET")
+    if not secret:
+        raise ValueError("SUPABASE_JWT_SECRET environment variable is required")
+    return secret
+
+
+def reset_settings_cache() -> None:
+    """
+    Forget the cached Supabase settings so the environment is read again.
+
+    Meant for tests that change the environment between cases.
+    """
+    get_supabase_url.cache_clear()
+    get_supabase_anon_key.cache_clear()
+    get_supabase_service_key.cache_clear()
+    get_supabase_jwt_secret.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _query_executor() -> ThreadPoolExecutor:
+    """
+    Create the worker threads that run PostgREST requests.
+
+    Sized to the HTTP connection pool: the event loop's default executor has
+    min(32, CPUs + 4) threads, which on small instances would cap concurrent
+    queries well below the number of open connections.
+    """
+    return ThreadPoolExecutor(max_workers=HTTP_MAX_CONNECTIONS, thread_name_prefix="postgrest")
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> "httpx.Client":
+    """
+    Create the pooled HTTP client used by the shared Supabase clients.
+
+    PostgREST, auth, storage and functions all send requests through it, so
+    the limits below bound every connection the API opens to Supabase.
+    """
+    import httpx
+    from postgrest.constants import DEFAULT_POSTGREST_CLIENT_TIMEOUT
+
+    return httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        timeout=DEFAULT_POSTGREST_CLIENT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+def _create_client(key: str, pooled: bool = True) -> "Client":
+    """
+    Create a Supabase client for the project.
+
+    Args:
+        key: API key the client authenticates with.
+        pooled: Send requests through the shared HTTP connection pool.
+
+    Returns:
+        New Supabase client.
     """
-    Get a Supabase client for authenticated requests.
+    from supabase import ClientOptions, create_client
+
+    options = ClientOptions(httpx_client=_http_client()) if pooled else None
+    return create_client(get_supabase_url(), key, options=options)
+
+
+@lru_cache(maxsize=1)
+def _anon_client() -> "Client":
+    """Create the shared anon-key Supabase client."""
+    return _create_client(get_supabase_anon_key())
 
-    Uses the anon key - suitable for user-authenticated operations.
+
+async def get_supabase_client() -> "Client":
+    """
+    Get the shared Supabase client for data access.
+
+    Uses the anon key. One client (and its HTTP connection pool) is reused
+    across requests; the dependency is async so FastAPI resolves it inline
+    instead of dispatching to the threadpool.
+
+    Returns:
+        Shared Supabase client instance.
+    """
+    return _anon_client()
+
+
+def get_supabase_auth_client() -> Generator["Client", None, None]:
+    """
+    Get a dedicated Supabase client for auth flows.
+
+    Signing in stores the session on the client and switches its auth
+    headers to that user, so sign-in/sign-up/refresh must not run on the
+    shared client.
 
     Yields:
         Supabase client instance.
     """
-    client = create_client(
-        get_supabase_url(),
-        get_supabase_anon_key(),
-    )
+    client = _create_client(get_supabase_anon_key(), pooled=False)
     try:
         yield client
     finally:
@@ -62,21 +172,73 @@ def get_supabase_client() -> Generator[Client, None, None]:
         pass
 
 
-def get_supabase_admin_client() -> Generator[Client, None, None]:
+@lru_cache(maxsize=1)
+def _admin_client() -> "Client":
+    """Create the shared service-role Supabase client."""
+    return _create_client(get_supabase_service_key())
+
+
+async def get_supabase_admin_client() -> "Client":
     """
-    Get a Supabase admin client for privileged operations.
+    Get the shared Supabase admin client for privileged operations.
 
     Uses the service role key - bypasses RLS policies.
     Use with caution, only for server-side operations.
 
-    Yields:
-        Supabase admin client instance.
+    Returns:
+        Shared Supabase admin client instance.
+    """
+    return _admin_client()
+
+
+async def warm_supabase() -> None:
+    """
+    Open the shared client's first connection before traffic arrives.
+
+    Importing the SDK and the TCP/TLS/HTTP2 handshake otherwise land on
+    the first request each worker serves. Failures are logged, not raised,
+    so an unreachable Supabase does not block startup.
     """
-    client = create_client(
-        get_supabase_url(),
-        get_supabase_service_key(),
-    )
     try:
-        yield client
-    finally:
-        pass
+        client = await asyncio.to_thread(_anon_client)
+        await asyncio.wait_for(
+            execute_query(client.table("client_profiles").select("id").limit(1)),
+            timeout=WARMUP_TIMEOUT_SECONDS,
+        )
+    except Exception as e:
+        logger.warning("supabase_warmup_failed", error=str(e))
+        return
+    logger.info("supabase_warmed_up")
+
+
+def close_supabase() -> None:
+    """Drop the shared Supabase clients and close their connection pool."""
+    if _http_client.cache_info().currsize:
+        _http_client().close()
+    if _query_executor.cache_info().currsize:
+        _query_executor().shutdown(wait=False)
+    _anon_client.cache_clear()
+    _admin_client.cache_clear()
+    _http_client.cache_clear()
+    _query_executor.cache_clear()
+    logger.info("supabase_client_closed")
+
+
+async def execute_query(query: Any) -> "APIResponse":
+    """
+    Execute a PostgREST request builder without blocking the event loop.
+
+    The sync client does blocking HTTP I/O, so the request runs in a
+    worker thread while other requests keep being served. There is one
+    worker per pooled connection, so every connection can be in use at once.
+
+    Args:
+        query: Request builder, e.g. ``supabase.table("x").select("*")``.
+
+    Returns:
+        PostgREST response.
+    """
+    loop = asyncio.get_running_loop()
+    # Like asyncio.to_thread, run with the caller's context variables
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_query_executor(), context.run, query.execute)
@@ -5,15 +5,21 @@ This module initializes the FastAPI application with all middleware,
 routes, and integrations configured.
 """
 
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from src.api.middleware.logging import LoggingMiddleware
+from src.api.middleware.health import HealthCheckMiddleware
+from src.api.middleware.logging import LoggingMiddleware, start_log_writer, stop_log_writer
 from src.api.routes import analytics, auth, client_profiles, conversations, health, leads, searches, voice
+from src.core.cache import close_cache
+from src.core.db_pool import close_pool
 from src.core.sentry import init_sentry
+from src.core.supabase import close_supabase, warm_supabase
 from src.utils.logging import get_logger, setup_logging
 
 # Initialize logging first
@@ -28,7 +34,15 @@ init_sentry()
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager for startup/shutdown events."""
     logger.info("application_starting", version="0.1.0")
+    start_log_writer()
+    await warm_supabase()
+    health.set_ready(True)
+    health.install_drain_handler()
     yield
+    await close_pool()
+    await close_cache()
+    close_supabase()
+    await stop_log_writer()
     logger.info("application_stopping")
 
 
@@ -40,6 +54,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Compress larger responses (e.g. list endpoints); small bodies like health
+# checks stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -52,6 +70,9 @@ app.add_middleware(
 # Add logging middleware
 app.add_middleware(LoggingMiddleware)
 
+# Answer health probes before any other middleware runs
+app.add_middleware(HealthCheckMiddleware, probes=health.PROBES)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(auth.router, prefix="/v1")
@@ -73,14 +94,18 @@ async def root() -> dict[str, str]:
     }
 
 
-@app.get("/debug-sentry")
-async def debug_sentry() -> dict[str, str]:
-    """
-    Test endpoint to verify Sentry integration.
+# Only exposed when explicitly enabled: the endpoint always errors, so left
+# open it lets anyone generate Sentry events
+if os.getenv("ENABLE_DEBUG_SENTRY", "").lower() == "true":
+
+    @app.get("/debug-sentry")
+    async def debug_sentry() -> dict[str, str]:
+        """
+        Test endpoint to verify Sentry integration.
 
-    Raises:
-        ZeroDivisionError: Always raised to test Sentry error capture.
-    """
-    logger.info("debug_sentry_triggered")
-    division_by_zero = 1 / 0  # noqa: F841
-    return {"message": "This should not be reached"}
+        Raises:
+            ZeroDivisionError: Always raised to test Sentry error capture.
+        """
+        logger.info("debug_sentry_triggered")
+        division_by_zero = 1 / 0  # noqa: F841
+        return {"message": "This should not be reached"}
@@ -1,6 +1,24 @@
 """Repository modules for Vantage API."""
 
-from src.repositories.client_profile import ClientProfileRepository
-from src.repositories.conversation import ConversationRepository
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.repositories.client_profile import ClientProfileRepository
+    from src.repositories.conversation import ConversationRepository
 
 __all__ = ["ClientProfileRepository", "ConversationRepository"]
+
+# Repositories are imported on first access (PEP 562), so importing one
+# repository module does not load the others
+_LAZY_EXPORTS = {
+    "ClientProfileRepository": "src.repositories.client_profile",
+    "ConversationRepository": "src.repositories.conversation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
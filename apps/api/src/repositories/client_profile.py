@@ -1,32 +1,79 @@
 """Client profile repository for database operations."""
 
-from datetime import datetime
-from uuid import uuid4
+from typing import TYPE_CHECKING
 
-from supabase import Client
+import asyncpg
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
 
+from src.core.cache import cache_delete, cache_get, cache_set, client_profile_active_key
+from src.core.db_pool import record_to_dict
+from src.core.supabase import execute_query
 from src.schemas.client_profile import (
     ClientProfile,
     ClientProfileCreate,
     ClientProfileUpdate,
-    ScoringWeights,
 )
+from src.utils.clock import utc_now_iso
+from src.utils.ids import new_id
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = get_logger(__name__)
 
+async def forget_active(redis: Redis | None, user_id: str) -> None:
+    """
+    Drop a user's cached active profile.
+
+    Args:
+        redis: Redis client, or None when the repository runs uncached.
+        user_id: User whose active profile changed.
+    """
+    if redis is not None:
+        await cache_delete(redis, client_profile_active_key(user_id))
+
+
+# Rows are validated by pydantic-core, which parses timestamps and nested
+# scoring weights itself
+_PROFILE_LIST_ADAPTER = TypeAdapter(list[ClientProfile])
+
+
+def _normalize_row(row: dict) -> dict:
+    """Fill columns that older rows store differently or leave null."""
+    if row.get("ideal_customer_profile") and row.get("services") is not None:
+        return row
+    return {
+        **row,
+        "ideal_customer_profile": row.get("ideal_customer_profile")
+        or row.get("ideal_client_description", ""),
+        "services": row.get("services") or [],
+    }
+
 
 class ClientProfileRepository:
     """Repository for client profile CRUD operations."""
 
-    def __init__(self, supabase: Client) -> None:
+    def __init__(
+        self,
+        supabase: "Client",
+        pool: asyncpg.Pool | None = None,
+        redis: Redis | None = None,
+    ) -> None:
         """
         Initialize repository.
 
         Args:
             supabase: Supabase client instance.
+            pool: Optional Postgres pool; when set, hot reads and multi-step
+                writes query Postgres directly instead of going through PostgREST.
+            redis: Optional Redis client; when set, the active profile is
+                cached there and writes through this repository evict it.
         """
         self.supabase = supabase
+        self.pool = pool
+        self.redis = redis
         self.table = "client_profiles"
 
     async def list_by_user(self, user_id: str) -> list[ClientProfile]:
@@ -39,21 +86,26 @@ class ClientProfileRepository:
         Returns:
             List of client profiles.
         """
-        logger.info("listing_client_profiles", user_id=user_id)
-
-        response = (
-            self.supabase.table(self.table)
-            .select("*")
-            .eq("user_id", user_id)
-            .order("created_at", desc=True)
-            .execute()
-        )
-
-        profiles = []
-        for row in response.data:
-            profiles.append(self._row_to_profile(row))
-
-        logger.info("client_profiles_listed", user_id=user_id, count=len(profiles))
+        logger.debug("listing_client_profiles", user_id=user_id)
+
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                records = await conn.fetch(
+                    "SELECT * FROM client_profiles WHERE user_id = $1 ORDER BY created_at DESC",
+                    user_id,
+                )
+            # Convert record by record so no intermediate list of row dicts is kept
+            profiles = self._rows_to_profiles([record_to_dict(record) for record in records])
+        else:
+            response = await execute_query(
+                self.supabase.table(self.table)
+                .select("*")
+                .eq("user_id", user_id)
+                .order("created_at", desc=True)
+            )
+            profiles = self._rows_to_profiles(response.data)
+
+        logger.debug("client_profiles_listed", user_id=user_id, count=len(profiles))
         return profiles
 
     async def get_by_id(self, profile_id: str, user_id: str) -> ClientProfile | None:
@@ -67,22 +119,31 @@ class ClientProfileRepository:
         Returns:
             Client profile or None if not found.
         """
-        logger.info("getting_client_profile", profile_id=profile_id, user_id=user_id)
-
-        response = (
-            self.supabase.table(self.table)
-            .select("*")
-            .eq("id", profile_id)
-            .eq("user_id", user_id)
-            .single()
-            .execute()
-        )
-
-        if not response.data:
+        logger.debug("getting_client_profile", profile_id=profile_id, user_id=user_id)
+
+        if self.pool is not None:
+            async with self.pool.acquire() as conn:
+                record = await conn.fetchrow(
+                    "SELECT * FROM client_profiles WHERE id = $1 AND user_id = $2",
+                    profile_id,
+                    user_id,
+                )
+            row = record_to_dict(record) if record else None
+        else:
+            response = await execute_query(
+                self.supabase.table(self.table)
+                .select("*")
+                .eq("id", profile_id)
+                .eq("user_id", user_id)
+                .single()
+            )
+            row = response.data
+
+        if not row:
             logger.warning("client_profile_not_found", profile_id=profile_id)
             return None
 
-        return self._row_to_profile(response.data)
+        return self._row_to_profile(row)
 
     async def create(self, user_id: str, data: ClientProfileCreate) -> ClientProfile:
         """
@@ -95,23 +156,9 @@ class ClientProfileRepository:
         Returns:
             Created client profile.
         """
-        profile_id = str(uuid4())
-        now = datetime.utcnow().isoformat()
-
-        logger.info("creating_client_profile", profile_id=profile_id, user_id=user_id)
+        logger.debug("creating_client_profile", user_id=user_id)
 
-        # Check if user has any profiles - first one is automatically active
-        existing = (
-            self.supabase.table(self.table)
-            .select("id")
-            .eq("user_id", user_id)
-            .limit(1)
-            .execute()
-        )
-        is_first_profile = len(existing.data) == 0
-
-        insert_data = {
-            "id": profile_id,
+        values = {
             "user_id": user_id,
             "company_name": data.company_name,
             "industry": data.industry,
@@ -123,21 +170,63 @@ class ClientProfileRepository:
                 if data.scoring_weight_overrides
                 else None
             ),
-            "is_active": is_first_profile,
-            "created_at": now,
-            "updated_at": now,
         }
 
-        response = self.supabase.table(self.table).insert(insert_data).execute()
+        if self.pool is not None:
+            profile = await self._insert_profile(self.pool, values)
+        else:
+            # Check if user has any profiles - first one is automatically active
+            existing = await execute_query(
+                self.supabase.table(self.table)
+                .select("id")
+                .eq("user_id", user_id)
+                .limit(1)
+            )
+            now = utc_now_iso()
+            insert_data = {
+                "id": new_id(),
+                **values,
+                "is_active": len(existing.data) == 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            response = await execute_query(self.supabase.table(self.table).insert(insert_data))
+            profile = self._row_to_profile(response.data[0])
 
         logger.info(
             "client_profile_created",
-            profile_id=profile_id,
+            profile_id=profile.id,
             user_id=user_id,
-            is_active=is_first_profile,
+            is_active=profile.is_active,
         )
+        return profile
 
-        return self._row_to_profile(response.data[0])
+    async def _insert_profile(self, pool: asyncpg.Pool, values: dict) -> ClientProfile:
+        """
+        Insert a profile with its ID, timestamps and active flag set by Postgres.
+
+        The user's first profile becomes active; deciding that inside the
+        INSERT saves the separate existence check.
+        """
+        # Column names come from code; all values are bound parameters.
+        # user_id is the first value, so it is $1.
+        columns = ", ".join(values)
+        placeholders = ", ".join(f"${i}" for i in range(1, len(values) + 1))
+        record = await pool.fetchrow(
+            f"""
+            INSERT INTO client_profiles (id, {columns}, is_active, created_at, updated_at)
+            VALUES (
+                gen_random_uuid(),
+                {placeholders},
+                NOT EXISTS (SELECT 1 FROM client_profiles WHERE user_id = $1),
+                now(),
+                now()
+            )
+            RETURNING *
+            """,
+            *values.values(),
+        )
+        return self._row_to_profile(record_to_dict(record))
 
     async def update(
         self, profile_id: str, user_id: str, data: ClientProfileUpdate
@@ -153,10 +242,10 @@ class ClientProfileRepository:
         Returns:
             Updated profile or None if not found.
         """
-        logger.info("updating_client_profile", profile_id=profile_id, user_id=user_id)
+        logger.debug("updating_client_profile", profile_id=profile_id, user_id=user_id)
 
         # Build update dict with only provided fields
-        update_data: dict = {"updated_at": datetime.utcnow().isoformat()}
+        update_data: dict = {"updated_at": utc_now_iso()}
 
         if data.company_name is not None:
             update_data["company_name"] = data.company_name
@@ -171,18 +260,19 @@ class ClientProfileRepository:
         if data.scoring_weight_overrides is not None:
             update_data["scoring_weight_overrides"] = data.scoring_weight_overrides.model_dump()
 
-        response = (
+        response = await execute_query(
             self.supabase.table(self.table)
             .update(update_data)
             .eq("id", profile_id)
             .eq("user_id", user_id)
-            .execute()
         )
 
         if not response.data:
             logger.warning("client_profile_update_failed", profile_id=profile_id)
             return None
 
+        await forget_active(self.redis, user_id)
+
         logger.info("client_profile_updated", profile_id=profile_id)
         return self._row_to_profile(response.data[0])
 
@@ -197,27 +287,76 @@ class ClientProfileRepository:
         Returns:
             True if deleted, False if not found.
         """
-        logger.info("deleting_client_profile", profile_id=profile_id, user_id=user_id)
+        logger.debug("deleting_client_profile", profile_id=profile_id, user_id=user_id)
 
-        # Check if profile exists and belongs to user
-        existing = await self.get_by_id(profile_id, user_id)
-        if not existing:
+        if self.pool is not None:
+            return await self._delete_and_reassign(self.pool, profile_id, user_id)
+
+        # Delete the profile (cascades to leads, searches via FK); the deleted
+        # row comes back, so no existence check is needed beforehand
+        deleted = await execute_query(
+            self.supabase.table(self.table)
+            .delete()
+            .eq("id", profile_id)
+            .eq("user_id", user_id)
+        )
+        if not deleted.data:
+            logger.warning("client_profile_not_found", profile_id=profile_id)
             return False
 
-        # If deleting the active profile, activate another one
-        if existing.is_active:
-            # Find another profile to activate
-            other_profiles = await self.list_by_user(user_id)
-            for profile in other_profiles:
-                if profile.id != profile_id:
-                    await self.set_active(profile.id, user_id)
-                    break
+        # If the active profile was deleted, activate the newest remaining one
+        if deleted.data[0]["is_active"]:
+            fallback = await execute_query(
+                self.supabase.table(self.table)
+                .select("id")
+                .eq("user_id", user_id)
+                .order("created_at", desc=True)
+                .limit(1)
+            )
+            if fallback.data:
+                await execute_query(
+                    self.supabase.table(self.table)
+                    .update({"is_active": True, "updated_at": utc_now_iso()})
+                    .eq("id", fallback.data[0]["id"])
+                    .eq("user_id", user_id)
+                )
+        await forget_active(self.redis, user_id)
 
-        # Delete the profile (cascades to leads, searches via FK)
-        self.supabase.table(self.table).delete().eq("id", profile_id).eq(
-            "user_id", user_id
-        ).execute()
+        logger.info("client_profile_deleted", profile_id=profile_id)
+        return True
+
+    async def _delete_and_reassign(
+        self, pool: asyncpg.Pool, profile_id: str, user_id: str
+    ) -> bool:
+        """Delete a profile and, if it was active, activate the user's newest other one."""
+        # Both CTEs read the pre-delete snapshot, hence the id <> $1 filter
+        deleted = await pool.fetchval(
+            """
+            WITH deleted AS (
+                DELETE FROM client_profiles
+                WHERE id = $1 AND user_id = $2
+                RETURNING is_active
+            ), promoted AS (
+                UPDATE client_profiles
+                SET is_active = true, updated_at = now()
+                WHERE id = (
+                    SELECT id FROM client_profiles
+                    WHERE user_id = $2 AND id <> $1
+                    ORDER BY created_at DESC
+                    LIMIT 1
+                )
+                AND EXISTS (SELECT 1 FROM deleted WHERE is_active)
+            )
+            SELECT count(*) FROM deleted
+            """,
+            profile_id,
+            user_id,
+        )
+        if not deleted:
+            logger.warning("client_profile_not_found", profile_id=profile_id)
+            return False
 
+        await forget_active(self.redis, user_id)
         logger.info("client_profile_deleted", profile_id=profile_id)
         return True
 
@@ -232,74 +371,104 @@ class ClientProfileRepository:
         Returns:
             Activated profile or None if not found.
         """
-        logger.info("setting_active_profile", profile_id=profile_id, user_id=user_id)
+        logger.debug("setting_active_profile", profile_id=profile_id, user_id=user_id)
 
-        # Deactivate all other profiles for this user
-        self.supabase.table(self.table).update({"is_active": False}).eq(
-            "user_id", user_id
-        ).execute()
+        if self.pool is not None:
+            return await self._set_active_atomically(self.pool, profile_id, user_id)
 
-        # Activate the specified profile
-        response = (
+        # Activate the specified profile first, so an unknown ID leaves the
+        # current active profile alone
+        response = await execute_query(
             self.supabase.table(self.table)
-            .update({"is_active": True, "updated_at": datetime.utcnow().isoformat()})
+            .update({"is_active": True, "updated_at": utc_now_iso()})
             .eq("id", profile_id)
             .eq("user_id", user_id)
-            .execute()
         )
-
         if not response.data:
             logger.warning("set_active_profile_failed", profile_id=profile_id)
             return None
 
+        # Deactivate the user's other active profiles
+        await execute_query(
+            self.supabase.table(self.table)
+            .update({"is_active": False})
+            .eq("user_id", user_id)
+            .eq("is_active", True)
+            .neq("id", profile_id)
+        )
+        await forget_active(self.redis, user_id)
+
         logger.info("active_profile_set", profile_id=profile_id)
         return self._row_to_profile(response.data[0])
 
+    async def _set_active_atomically(
+        self, pool: asyncpg.Pool, profile_id: str, user_id: str
+    ) -> ClientProfile | None:
+        """Activate a profile and deactivate the user's others in one statement."""
+        # Touches only the target and the currently active profile. Nothing is
+        # updated if the target does not belong to the user.
+        records = await pool.fetch(
+            """
+            UPDATE client_profiles
+            SET is_active = (id = $1),
+                updated_at = CASE WHEN id = $1 THEN now() ELSE updated_at END
+            WHERE user_id = $2
+              AND (id = $1 OR is_active)
+              AND EXISTS (SELECT 1 FROM client_profiles WHERE id = $1 AND user_id = $2)
+            RETURNING *
+            """,
+            profile_id,
+            user_id,
+        )
+        record = next((r for r in records if r["is_active"]), None)
+        if record is None:
+            logger.warning("set_active_profile_failed", profile_id=profile_id)
+            return None
+        await forget_active(self.redis, user_id)
+
+        logger.info("active_profile_set", profile_id=profile_id)
+        return self._row_to_profile(record_to_dict(record))
+
     async def get_active(self, user_id: str) -> ClientProfile | None:
         """
         Get the active client profile for a user.
 
+        Results are cached in Redis under the same key as the active profile
+        response, which every profile write evicts, so all processes see a
+        change as soon as it is made.
+
         Args:
             user_id: User's UUID.
 
         Returns:
             Active client profile or None.
         """
-        response = (
+        cache_key = client_profile_active_key(user_id)
+        if self.redis is not None:
+            cached = await cache_get(self.redis, cache_key)
+            if cached is not None:
+                return None if cached == b"null" else ClientProfile.model_validate_json(cached)
+
+        response = await execute_query(
             self.supabase.table(self.table)
             .select("*")
             .eq("user_id", user_id)
             .eq("is_active", True)
             .single()
-            .execute()
         )
 
         if not response.data:
             return None
 
-        return self._row_to_profile(response.data)
+        profile = self._row_to_profile(response.data)
+        if self.redis is not None:
+            await cache_set(self.redis, cache_key, profile.model_dump_json().encode())
+        return profile
 
     def _row_to_profile(self, row: dict) -> ClientProfile:
         """Convert database row to ClientProfile model."""
-        scoring_weights = None
-        if row.get("scoring_weight_overrides"):
-            scoring_weights = ScoringWeights(**row["scoring_weight_overrides"])
-
-        return ClientProfile(
-            id=row["id"],
-            user_id=row["user_id"],
-            company_name=row["company_name"],
-            industry=row["industry"],
-            ideal_customer_profile=row.get("ideal_customer_profile", "")
-            or row.get("ideal_client_description", ""),
-            services=row.get("services", []) or [],
-            additional_context=row.get("additional_context"),
-            scoring_weight_overrides=scoring_weights,
-            is_active=row.get("is_active", False),
-            created_at=datetime.fromisoformat(row["created_at"].replace("Z", "+00:00"))
-            if isinstance(row["created_at"], str)
-            else row["created_at"],
-            updated_at=datetime.fromisoformat(row["updated_at"].replace("Z", "+00:00"))
-            if isinstance(row["updated_at"], str)
-            else row["updated_at"],
-        )
+        return ClientProfile.model_validate(_normalize_row(row))
+
+    def _rows_to_profiles(self, rows: list[dict]) -> list[ClientProfile]:
+        """Convert database rows to ClientProfile models in one validation pass."""
+        return _PROFILE_LIST_ADAPTER.validate_python([_normalize_row(row) for row in rows])
@@ -1,29 +1,74 @@
 """Conversation repository for database operations."""
 
-import uuid
-from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from supabase import Client
+import asyncpg
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
 
+from src.core.db_pool import record_to_dict
+from src.core.supabase import execute_query
+from src.repositories.client_profile import forget_active
 from src.schemas.conversation import (
     Conversation,
     ConversationMessage,
     ConversationStatus,
+    ConversationSummary,
     ExtractedProfile,
-    MessageRole,
 )
+from src.utils.clock import utc_now_iso
+from src.utils.ids import new_id
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = get_logger(__name__)
 
+# Statuses a conversation can be converted to a client profile from
+CONVERTIBLE_STATUSES = (ConversationStatus.COMPLETED, ConversationStatus.IN_PROGRESS)
+
+
+# Rows are validated by pydantic-core, which parses timestamps, enums and the
+# nested messages itself
+_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ConversationSummary])
+
+# Dumps a whole message list in one pydantic-core call when writing it back
+_MESSAGES_ADAPTER = TypeAdapter(list[ConversationMessage])
+
+# List views only need headers. Postgres counts the messages itself; through
+# PostgREST the messages are fetched to be counted but never parsed into models.
+_SUMMARY_SQL = """
+    SELECT id, status, jsonb_array_length(coalesce(messages, '[]'::jsonb)) AS message_count,
+           extracted_profile, started_at, completed_at
+    FROM conversations
+"""
+_SUMMARY_COLUMNS = "id,status,messages,extracted_profile,started_at,completed_at"
+
 
 class ConversationRepository:
     """Repository for conversation CRUD operations."""
 
-    def __init__(self, supabase: Client) -> None:
-        """Initialize repository with Supabase client."""
+    def __init__(
+        self,
+        supabase: "Client",
+        pool: asyncpg.Pool | None = None,
+        redis: Redis | None = None,
+    ) -> None:
+        """
+        Initialize repository with Supabase client.
+
+        Args:
+            supabase: Supabase client instance.
+            pool: Optional Postgres pool; when set, creating a conversation,
+                appending a message and conversion to a client profile each
+                run as a single statement.
+            redis: Optional Redis client; when set, conversion to a client
+                profile evicts the user's cached active profile.
+        """
         self.supabase = supabase
+        self.pool = pool
+        self.redis = redis
         self.table = "conversations"
 
     async def create(self, initial_message: ConversationMessage | None = None) -> Conversation:
@@ -36,7 +81,10 @@ class ConversationRepository:
         Returns:
             Created conversation.
         """
-        conversation_id = str(uuid.uuid4())
+        if self.pool is not None:
+            return await self._insert_conversation(self.pool, initial_message)
+
+        conversation_id = new_id()
         messages = [initial_message.model_dump(mode="json")] if initial_message else []
 
         data = {
@@ -46,18 +94,44 @@ class ConversationRepository:
             "messages": messages,
             "status": ConversationStatus.IN_PROGRESS.value,
             "extracted_profile": None,
-            "started_at": datetime.utcnow().isoformat(),
+            "started_at": utc_now_iso(),
             "completed_at": None,
         }
 
         try:
-            result = self.supabase.table(self.table).insert(data).execute()
+            result = await execute_query(self.supabase.table(self.table).insert(data))
             logger.info("conversation_created", conversation_id=conversation_id)
             return self._to_conversation(result.data[0])
         except Exception as e:
             logger.exception("conversation_create_failed", error=str(e))
             raise
 
+    async def _insert_conversation(
+        self, pool: asyncpg.Pool, initial_message: ConversationMessage | None
+    ) -> Conversation:
+        """Insert a conversation with its ID and start time set by Postgres."""
+        messages = [initial_message] if initial_message else []
+        try:
+            record = await pool.fetchrow(
+                """
+                INSERT INTO conversations (
+                    id, user_id, client_profile_id, messages, status,
+                    extracted_profile, started_at, completed_at
+                )
+                VALUES (gen_random_uuid(), NULL, NULL, $1::text::jsonb, $2, NULL, now(), NULL)
+                RETURNING *
+                """,
+                _MESSAGES_ADAPTER.dump_json(messages).decode(),
+                ConversationStatus.IN_PROGRESS.value,
+            )
+        except Exception as e:
+            logger.exception("conversation_create_failed", error=str(e))
+            raise
+
+        conversation = self._to_conversation(record_to_dict(record))
+        logger.info("conversation_created", conversation_id=conversation.id)
+        return conversation
+
     async def get_by_id(self, conversation_id: str) -> Conversation | None:
         """
         Get conversation by ID.
@@ -69,11 +143,10 @@ class ConversationRepository:
             Conversation if found, None otherwise.
         """
         try:
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.table)
                 .select("*")
                 .eq("id", conversation_id)
-                .execute()
             )
 
             if not result.data:
@@ -96,9 +169,17 @@ class ConversationRepository:
             conversation_id: Conversation UUID.
             message: Message to add.
 
+        With a pool, the message is appended in place by one UPDATE, so the
+        existing messages are never transferred and concurrent appends
+        cannot overwrite each other. Without one, the message list is read,
+        extended and written back.
+
         Returns:
             Updated conversation.
         """
+        if self.pool is not None:
+            return await self._append_message(self.pool, conversation_id, message)
+
         try:
             # Get current messages
             conversation = await self.get_by_id(conversation_id)
@@ -106,18 +187,18 @@ class ConversationRepository:
                 raise ValueError(f"Conversation {conversation_id} not found")
 
             # Append new message
-            messages = [m.model_dump(mode="json") for m in conversation.messages]
-            messages.append(message.model_dump(mode="json"))
+            messages = _MESSAGES_ADAPTER.dump_python(
+                [*conversation.messages, message], mode="json"
+            )
 
             # Update in database
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.table)
                 .update({"messages": messages})
                 .eq("id", conversation_id)
-                .execute()
             )
 
-            logger.info(
+            logger.debug(
                 "message_added",
                 conversation_id=conversation_id,
                 role=message.role.value,
@@ -127,6 +208,35 @@ class ConversationRepository:
             logger.exception("message_add_failed", conversation_id=conversation_id, error=str(e))
             raise
 
+    async def _append_message(
+        self, pool: asyncpg.Pool, conversation_id: str, message: ConversationMessage
+    ) -> Conversation:
+        """Append a message to the conversation's JSONB array in one statement."""
+        try:
+            record = await pool.fetchrow(
+                """
+                UPDATE conversations
+                SET messages = coalesce(messages, '[]'::jsonb) || jsonb_build_array($2::text::jsonb)
+                WHERE id = $1
+                RETURNING *
+                """,
+                conversation_id,
+                # Serialized to JSON text by pydantic-core; Postgres parses it
+                message.model_dump_json(),
+            )
+            if record is None:
+                raise ValueError(f"Conversation {conversation_id} not found")
+        except Exception as e:
+            logger.exception("message_add_failed", conversation_id=conversation_id, error=str(e))
+            raise
+
+        logger.debug(
+            "message_added",
+            conversation_id=conversation_id,
+            role=message.role.value,
+        )
+        return self._to_conversation(record_to_dict(record))
+
     async def update_status(
         self,
         conversation_id: str,
@@ -148,16 +258,15 @@ class ConversationRepository:
             update_data: dict[str, Any] = {"status": status.value}
 
             if status == ConversationStatus.COMPLETED:
-                update_data["completed_at"] = datetime.utcnow().isoformat()
+                update_data["completed_at"] = utc_now_iso()
 
             if extracted_profile:
                 update_data["extracted_profile"] = extracted_profile.model_dump(mode="json")
 
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.table)
                 .update(update_data)
                 .eq("id", conversation_id)
-                .execute()
             )
 
             logger.info("conversation_status_updated", conversation_id=conversation_id, status=status.value)
@@ -170,29 +279,37 @@ class ConversationRepository:
         self,
         client_profile_id: str,
         user_id: str,
-    ) -> list[Conversation]:
+    ) -> list[ConversationSummary]:
         """
-        List all conversations for a client profile.
+        List conversation summaries for a client profile.
 
         Args:
             client_profile_id: Client profile UUID.
             user_id: User UUID (for authorization).
 
         Returns:
-            List of conversations.
+            Conversation summaries, newest first.
         """
         try:
-            result = (
-                self.supabase.table(self.table)
-                .select("*")
-                .eq("client_profile_id", client_profile_id)
-                .eq("user_id", user_id)
-                .order("started_at", desc=True)
-                .execute()
-            )
-
-            conversations = [self._to_conversation(row) for row in result.data]
-            logger.info(
+            if self.pool is not None:
+                records = await self.pool.fetch(
+                    _SUMMARY_SQL
+                    + "WHERE client_profile_id = $1 AND user_id = $2 ORDER BY started_at DESC",
+                    client_profile_id,
+                    user_id,
+                )
+                conversations = self._records_to_summaries(records)
+            else:
+                result = await execute_query(
+                    self.supabase.table(self.table)
+                    .select(_SUMMARY_COLUMNS)
+                    .eq("client_profile_id", client_profile_id)
+                    .eq("user_id", user_id)
+                    .order("started_at", desc=True)
+                )
+                conversations = self._rows_to_summaries(result.data)
+
+            logger.debug(
                 "conversations_listed",
                 client_profile_id=client_profile_id,
                 count=len(conversations),
@@ -206,27 +323,33 @@ class ConversationRepository:
             )
             raise
 
-    async def list_by_user(self, user_id: str) -> list[Conversation]:
+    async def list_by_user(self, user_id: str) -> list[ConversationSummary]:
         """
-        List all conversations for a user.
+        List conversation summaries for a user.
 
         Args:
             user_id: User UUID.
 
         Returns:
-            List of conversations.
+            Conversation summaries, newest first.
         """
         try:
-            result = (
-                self.supabase.table(self.table)
-                .select("*")
-                .eq("user_id", user_id)
-                .order("started_at", desc=True)
-                .execute()
-            )
-
-            conversations = [self._to_conversation(row) for row in result.data]
-            logger.info("conversations_listed_by_user", user_id=user_id, count=len(conversations))
+            if self.pool is not None:
+                records = await self.pool.fetch(
+                    _SUMMARY_SQL + "WHERE user_id = $1 ORDER BY started_at DESC",
+                    user_id,
+                )
+                conversations = self._records_to_summaries(records)
+            else:
+                result = await execute_query(
+                    self.supabase.table(self.table)
+                    .select(_SUMMARY_COLUMNS)
+                    .eq("user_id", user_id)
+                    .order("started_at", desc=True)
+                )
+                conversations = self._rows_to_summaries(result.data)
+
+            logger.debug("conversations_listed_by_user", user_id=user_id, count=len(conversations))
             return conversations
         except Exception as e:
             logger.exception("conversations_list_by_user_failed", user_id=user_id, error=str(e))
@@ -250,7 +373,7 @@ class ConversationRepository:
             Updated conversation.
         """
         try:
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.table)
                 .update({
                     "user_id": user_id,
@@ -258,7 +381,6 @@ class ConversationRepository:
                     "status": ConversationStatus.CONVERTED.value,
                 })
                 .eq("id", conversation_id)
-                .execute()
             )
 
             logger.info(
@@ -272,29 +394,93 @@ class ConversationRepository:
             logger.exception("conversation_link_failed", conversation_id=conversation_id, error=str(e))
             raise
 
-    def _to_conversation(self, data: dict[str, Any]) -> Conversation:
-        """Convert database row to Conversation model."""
-        messages = [
-            ConversationMessage(
-                role=MessageRole(m["role"]),
-                content=m["content"],
-                timestamp=datetime.fromisoformat(m["timestamp"]),
-                voice_input=m.get("voice_input", False),
+    async def convert_to_client_profile(
+        self,
+        conversation_id: str,
+        user_id: str,
+        profile_data: dict[str, Any],
+    ) -> None:
+        """
+        Create a client profile from a conversation and link both to the user.
+
+        With a pool, the insert and the conversation update run as one
+        statement in one transaction, so a failure can't leave an orphaned
+        profile behind. The update only matches a conversation that is still
+        convertible, so concurrent conversions of the same conversation
+        create exactly one profile.
+
+        Args:
+            conversation_id: Conversation UUID.
+            user_id: User UUID.
+            profile_data: Column values for the new client_profiles row,
+                including its ``id``.
+
+        Raises:
+            ValueError: If the conversation does not exist or is no longer
+                convertible.
+        """
+        if self.pool is None:
+            await execute_query(self.supabase.table("client_profiles").insert(profile_data))
+            await forget_active(self.redis, user_id)
+            await self.link_to_user(conversation_id, user_id, profile_data["id"])
+            return
+
+        # Column names come from code; all values are bound parameters
+        columns = list(profile_data)
+        placeholders = ", ".join(f"${i}" for i in range(5, len(columns) + 5))
+        query = f"""
+            WITH profile AS (
+                INSERT INTO client_profiles ({", ".join(columns)})
+                VALUES ({placeholders})
+                RETURNING id
             )
-            for m in data.get("messages", [])
-        ]
-
-        extracted_profile = None
-        if data.get("extracted_profile"):
-            extracted_profile = ExtractedProfile(**data["extracted_profile"])
-
-        return Conversation(
-            id=data["id"],
-            user_id=data.get("user_id"),
-            client_profile_id=data.get("client_profile_id"),
-            messages=messages,
-            status=ConversationStatus(data["status"]),
-            extracted_profile=extracted_profile,
-            started_at=datetime.fromisoformat(data["started_at"]),
-            completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None,
+            UPDATE conversations
+            SET user_id = $2, client_profile_id = profile.id, status = $3
+            FROM profile
+            WHERE conversations.id = $1 AND conversations.status = ANY($4)
+            RETURNING conversations.id
+        """
+
+        async with self.pool.acquire() as conn, conn.transaction():
+            linked = await conn.fetchval(
+                query,
+                conversation_id,
+                user_id,
+                ConversationStatus.CONVERTED.value,
+                [status.value for status in CONVERTIBLE_STATUSES],
+                *profile_data.values(),
+            )
+            if linked is None:
+                # Raising rolls back the profile insert
+                raise ValueError(f"Conversation {conversation_id} not found or not convertible")
+
+        # The new profile is active, so the cached one is stale
+        await forget_active(self.redis, user_id)
+        logger.info(
+            "conversation_linked",
+            conversation_id=conversation_id,
+            user_id=user_id,
+            client_profile_id=profile_data["id"],
         )
+
+    def _to_conversation(self, data: dict[str, Any]) -> Conversation:
+        """Convert database row to Conversation model in one pydantic-core pass."""
+        messages = data.get("messages")
+        extracted_profile = data.get("extracted_profile")
+        if messages is None or (extracted_profile is not None and not extracted_profile):
+            data = {
+                **data,
+                "messages": messages or [],
+                "extracted_profile": extracted_profile or None,
+            }
+        return Conversation.model_validate(data)
+
+    def _records_to_summaries(self, records: list[asyncpg.Record]) -> list[ConversationSummary]:
+        """Convert summary rows from Postgres to ConversationSummary models."""
+        return _SUMMARY_LIST_ADAPTER.validate_python([record_to_dict(r) for r in records])
+
+    def _rows_to_summaries(self, rows: list[dict[str, Any]]) -> list[ConversationSummary]:
+        """Convert PostgREST rows to ConversationSummary models, counting messages."""
+        for row in rows:
+            row["message_count"] = len(row.pop("messages", None) or [])
+        return _SUMMARY_LIST_ADAPTER.validate_python(rows)
@@ -1,33 +1,62 @@
 """Lead repository for database operations."""
 
-from datetime import datetime
-from typing import Any
-from uuid import uuid4
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from supabase import Client
+import asyncpg
+from pydantic import TypeAdapter
 
+from src.core.db_pool import record_to_dict
+from src.core.supabase import execute_query
 from src.schemas.lead import (
-    CompanySize,
     Lead,
-    LeadAccuracy,
     LeadCreate,
+    LeadSortField,
     LeadSource,
     LeadStatus,
     LeadStatusHistory,
     LeadUpdate,
-    ScoreBreakdown,
 )
+from src.utils.clock import utc_now_iso
+from src.utils.cursor import seek_filter
+from src.utils.ids import new_id
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = get_logger(__name__)
 
+# Rows are validated by pydantic-core, which coerces enums, parses timestamps
+# and builds the nested score breakdown itself
+_LEAD_LIST_ADAPTER = TypeAdapter(list[Lead])
+
+
+def _normalize_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Map empty score breakdowns and accuracies to the model's defaults."""
+    if row.get("score_breakdown") and row.get("accuracy") != "":
+        return row
+    return {
+        **row,
+        "score_breakdown": row.get("score_breakdown") or {},
+        "accuracy": row.get("accuracy") or None,
+    }
+
 
 class LeadRepository:
     """Repository for lead CRUD operations."""
 
-    def __init__(self, supabase: Client) -> None:
-        """Initialize repository with Supabase client."""
+    def __init__(self, supabase: "Client", pool: asyncpg.Pool | None = None) -> None:
+        """
+        Initialize repository.
+
+        Args:
+            supabase: Supabase client instance.
+            pool: Optional Postgres pool; when set, writes that would take
+                several PostgREST round trips run as a single statement.
+        """
         self.supabase = supabase
+        self.pool = pool
         self.table = "leads"
         self.history_table = "lead_status_history"
 
@@ -39,8 +68,10 @@ class LeadRepository:
         status: LeadStatus | None = None,
         source: LeadSource | None = None,
         min_score: float | None = None,
-        sort_by: str = "intent_score",
+        sort_by: LeadSortField = LeadSortField.INTENT_SCORE,
         sort_desc: bool = True,
+        exact_count: bool = False,
+        after: tuple[Any, str] | None = None,
     ) -> tuple[list[Lead], int]:
         """
         List leads for a client profile with filtering and pagination.
@@ -54,11 +85,19 @@ class LeadRepository:
             min_score: Filter by minimum intent score.
             sort_by: Field to sort by.
             sort_desc: Sort descending if True.
+            exact_count: Count every matching row. By default the total is
+                exact only for small results; beyond PostgREST's max-rows
+                it is the query planner's estimate, which avoids a full
+                count(*) on every page load.
+            after: ``(sort value, id)`` of the last lead already returned.
+                When set, the page starts right after that lead and ``page``
+                is ignored; the seek costs the same at any depth, where an
+                offset makes Postgres read and discard every earlier row.
 
         Returns:
             Tuple of (leads list, total count).
         """
-        logger.info(
+        logger.debug(
             "listing_leads",
             client_profile_id=client_profile_id,
             page=page,
@@ -67,29 +106,34 @@ class LeadRepository:
 
         try:
             # Build query
-            query = self.supabase.table(self.table).select("*", count="exact")
-            query = query.eq("client_profile_id", client_profile_id)
-
-            if status:
-                query = query.eq("status", status.value)
-            if source:
-                query = query.eq("source", source.value)
-            if min_score is not None:
-                query = query.gte("intent_score", min_score)
+            query = self._filtered_query(
+                self.supabase.table(self.table).select(
+                    "*", count="exact" if exact_count else "estimated"
+                ),
+                client_profile_id,
+                status,
+                source,
+                min_score,
+            )
 
-            # Apply sorting
-            query = query.order(sort_by, desc=sort_desc)
+            # Apply sorting; id breaks ties so pages never overlap or skip rows
+            query = query.order(sort_by.value, desc=sort_desc).order("id")
 
             # Apply pagination
-            offset = (page - 1) * page_size
-            query = query.range(offset, offset + page_size - 1)
-
-            result = query.execute()
+            if after is not None:
+                query = query.or_(seek_filter(sort_by.value, *after, desc=sort_desc))
+                query = query.limit(page_size)
+            else:
+                offset = (page - 1) * page_size
+                query = query.range(offset, offset + page_size - 1)
+
+            # Rows and the total come back in one round trip
+            result = await execute_query(query)
             total = result.count or 0
 
-            leads = [self._to_lead(row) for row in result.data]
+            leads = self._rows_to_leads(result.data)
 
-            logger.info(
+            logger.debug(
                 "leads_listed",
                 client_profile_id=client_profile_id,
                 count=len(leads),
@@ -101,6 +145,82 @@ class LeadRepository:
             logger.exception("leads_list_failed", client_profile_id=client_profile_id, error=str(e))
             raise
 
+    async def get_list_version(self, client_profile_id: str) -> tuple[str | None, int]:
+        """
+        Get a cheap version marker for a profile's leads.
+
+        Every lead write sets updated_at, and deletes change the count, so
+        the pair changes whenever any lead of the profile does. The count is
+        estimated so this stays an index lookup rather than a count(*) over
+        the profile's leads: it is exact up to PostgREST's max-rows, while
+        beyond that a delete may only show up with the next lead write.
+
+        Args:
+            client_profile_id: Profile UUID.
+
+        Returns:
+            Tuple of (latest updated_at, lead count).
+        """
+        result = await execute_query(
+            self.supabase.table(self.table)
+            .select("updated_at", count="estimated")
+            .eq("client_profile_id", client_profile_id)
+            .order("updated_at", desc=True)
+            .limit(1)
+        )
+        latest = result.data[0]["updated_at"] if result.data else None
+        return latest, result.count or 0
+
+    async def iter_by_profile(
+        self,
+        client_profile_id: str,
+        status: LeadStatus | None = None,
+        source: LeadSource | None = None,
+        min_score: float | None = None,
+        chunk_size: int = 500,
+    ) -> AsyncIterator[Lead]:
+        """
+        Iterate over all matching leads for a client profile, fetching lazily.
+
+        Leads are read in chunks of ``chunk_size`` ordered by intent score, so
+        only one chunk is held in memory at a time. Unlike list_by_profile,
+        no total count is computed.
+
+        Args:
+            client_profile_id: Profile UUID.
+            status: Filter by status.
+            source: Filter by source.
+            min_score: Filter by minimum intent score.
+            chunk_size: Rows fetched per query.
+
+        Yields:
+            Leads, highest intent score first.
+        """
+        after: tuple[Any, str] | None = None
+        while True:
+            query = self._filtered_query(
+                self.supabase.table(self.table).select("*"),
+                client_profile_id,
+                status,
+                source,
+                min_score,
+            )
+            # Each chunk seeks past the last lead of the previous one, so
+            # late chunks cost no more than the first
+            if after is not None:
+                query = query.or_(seek_filter("intent_score", *after, desc=True))
+            result = await execute_query(
+                query.order("intent_score", desc=True).order("id").limit(chunk_size)
+            )
+
+            for lead in self._rows_to_leads(result.data):
+                yield lead
+
+            if len(result.data) < chunk_size:
+                return
+            last = result.data[-1]
+            after = (last["intent_score"], last["id"])
+
     async def get_by_id(self, lead_id: str, client_profile_id: str) -> Lead | None:
         """
         Get lead by ID with profile authorization.
@@ -113,12 +233,11 @@ class LeadRepository:
             Lead if found, None otherwise.
         """
         try:
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.table)
                 .select("*")
                 .eq("id", lead_id)
                 .eq("client_profile_id", client_profile_id)
-                .execute()
             )
 
             if not result.data:
@@ -130,6 +249,42 @@ class LeadRepository:
             logger.exception("lead_get_failed", lead_id=lead_id, error=str(e))
             raise
 
+    async def get_by_id_with_history(
+        self, lead_id: str, client_profile_id: str
+    ) -> tuple[Lead, list[LeadStatusHistory]] | None:
+        """
+        Get a lead and its status history in one request.
+
+        The history is embedded in the lead select, so PostgREST fetches
+        both with a single query instead of one round trip each.
+
+        Args:
+            lead_id: Lead UUID.
+            client_profile_id: Profile UUID for authorization.
+
+        Returns:
+            Tuple of (lead, history newest first) if found, None otherwise.
+        """
+        try:
+            result = await execute_query(
+                self.supabase.table(self.table)
+                .select(f"*, {self.history_table}(*)")
+                .eq("id", lead_id)
+                .eq("client_profile_id", client_profile_id)
+                .order("changed_at", desc=True, foreign_table=self.history_table)
+            )
+
+            if not result.data:
+                return None
+
+            row = dict(result.data[0])
+            history = row.pop(self.history_table, None) or []
+            return self._to_lead(row), self._rows_to_history(history)
+
+        except Exception as e:
+            logger.exception("lead_get_failed", lead_id=lead_id, error=str(e))
+            raise
+
     async def create(self, data: LeadCreate) -> Lead:
         """
         Create a new lead.
@@ -140,10 +295,10 @@ class LeadRepository:
         Returns:
             Created lead.
         """
-        lead_id = str(uuid4())
-        now = datetime.utcnow().isoformat()
+        lead_id = new_id()
+        now = utc_now_iso()
 
-        logger.info(
+        logger.debug(
             "creating_lead",
             lead_id=lead_id,
             client_profile_id=data.client_profile_id,
@@ -171,7 +326,7 @@ class LeadRepository:
                 "updated_at": now,
             }
 
-            result = self.supabase.table(self.table).insert(insert_data).execute()
+            result = await execute_query(self.supabase.table(self.table).insert(insert_data))
 
             logger.info("lead_created", lead_id=lead_id)
             return self._to_lead(result.data[0])
@@ -184,6 +339,9 @@ class LeadRepository:
         """
         Create multiple leads in a batch.
 
+        All leads go in one insert request, so either every lead is created
+        or none is, and a failed batch can be retried without duplicates.
+
         Args:
             leads: List of lead creation data.
 
@@ -193,14 +351,14 @@ class LeadRepository:
         if not leads:
             return []
 
-        logger.info("creating_leads_batch", count=len(leads))
+        logger.debug("creating_leads_batch", count=len(leads))
 
         try:
-            now = datetime.utcnow().isoformat()
+            now = utc_now_iso()
             insert_data = []
 
             for data in leads:
-                lead_id = str(uuid4())
+                lead_id = new_id()
                 insert_data.append({
                     "id": lead_id,
                     "client_profile_id": data.client_profile_id,
@@ -221,9 +379,9 @@ class LeadRepository:
                     "updated_at": now,
                 })
 
-            result = self.supabase.table(self.table).insert(insert_data).execute()
+            result = await execute_query(self.supabase.table(self.table).insert(insert_data))
 
-            created_leads = [self._to_lead(row) for row in result.data]
+            created_leads = self._rows_to_leads(result.data)
             logger.info("leads_batch_created", count=len(created_leads))
             return created_leads
 
@@ -248,21 +406,30 @@ class LeadRepository:
         Returns:
             Updated lead or None if not found.
         """
-        logger.info("updating_lead", lead_id=lead_id)
-
-        try:
-            # Get current lead for status history
-            current = await self.get_by_id(lead_id, client_profile_id)
-            if not current:
-                return None
+        logger.debug("updating_lead", lead_id=lead_id)
 
-            update_data: dict[str, Any] = {"updated_at": datetime.utcnow().isoformat()}
+        if self.pool is not None:
+            return await self._update_with_history(
+                self.pool, lead_id, client_profile_id, data
+            )
 
-            if data.status is not None and data.status != current.status:
+        try:
+            # The lead and its history row share one timestamp
+            now = utc_now_iso()
+            update_data: dict[str, Any] = {"updated_at": now}
+
+            # The previous status is only needed to record a status change
+            current = None
+            if data.status is not None:
+                current = await self.get_by_id(lead_id, client_profile_id)
+                if not current:
+                    return None
+
+            if current is not None and data.status != current.status:
                 update_data["status"] = data.status.value
                 # Record status history
                 await self._record_status_change(
-                    lead_id, current.status, data.status, data.notes
+                    lead_id, current.status, data.status, data.notes, now
                 )
 
             if data.accuracy is not None:
@@ -272,12 +439,11 @@ class LeadRepository:
             if data.phone is not None:
                 update_data["phone"] = data.phone
 
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.table)
                 .update(update_data)
                 .eq("id", lead_id)
                 .eq("client_profile_id", client_profile_id)
-                .execute()
             )
 
             if not result.data:
@@ -290,6 +456,65 @@ class LeadRepository:
             logger.exception("lead_update_failed", lead_id=lead_id, error=str(e))
             raise
 
+    async def _update_with_history(
+        self,
+        pool: asyncpg.Pool,
+        lead_id: str,
+        client_profile_id: str,
+        data: LeadUpdate,
+    ) -> Lead | None:
+        """Update a lead and record any status change in one statement."""
+        try:
+            # prev reads the pre-update snapshot and locks the row; unset
+            # fields keep their current value. The history row is only
+            # written if the status actually changed, atomically with the
+            # update.
+            record = await pool.fetchrow(
+                """
+                WITH prev AS (
+                    SELECT status FROM leads
+                    WHERE id = $1 AND client_profile_id = $2
+                    FOR UPDATE
+                ), updated AS (
+                    UPDATE leads
+                    SET status = coalesce($3, leads.status),
+                        accuracy = coalesce($4, leads.accuracy),
+                        email = coalesce($5, leads.email),
+                        phone = coalesce($6, leads.phone),
+                        updated_at = now()
+                    FROM prev
+                    WHERE leads.id = $1 AND leads.client_profile_id = $2
+                    RETURNING leads.*, prev.status AS previous_status
+                ), history AS (
+                    INSERT INTO lead_status_history
+                        (id, lead_id, previous_status, new_status, changed_at, notes)
+                    SELECT gen_random_uuid(), id, previous_status, status, now(), $7
+                    FROM updated
+                    WHERE status IS DISTINCT FROM previous_status
+                )
+                SELECT * FROM updated
+                """,
+                lead_id,
+                client_profile_id,
+                data.status.value if data.status is not None else None,
+                data.accuracy.value if data.accuracy is not None else None,
+                data.email,
+                data.phone,
+                data.notes,
+            )
+        except Exception as e:
+            logger.exception("lead_update_failed", lead_id=lead_id, error=str(e))
+            raise
+
+        if record is None:
+            return None
+
+        row = record_to_dict(record)
+        del row["previous_status"]
+
+        logger.info("lead_updated", lead_id=lead_id)
+        return self._to_lead(row)
+
     async def delete(self, lead_id: str, client_profile_id: str) -> bool:
         """
         Delete a lead.
@@ -301,7 +526,10 @@ class LeadRepository:
         Returns:
             True if deleted, False if not found.
         """
-        logger.info("deleting_lead", lead_id=lead_id)
+        logger.debug("deleting_lead", lead_id=lead_id)
+
+        if self.pool is not None:
+            return await self._delete_with_history(self.pool, lead_id, client_profile_id)
 
         try:
             # Check exists
@@ -310,12 +538,17 @@ class LeadRepository:
                 return False
 
             # Delete status history first
-            self.supabase.table(self.history_table).delete().eq("lead_id", lead_id).execute()
+            await execute_query(
+                self.supabase.table(self.history_table).delete().eq("lead_id", lead_id)
+            )
 
             # Delete lead
-            self.supabase.table(self.table).delete().eq("id", lead_id).eq(
-                "client_profile_id", client_profile_id
-            ).execute()
+            await execute_query(
+                self.supabase.table(self.table)
+                .delete()
+                .eq("id", lead_id)
+                .eq("client_profile_id", client_profile_id)
+            )
 
             logger.info("lead_deleted", lead_id=lead_id)
             return True
@@ -324,28 +557,49 @@ class LeadRepository:
             logger.exception("lead_delete_failed", lead_id=lead_id, error=str(e))
             raise
 
+    async def _delete_with_history(
+        self, pool: asyncpg.Pool, lead_id: str, client_profile_id: str
+    ) -> bool:
+        """Delete a lead and its status history in one statement."""
+        # History is only deleted for a lead the profile owns; foreign keys
+        # are checked once the whole statement has run
+        try:
+            deleted = await pool.fetchval(
+                """
+                WITH deleted AS (
+                    DELETE FROM leads
+                    WHERE id = $1 AND client_profile_id = $2
+                    RETURNING id
+                ), history AS (
+                    DELETE FROM lead_status_history
+                    WHERE lead_id IN (SELECT id FROM deleted)
+                )
+                SELECT count(*) FROM deleted
+                """,
+                lead_id,
+                client_profile_id,
+            )
+        except Exception as e:
+            logger.exception("lead_delete_failed", lead_id=lead_id, error=str(e))
+            raise
+
+        if not deleted:
+            return False
+
+        logger.info("lead_deleted", lead_id=lead_id)
+        return True
+
     async def get_status_history(self, lead_id: str) -> list[LeadStatusHistory]:
         """Get status change history for a lead."""
         try:
-            result = (
+            result = await execute_query(
                 self.supabase.table(self.history_table)
                 .select("*")
                 .eq("lead_id", lead_id)
                 .order("changed_at", desc=True)
-                .execute()
             )
 
-            return [
-                LeadStatusHistory(
-                    id=row["id"],
-                    lead_id=row["lead_id"],
-                    previous_status=LeadStatus(row["previous_status"]) if row.get("previous_status") else None,
-                    new_status=LeadStatus(row["new_status"]),
-                    changed_at=datetime.fromisoformat(row["changed_at"].replace("Z", "+00:00")),
-                    notes=row.get("notes"),
-                )
-                for row in result.data
-            ]
+            return self._rows_to_history(result.data)
 
         except Exception as e:
             logger.exception("status_history_get_failed", lead_id=lead_id, error=str(e))
@@ -357,42 +611,59 @@ class LeadRepository:
         previous_status: LeadStatus,
         new_status: LeadStatus,
         notes: str | None,
+        changed_at: str,
     ) -> None:
         """Record a status change in history."""
         try:
-            self.supabase.table(self.history_table).insert({
-                "id": str(uuid4()),
-                "lead_id": lead_id,
-                "previous_status": previous_status.value,
-                "new_status": new_status.value,
-                "changed_at": datetime.utcnow().isoformat(),
-                "notes": notes,
-            }).execute()
+            await execute_query(
+                self.supabase.table(self.history_table).insert({
+                    "id": new_id(),
+                    "lead_id": lead_id,
+                    "previous_status": previous_status.value,
+                    "new_status": new_status.value,
+                    "changed_at": changed_at,
+                    "notes": notes,
+                })
+            )
         except Exception as e:
             logger.warning("status_history_record_failed", lead_id=lead_id, error=str(e))
 
+    def _filtered_query(
+        self,
+        query: Any,
+        client_profile_id: str,
+        status: LeadStatus | None,
+        source: LeadSource | None,
+        min_score: float | None,
+    ) -> Any:
+        """Apply the profile and lead filters to a select query."""
+        query = query.eq("client_profile_id", client_profile_id)
+        if status:
+            query = query.eq("status", status.value)
+        if source:
+            query = query.eq("source", source.value)
+        if min_score is not None:
+            query = query.gte("intent_score", min_score)
+        return query
+
     def _to_lead(self, data: dict[str, Any]) -> Lead:
         """Convert database row to Lead model."""
-        score_breakdown = ScoreBreakdown()
-        if data.get("score_breakdown"):
-            score_breakdown = ScoreBreakdown(**data["score_breakdown"])
-
-        return Lead(
-            id=data["id"],
-            client_profile_id=data["client_profile_id"],
-            search_id=data["search_id"],
-            name=data["name"],
-            email=data.get("email"),
-            phone=data.get("phone"),
-            company=data["company"],
-            company_size=CompanySize(data.get("company_size", "unknown")),
-            intent_score=data.get("intent_score", 0),
-            score_breakdown=score_breakdown,
-            source=LeadSource(data["source"]),
-            source_url=data.get("source_url"),
-            status=LeadStatus(data.get("status", "new")),
-            accuracy=LeadAccuracy(data["accuracy"]) if data.get("accuracy") else None,
-            raw_data=data.get("raw_data"),
-            created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
-        )
+        return Lead.model_validate(_normalize_row(data))
+
+    def _rows_to_leads(self, rows: list[dict[str, Any]]) -> list[Lead]:
+        """Convert database rows to Lead models in one validation pass."""
+        return _LEAD_LIST_ADAPTER.validate_python([_normalize_row(row) for row in rows])
+
+    def _rows_to_history(self, rows: list[dict[str, Any]]) -> list[LeadStatusHistory]:
+        """Convert status history rows to LeadStatusHistory models."""
+        return [
+            LeadStatusHistory(
+                id=row["id"],
+                lead_id=row["lead_id"],
+                previous_status=row.get("previous_status") or None,
+                new_status=row["new_status"],
+                changed_at=row["changed_at"],
+                notes=row.get("notes"),
+            )
+            for row in rows
+        ]
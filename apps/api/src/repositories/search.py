@@ -1,31 +1,44 @@
 """Search repository for database operations."""
 
-from datetime import datetime
-from typing import Any
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any
 
-from supabase import Client
+import asyncpg
 
+from src.core.db_pool import record_to_dict
+from src.core.supabase import execute_query
 from src.schemas.lead import LeadSource
 from src.schemas.search import (
     ManualSearchParams,
     Search,
     SearchCreate,
     SearchStatus,
-    SearchType,
     SearchUpdate,
 )
+from src.utils.clock import utc_now, utc_now_iso
+from src.utils.cursor import seek_filter
+from src.utils.ids import new_id
 from src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = get_logger(__name__)
 
 
 class SearchRepository:
     """Repository for search CRUD operations."""
 
-    def __init__(self, supabase: Client) -> None:
-        """Initialize repository with Supabase client."""
+    def __init__(self, supabase: "Client", pool: asyncpg.Pool | None = None) -> None:
+        """
+        Initialize repository.
+
+        Args:
+            supabase: Supabase client instance.
+            pool: Optional Postgres pool; when set, source results are
+                merged into the search by a single atomic UPDATE.
+        """
         self.supabase = supabase
+        self.pool = pool
         self.table = "searches"
 
     async def list_by_profile(
@@ -33,19 +46,22 @@ class SearchRepository:
         client_profile_id: str,
         status: SearchStatus | None = None,
         limit: int = 20,
+        after: tuple[str, str] | None = None,
     ) -> list[Search]:
         """
-        List searches for a client profile.
+        List searches for a client profile, newest first.
 
         Args:
             client_profile_id: Profile UUID.
             status: Filter by status.
             limit: Maximum results to return.
+            after: ``(started_at, id)`` of the last search already returned;
+                when set, only older searches are listed.
 
         Returns:
             List of searches.
         """
-        logger.info("listing_searches", client_profile_id=client_profile_id)
+        logger.debug("listing_searches", client_profile_id=client_profile_id)
 
         try:
             query = (
@@ -53,17 +69,20 @@ class SearchRepository:
                 .select("*")
                 .eq("client_profile_id", client_profile_id)
                 .order("started_at", desc=True)
+                .order("id")
                 .limit(limit)
             )
 
             if status:
                 query = query.eq("status", status.value)
+            if after is not None:
+                query = query.or_(seek_filter("started_at", *after, desc=True))
 
-            result = query.execute()
+            result = await execute_query(query)
 
             searches = [self._to_search(row) for row in result.data]
 
-            logger.info(
+            logger.debug(
                 "searches_listed",
                 client_profile_id=client_profile_id,
                 count=len(searches),
@@ -91,7 +110,7 @@ class SearchRepository:
             if client_profile_id:
                 query = query.eq("client_profile_id", client_profile_id)
 
-            result = query.execute()
+            result = await execute_query(query)
 
             if not result.data:
                 return None
@@ -112,10 +131,10 @@ class SearchRepository:
         Returns:
             Created search.
         """
-        search_id = str(uuid4())
-        now = datetime.utcnow().isoformat()
+        search_id = new_id()
+        now = utc_now_iso()
 
-        logger.info(
+        logger.debug(
             "creating_search",
             search_id=search_id,
             client_profile_id=data.client_profile_id,
@@ -139,7 +158,7 @@ class SearchRepository:
                 "error_message": None,
             }
 
-            result = self.supabase.table(self.table).insert(insert_data).execute()
+            result = await execute_query(self.supabase.table(self.table).insert(insert_data))
 
             logger.info("search_created", search_id=search_id)
             return self._to_search(result.data[0])
@@ -159,7 +178,7 @@ class SearchRepository:
         Returns:
             Updated search or None if not found.
         """
-        logger.info("updating_search", search_id=search_id)
+        logger.debug("updating_search", search_id=search_id)
 
         try:
             update_data: dict[str, Any] = {}
@@ -182,11 +201,8 @@ class SearchRepository:
             if not update_data:
                 return await self.get_by_id(search_id)
 
-            result = (
-                self.supabase.table(self.table)
-                .update(update_data)
-                .eq("id", search_id)
-                .execute()
+            result = await execute_query(
+                self.supabase.table(self.table).update(update_data).eq("id", search_id)
             )
 
             if not result.data:
@@ -218,7 +234,7 @@ class SearchRepository:
         Returns:
             Updated search.
         """
-        logger.info(
+        logger.debug(
             "adding_source_result",
             search_id=search_id,
             source=source.value,
@@ -226,6 +242,11 @@ class SearchRepository:
             leads_found=leads_found,
         )
 
+        if self.pool is not None:
+            return await self._merge_source_result(
+                self.pool, search_id, source, success, leads_found
+            )
+
         try:
             # Get current search
             search = await self.get_by_id(search_id)
@@ -262,6 +283,55 @@ class SearchRepository:
             logger.exception("add_source_result_failed", search_id=search_id, error=str(e))
             raise
 
+    async def _merge_source_result(
+        self,
+        pool: asyncpg.Pool,
+        search_id: str,
+        source: LeadSource,
+        success: bool,
+        leads_found: int,
+    ) -> Search | None:
+        """Merge a source result into the search row in one atomic UPDATE."""
+        # Each array gains the source only if missing, and the count is
+        # incremented in place, so concurrent source results cannot overwrite
+        # each other
+        try:
+            record = await pool.fetchrow(
+                """
+                UPDATE searches
+                SET sources_queried = CASE
+                        WHEN $2 = ANY(coalesce(sources_queried, '{}')) THEN sources_queried
+                        ELSE array_append(coalesce(sources_queried, '{}'), $2)
+                    END,
+                    sources_successful = CASE
+                        WHEN $3 AND NOT $2 = ANY(coalesce(sources_successful, '{}'))
+                        THEN array_append(coalesce(sources_successful, '{}'), $2)
+                        ELSE sources_successful
+                    END,
+                    sources_failed = CASE
+                        WHEN NOT $3 AND NOT $2 = ANY(coalesce(sources_failed, '{}'))
+                        THEN array_append(coalesce(sources_failed, '{}'), $2)
+                        ELSE sources_failed
+                    END,
+                    lead_count = coalesce(lead_count, 0) + $4
+                WHERE id = $1
+                RETURNING *
+                """,
+                search_id,
+                source.value,
+                success,
+                leads_found,
+            )
+        except Exception as e:
+            logger.exception("add_source_result_failed", search_id=search_id, error=str(e))
+            raise
+
+        if record is None:
+            return None
+
+        logger.info("search_updated", search_id=search_id, source=source.value)
+        return self._to_search(record_to_dict(record))
+
     async def complete(
         self,
         search_id: str,
@@ -285,7 +355,7 @@ class SearchRepository:
             search_id,
             SearchUpdate(
                 status=status,
-                completed_at=datetime.utcnow(),
+                completed_at=utc_now(),
                 error_message=error_message,
             ),
         )
@@ -300,18 +370,23 @@ class SearchRepository:
         Returns:
             Updated search.
         """
-        logger.info("cancelling_search", search_id=search_id)
+        logger.debug("cancelling_search", search_id=search_id)
 
         return await self.update(
             search_id,
             SearchUpdate(
                 status=SearchStatus.CANCELLED,
-                completed_at=datetime.utcnow(),
+                completed_at=utc_now(),
             ),
         )
 
     def _to_search(self, data: dict[str, Any]) -> Search:
-        """Convert database row to Search model."""
+        """
+        Convert database row to Search model.
+
+        Enum columns, including the source lists, and timestamps are passed
+        as raw values for pydantic-core to coerce.
+        """
         manual_params = None
         if data.get("manual_params"):
             manual_params = ManualSearchParams(**data["manual_params"])
@@ -319,17 +394,15 @@ class SearchRepository:
         return Search(
             id=data["id"],
             client_profile_id=data["client_profile_id"],
-            search_type=SearchType(data["search_type"]),
+            search_type=data["search_type"],
             manual_params=manual_params,
             quality_setting=data.get("quality_setting", 0.7),
-            status=SearchStatus(data["status"]),
-            sources_queried=[LeadSource(s) for s in data.get("sources_queried", [])],
-            sources_successful=[LeadSource(s) for s in data.get("sources_successful", [])],
-            sources_failed=[LeadSource(s) for s in data.get("sources_failed", [])],
+            status=data["status"],
+            sources_queried=data.get("sources_queried") or [],
+            sources_successful=data.get("sources_successful") or [],
+            sources_failed=data.get("sources_failed") or [],
             lead_count=data.get("lead_count", 0),
-            started_at=datetime.fromisoformat(data["started_at"].replace("Z", "+00:00")),
-            completed_at=datetime.fromisoformat(data["completed_at"].replace("Z", "+00:00"))
-            if data.get("completed_at")
-            else None,
+            started_at=data["started_at"],
+            completed_at=data.get("completed_at") or None,
             error_message=data.get("error_message"),
         )
@@ -1,10 +1,13 @@
 """Client profile schema definitions."""
 
+import re
 from datetime import datetime
-from uuid import uuid4
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
+from src.utils.ids import new_id
+
 
 class ScoringWeights(BaseModel):
     """Custom scoring weights for lead scoring."""
@@ -47,7 +50,7 @@ class ClientProfileUpdate(BaseModel):
 class ClientProfile(ClientProfileBase):
     """Full client profile model."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     user_id: str
     is_active: bool = False
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -58,6 +61,11 @@ class ClientProfile(ClientProfileBase):
 
         from_attributes = True
 
+    @cached_property
+    def filename_safe_company(self) -> str:
+        """Company name reduced to word characters and hyphens, for file names."""
+        return re.sub(r"[^\w\-]+", "_", self.company_name).strip("_") or "profile"
+
 
 class ClientProfileResponse(BaseModel):
     """Response model for client profile."""
@@ -74,6 +82,11 @@ class ClientProfileResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
+
 
 class ClientProfileListResponse(BaseModel):
     """Response model for listing client profiles."""
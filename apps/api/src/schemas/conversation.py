@@ -74,6 +74,17 @@ class Conversation(BaseModel):
         from_attributes = True
 
 
+class ConversationSummary(BaseModel):
+    """Conversation header without its messages, for list views."""
+
+    id: str
+    status: ConversationStatus
+    message_count: int = 0
+    extracted_profile: ExtractedProfile | None = None
+    started_at: datetime
+    completed_at: datetime | None = None
+
+
 class ConversationResponse(BaseModel):
     """Response for conversation operations."""
 
@@ -83,6 +94,11 @@ class ConversationResponse(BaseModel):
     started_at: datetime
     completed_at: datetime | None = None
 
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
 
 class MessageResponse(BaseModel):
     """Response after sending a message."""
@@ -121,6 +137,11 @@ class ConversationDetailResponse(BaseModel):
     started_at: datetime
     completed_at: datetime | None
 
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
 
 class ConversationSummaryResponse(BaseModel):
     """Summary response for conversation list."""
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 from enum import Enum
-from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.utils.ids import new_id
 
 
 class LeadStatus(str, Enum):
@@ -49,6 +50,15 @@ class CompanySize(str, Enum):
     UNKNOWN = "unknown"
 
 
+class LeadSortField(str, Enum):
+    """Lead list sort column."""
+
+    INTENT_SCORE = "intent_score"
+    CREATED_AT = "created_at"
+    COMPANY = "company"
+    NAME = "name"
+
+
 class ScoreBreakdown(BaseModel):
     """Detailed breakdown of lead intent score."""
 
@@ -97,7 +107,7 @@ class LeadUpdate(BaseModel):
 class Lead(LeadBase):
     """Full lead model."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     client_profile_id: str
     search_id: str
     intent_score: float = Field(default=0.0, ge=0, le=100)
@@ -117,7 +127,7 @@ class Lead(LeadBase):
 class LeadStatusHistory(BaseModel):
     """Lead status change history entry."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     lead_id: str
     previous_status: LeadStatus | None
     new_status: LeadStatus
@@ -128,6 +138,9 @@ class LeadStatusHistory(BaseModel):
 class LeadResponse(BaseModel):
     """Response model for lead operations."""
 
+    # Built straight from Lead models
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     client_profile_id: str
     search_id: str
@@ -160,3 +173,4 @@ class LeadListResponse(BaseModel):
     total: int
     page: int = 1
     page_size: int = 20
+    next_cursor: str | None = None
@@ -2,11 +2,11 @@
 
 from datetime import datetime
 from enum import Enum
-from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 from src.schemas.lead import CompanySize, LeadSource
+from src.utils.ids import new_id
 
 
 class SearchStatus(str, Enum):
@@ -63,7 +63,7 @@ class SearchUpdate(BaseModel):
 class Search(BaseModel):
     """Full search model."""
 
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = Field(default_factory=new_id)
     client_profile_id: str
 
     # Configuration
@@ -114,6 +114,7 @@ class SearchListResponse(BaseModel):
 
     searches: list[SearchResponse]
     total: int
+    next_cursor: str | None = None
 
 
 class SearchProgressUpdate(BaseModel):
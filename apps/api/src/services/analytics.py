@@ -5,6 +5,7 @@ from typing import Any
 
 from supabase import Client
 
+from src.core.supabase import execute_query
 from src.schemas.analytics import (
     AnalyticsQueryParams,
     IntentScoreCorrelation,
@@ -221,7 +222,7 @@ class AnalyticsService:
             if sources:
                 query = query.in_("source", [s.value for s in sources])
 
-            result = query.execute()
+            result = await execute_query(query)
             return result.data or []
 
         except Exception as e:
@@ -231,11 +232,10 @@ class AnalyticsService:
     async def _fetch_user_profiles(self, user_id: str) -> list[dict[str, Any]]:
         """Fetch all profiles for a user."""
         try:
-            result = (
+            result = await execute_query(
                 self.supabase.table("client_profiles")
                 .select("id, company_name")
                 .eq("user_id", user_id)
-                .execute()
             )
             return result.data or []
 
@@ -251,13 +251,12 @@ class AnalyticsService:
     ) -> SearchMetrics:
         """Compute search-related metrics."""
         try:
-            result = (
+            result = await execute_query(
                 self.supabase.table("searches")
                 .select("status, lead_count, sources_queried, sources_successful")
                 .eq("client_profile_id", profile_id)
                 .gte("started_at", start_dt.isoformat())
                 .lte("started_at", end_dt.isoformat())
-                .execute()
             )
 
             searches = result.data or []
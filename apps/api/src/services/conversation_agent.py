@@ -3,6 +3,7 @@
 import json
 from datetime import datetime
 
+import asyncpg
 from supabase import Client
 
 from src.repositories.conversation import ConversationRepository
@@ -59,15 +60,21 @@ Return ONLY the JSON object, no other text."""
 class ConversationAgent:
     """Agent for managing onboarding conversations with LLM."""
 
-    def __init__(self, supabase: Client, llm_service: LLMService | None = None) -> None:
+    def __init__(
+        self,
+        supabase: Client,
+        llm_service: LLMService | None = None,
+        pool: asyncpg.Pool | None = None,
+    ) -> None:
         """
         Initialize conversation agent.
 
         Args:
             supabase: Supabase client for database operations.
             llm_service: LLM service for generating responses.
+            pool: Optional Postgres pool for atomic message appends.
         """
-        self.repository = ConversationRepository(supabase)
+        self.repository = ConversationRepository(supabase, pool)
         self.llm = llm_service or LLMService()
 
     async def start_conversation(self) -> Conversation:
@@ -0,0 +1,19 @@
+"""
+UTC timestamps for rows written by the API.
+
+datetime.utcnow() is deprecated and returns a naive datetime, which
+Postgres then interprets in the session time zone. These helpers return
+timezone-aware UTC values instead.
+"""
+
+from datetime import UTC, datetime
+
+
+def utc_now() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
+def utc_now_iso() -> str:
+    """Get the current UTC time as an ISO 8601 string with offset."""
+    return datetime.now(UTC).isoformat()
@@ -0,0 +1,53 @@
+"""
+Random UUID generation.
+
+uuid4() reads 16 bytes from os.urandom per call. IDs are minted on hot
+paths (every conversation message, bulk lead inserts), so random bytes are
+drawn in 4 KiB blocks and sliced into version 4 UUIDs instead.
+"""
+
+import os
+import threading
+import uuid
+
+# Bytes drawn from os.urandom per refill (256 UUIDs)
+_BUFFER_SIZE = 4096
+
+
+class _UuidPool:
+    """Thread-safe source of version 4 UUIDs backed by a urandom buffer."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._offset = 0
+
+    def next(self) -> uuid.UUID:
+        """Return a new random UUID."""
+        with self._lock:
+            if self._offset + 16 > len(self._buf):
+                self._buf = os.urandom(_BUFFER_SIZE)
+                self._offset = 0
+            raw = self._buf[self._offset : self._offset + 16]
+            self._offset += 16
+        return uuid.UUID(bytes=raw, version=4)
+
+    def reset(self) -> None:
+        """Discard buffered bytes so a forked process never reuses the parent's."""
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._offset = 0
+
+
+_pool = _UuidPool()
+os.register_at_fork(after_in_child=_pool.reset)
+
+
+def new_uuid() -> uuid.UUID:
+    """Generate a random (version 4) UUID."""
+    return _pool.next()
+
+
+def new_id() -> str:
+    """Generate a random UUID string for use as a row ID."""
+    return str(_pool.next())
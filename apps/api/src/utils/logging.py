@@ -4,31 +4,63 @@ Structured logging configuration using structlog.
 Provides JSON logging for production and colored console output for development.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 import structlog
 from structlog.types import Processor
 
+_listener: QueueListener | None = None
+
+
+class _StructlogQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records over untouched.
+
+    The base class pre-formats each record into a string before queueing it,
+    which would both run the formatter on the calling thread and discard the
+    structlog event dict the listener-side formatter needs.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def setup_logging(log_level: str | None = None) -> None:
     """
     Configure structlog for the application.
 
+    Loggers only enqueue records; rendering and writing to stdout happen on
+    a background QueueListener thread, so log calls never block on I/O.
+
     Args:
-        log_level: Log level (debug, info, warning, error). Defaults to LOG_LEVEL env var.
+        log_level: Log level (debug, info, warning, error). Defaults to LOG_LEVEL env var,
+            or warning in production and info elsewhere.
     """
-    level = (log_level or os.getenv("LOG_LEVEL", "info")).upper()
-    numeric_level = getattr(logging, level, logging.INFO)
+    global _listener
 
     # Determine if running in production (JSON) or development (console)
     is_production = os.getenv("ENVIRONMENT", "development") == "production"
 
-    # Shared processors for all environments
+    default_level = "warning" if is_production else "info"
+    level = (log_level or os.getenv("LOG_LEVEL", default_level)).upper()
+    numeric_level = getattr(logging, level, logging.INFO)
+
+    # Shared processors for structlog and stdlib records
     shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -37,35 +69,56 @@ def setup_logging(log_level: str | None = None) -> None:
         structlog.processors.UnicodeDecoder(),
     ]
 
-    if is_production:
-        # Production: JSON output
-        processors: list[Processor] = [
-            *shared_processors,
-            structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ]
-    else:
-        # Development: Colored console output
-        processors = [
-            *shared_processors,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+    # Production: JSON output. Development: Colored console output
+    renderer: Processor = (
+        structlog.processors.JSONRenderer()
+        if is_production
+        else structlog.dev.ConsoleRenderer(colors=True)
+    )
 
     structlog.configure(
-        processors=processors,
+        processors=[
+            # Drop disabled levels before any processor runs
+            structlog.stdlib.filter_by_level,
+            structlog.contextvars.merge_contextvars,
+            *shared_processors,
+            # The listener thread can't see the active exception
+            structlog.processors.format_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    # Configure stdlib logging to work with structlog
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=numeric_level,
+    # Rendering happens in the listener thread
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            foreign_pre_chain=[*shared_processors, structlog.processors.format_exc_info],
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                renderer,
+            ],
+        )
     )
 
+    if _listener is None:
+        atexit.register(_stop_listener)
+    else:
+        _listener.stop()
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(_StructlogQueueHandler(log_queue))
+    root.setLevel(numeric_level)
+
     # Set log levels for noisy libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
@@ -0,0 +1,115 @@
+"""
+Tests for local JWT verification in the auth middleware.
+"""
+
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from src.api.middleware import auth
+from src.core.supabase import reset_settings_cache
+
+JWT_SECRET = "test-jwt-secret"
+
+
+@pytest.fixture(autouse=True)
+def jwt_secret(monkeypatch):
+    """Configure a known JWT secret and start each test with an empty cache."""
+    monkeypatch.setenv("SUPABASE_JWT_SECRET", JWT_SECRET)
+    reset_settings_cache()
+    auth._token_cache.clear()
+    yield
+    reset_settings_cache()
+    auth._token_cache.clear()
+
+
+def make_credentials(secret: str = JWT_SECRET, **claims) -> HTTPAuthorizationCredentials:
+    """Build bearer credentials for a signed token."""
+    payload = {
+        "sub": "user-123",
+        "email": "user@example.com",
+        "aud": "authenticated",
+        "exp": int(time.time()) + 3600,
+        "user_metadata": {"role": "admin"},
+    }
+    payload.update(claims)
+    token = jwt.encode(payload, secret, algorithm="HS256")
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+class TestGetCurrentUser:
+    """Tests for get_current_user."""
+
+    @pytest.mark.asyncio
+    async def test_valid_token(self):
+        """Test that a valid token yields the user from its claims."""
+        user = await auth.get_current_user(make_credentials())
+
+        assert user.id == "user-123"
+        assert user.email == "user@example.com"
+        assert user.is_admin
+
+    @pytest.mark.asyncio
+    async def test_expired_token(self):
+        """Test that an expired token is rejected with 401."""
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_user(make_credentials(exp=int(time.time()) - 10))
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_wrong_secret(self):
+        """Test that a token signed with another secret is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_user(make_credentials(secret="other-secret"))
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_wrong_audience(self):
+        """Test that a token for another audience is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.get_current_user(make_credentials(aud="anon"))
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_rejections_do_not_share_state(self):
+        """Test each rejection raises its own exception without a stale cause."""
+        with pytest.raises(HTTPException) as bad_signature:
+            await auth.get_current_user(make_credentials(secret="other-secret"))
+        with pytest.raises(HTTPException) as no_subject:
+            await auth.get_current_user(make_credentials(sub=""))
+
+        assert no_subject.value is not bad_signature.value
+        assert no_subject.value.status_code == 401
+        assert no_subject.value.__cause__ is None
+
+
+class TestRequireRole:
+    """Tests for require_role."""
+
+    def test_shared_instance_per_role(self):
+        """Test that the same role returns the same dependency instance."""
+        assert auth.require_role("admin") is auth.require_role("admin")
+        assert auth.require_role("admin") is not auth.require_role("editor")
+
+    @pytest.mark.asyncio
+    async def test_rejects_missing_role(self):
+        """Test that a user without the role is rejected with 403."""
+        user = auth.AuthenticatedUser(id="user-123", email="user@example.com")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await auth.require_role("editor")(user)
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_admin_passes_any_role(self):
+        """Test that admins pass every role check."""
+        user = auth.AuthenticatedUser(id="user-123", email="user@example.com", role="admin")
+
+        assert await auth.require_role("editor")(user) is user
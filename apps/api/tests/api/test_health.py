@@ -0,0 +1,108 @@
+"""Tests for health probes served by HealthCheckMiddleware."""
+
+import asyncio
+import os
+import signal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware.health import HealthCheckMiddleware
+from src.api.routes import health
+
+
+def make_client() -> tuple[TestClient, list[str]]:
+    """Build an app whose inner middleware records the paths it sees."""
+    seen: list[str] = []
+    app = FastAPI()
+    app.include_router(health.router)
+
+    @app.middleware("http")
+    async def record_path(request, call_next):
+        seen.append(request.url.path)
+        return await call_next(request)
+
+    app.add_middleware(HealthCheckMiddleware, probes=health.PROBES)
+    return TestClient(app), seen
+
+
+class TestHealthCheckMiddleware:
+    """Tests for HealthCheckMiddleware."""
+
+    def test_probes_skip_inner_middleware(self):
+        """Test probes are answered before the rest of the stack runs."""
+        client, seen = make_client()
+
+        live = client.get("/health/live")
+        ready = client.get("/health/ready")
+        healthy = client.get("/health")
+
+        assert live.json() == {"status": "alive"}
+        assert ready.json() == {"status": "ready"}
+        assert healthy.json()["status"] == "healthy"
+        assert live.headers["cache-control"] == "no-store"
+        assert seen == []
+
+    def test_other_requests_pass_through(self):
+        """Test non-probe paths and methods reach the app."""
+        client, seen = make_client()
+
+        assert client.get("/missing").status_code == 404
+        assert client.post("/health/live").status_code == 405
+        assert seen == ["/missing", "/health/live"]
+
+    def test_not_ready_while_draining(self):
+        """Test the readiness probe fails once readiness is cleared."""
+        client, _ = make_client()
+
+        health.set_ready(False)
+        try:
+            ready = client.get("/health/ready")
+            live = client.get("/health/live")
+        finally:
+            health.set_ready(True)
+
+        assert ready.status_code == 503
+        assert live.status_code == 200
+
+
+class TestDrainHandler:
+    """Tests for the SIGTERM drain handler."""
+
+    @pytest.fixture(autouse=True)
+    async def drain(self, monkeypatch):
+        """Use a short drain period and record shutdown instead of signalling."""
+        monkeypatch.setenv("SHUTDOWN_DRAIN_SECONDS", "0.05")
+        health.get_shutdown_drain_seconds.cache_clear()
+        stops: list[bool] = []
+        monkeypatch.setattr(health, "_begin_shutdown", lambda: stops.append(True))
+        yield stops
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGTERM)
+        health.get_shutdown_drain_seconds.cache_clear()
+        health.set_ready(True)
+
+    async def test_sigterm_fails_readiness_before_shutdown(self, drain):
+        """Test readiness fails at once and shutdown starts after the drain period."""
+        health.install_drain_handler()
+
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0.01)
+        assert not health._ready
+        assert drain == []
+
+        await asyncio.sleep(0.1)
+        assert drain == [True]
+
+    async def test_second_sigterm_skips_drain(self, drain):
+        """Test a second SIGTERM starts shutdown without waiting."""
+        health.install_drain_handler()
+
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0.01)
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0.01)
+        assert drain == [True]
+
+        await asyncio.sleep(0.1)
+        assert drain == [True]
@@ -0,0 +1,45 @@
+"""Tests for the request logging middleware's header filtering."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from starlette.requests import Request
+from structlog.processors import JSONRenderer
+
+from src.api.middleware import logging as request_logging
+
+RAW_HEADERS = [
+    (b"authorization", b"Bearer secret-token"),
+    (b"user-agent", b"pytest"),
+]
+
+
+def make_request() -> Request:
+    """Build a request carrying a sensitive and a plain header."""
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": RAW_HEADERS})
+
+
+class TestSafeHeaders:
+    """Tests for SafeHeaders and get_safe_headers."""
+
+    def test_filtering_deferred_until_render(self):
+        """Test headers are only decoded and filtered when the record renders."""
+        spy = MagicMock(wraps=request_logging._filter_raw_headers)
+        with patch.object(request_logging, "_filter_raw_headers", spy):
+            headers = request_logging.get_safe_headers(make_request())
+            spy.assert_not_called()
+
+            rendered = JSONRenderer()(None, "info", {"event": "x", "headers": headers})
+
+        spy.assert_called_once_with(RAW_HEADERS)
+        assert json.loads(rendered)["headers"] == {
+            "authorization": "[FILTERED]",
+            "user-agent": "pytest",
+        }
+
+    def test_repr_is_filtered(self):
+        """Test console rendering never shows sensitive values."""
+        text = repr(request_logging.get_safe_headers(make_request()))
+
+        assert "secret-token" not in text
+        assert "[FILTERED]" in text
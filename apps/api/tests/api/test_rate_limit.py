@@ -0,0 +1,75 @@
+"""Tests for the in-memory rate limiter."""
+
+from unittest.mock import patch
+
+from src.api.middleware.rate_limit import RateLimiter
+
+MONOTONIC_NS = "src.api.middleware.rate_limit.time.monotonic_ns"
+
+
+class TestRateLimiter:
+    """Tests for token bucket RateLimiter."""
+
+    def test_allows_up_to_limit(self):
+        """Test requests are allowed until the bucket is empty."""
+        limiter = RateLimiter(requests_per_minute=3, window_seconds=60)
+
+        with patch(MONOTONIC_NS, return_value=1_000_000_000_000):
+            assert limiter.check_rate_limit("user-1") == (True, 2)
+            assert limiter.check_rate_limit("user-1") == (True, 1)
+            assert limiter.check_rate_limit("user-1") == (True, 0)
+            assert limiter.check_rate_limit("user-1") == (False, 0)
+
+    def test_users_are_independent(self):
+        """Test one user's usage does not affect another."""
+        limiter = RateLimiter(requests_per_minute=1, window_seconds=60)
+
+        with patch(MONOTONIC_NS, return_value=1_000_000_000_000):
+            assert limiter.check_rate_limit("user-1")[0] is True
+            assert limiter.check_rate_limit("user-1")[0] is False
+            assert limiter.check_rate_limit("user-2")[0] is True
+
+    def test_tokens_refill_over_time(self):
+        """Test tokens refill proportionally to elapsed time."""
+        limiter = RateLimiter(requests_per_minute=2, window_seconds=60)
+
+        with patch(MONOTONIC_NS) as mock_time:
+            mock_time.return_value = 1_000_000_000_000
+            limiter.check_rate_limit("user-1")
+            limiter.check_rate_limit("user-1")
+            assert limiter.check_rate_limit("user-1")[0] is False
+
+            # One token refills every 30 seconds
+            mock_time.return_value = 1_030_000_000_000
+            assert limiter.check_rate_limit("user-1") == (True, 0)
+            assert limiter.check_rate_limit("user-1")[0] is False
+
+    def test_retry_after(self):
+        """Test retry-after reflects time until the next token."""
+        limiter = RateLimiter(requests_per_minute=1, window_seconds=4)
+
+        with patch(MONOTONIC_NS) as mock_time:
+            mock_time.return_value = 1_000_000_000_000
+            assert limiter.get_retry_after("user-1") == 0
+
+            limiter.check_rate_limit("user-1")
+            assert limiter.get_retry_after("user-1") == 4
+
+            mock_time.return_value = 1_001_000_000_000
+            assert limiter.get_retry_after("user-1") == 3
+
+    def test_idle_buckets_are_swept(self):
+        """Test buckets idle for a full window are dropped."""
+        limiter = RateLimiter(requests_per_minute=2, window_seconds=60)
+        _, buckets = limiter._shards[limiter._shard_index("user-1")]
+
+        with patch(MONOTONIC_NS) as mock_time:
+            mock_time.return_value = 1_000_000_000_000
+            limiter.check_rate_limit("user-1")
+            assert "user-1" in buckets
+
+        limiter._sweep(buckets, 1_059_000_000_000)
+        assert "user-1" in buckets
+
+        limiter._sweep(buckets, 1_060_000_000_000)
+        assert "user-1" not in buckets
@@ -0,0 +1,75 @@
+"""Tests for shared response helpers."""
+
+from starlette.requests import Request
+
+from src.api.responses import (
+    ETAG_CACHE_CONTROL,
+    IMMUTABLE_CACHE_CONTROL,
+    etag_json_response,
+    make_etag,
+    not_modified,
+)
+
+BODY = b'{"id":"p1"}'
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    """Build a GET request with an optional If-None-Match header."""
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestEtagJsonResponse:
+    """Tests for etag_json_response."""
+
+    def test_sends_body_with_etag(self):
+        """Test a request without If-None-Match gets the body and an ETag."""
+        response = etag_json_response(make_request(), BODY)
+
+        assert response.status_code == 200
+        assert response.body == BODY
+        assert response.headers["etag"].startswith('W/"')
+
+    def test_not_modified_on_match(self):
+        """Test a matching If-None-Match, strong or weak, yields an empty 304."""
+        etag = etag_json_response(make_request(), BODY).headers["etag"]
+
+        for if_none_match in (etag, etag.removeprefix("W/"), f'"other", {etag}'):
+            response = etag_json_response(make_request(if_none_match), BODY)
+
+            assert response.status_code == 304
+            assert response.body == b""
+            assert response.headers["etag"] == etag
+
+    def test_changed_body_is_sent(self):
+        """Test a stale ETag gets the new body."""
+        etag = etag_json_response(make_request(), BODY).headers["etag"]
+
+        response = etag_json_response(make_request(etag), b'{"id":"p2"}')
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_cache_control_on_200_and_304(self):
+        """Test a custom Cache-Control is sent with both the body and a 304."""
+        response = etag_json_response(make_request(), BODY)
+        assert response.headers["cache-control"] == ETAG_CACHE_CONTROL
+
+        etag = response.headers["etag"]
+        for request in (make_request(), make_request(etag)):
+            response = etag_json_response(request, BODY, cache_control=IMMUTABLE_CACHE_CONTROL)
+            assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+class TestNotModified:
+    """Tests for not_modified."""
+
+    def test_precomputed_etag(self):
+        """Test a fingerprint ETag short-circuits before any body is built."""
+        etag = make_etag(b"profile-1|2026-01-01|3")
+
+        assert not_modified(make_request(), etag) is None
+        assert not_modified(make_request('W/"stale"'), etag) is None
+        assert not_modified(make_request(etag), etag).status_code == 304
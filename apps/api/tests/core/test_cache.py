@@ -0,0 +1,53 @@
+"""Tests for the Redis cache helpers."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError, TimeoutError
+
+from src.core import cache
+
+
+@pytest.fixture
+def redis_url(monkeypatch):
+    """Point the cache at a local Redis URL and reset the shared client."""
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    cache.get_redis_url.cache_clear()
+    monkeypatch.setattr(cache, "_redis", None)
+    yield
+    cache.get_redis_url.cache_clear()
+
+
+class TestGetCache:
+    """Tests for get_cache."""
+
+    async def test_client_uses_short_timeouts(self, redis_url):
+        """Test a stalled Redis cannot hold a request until the TCP timeout."""
+        redis = await cache.get_cache()
+        kwargs = redis.connection_pool.connection_kwargs
+
+        assert kwargs["socket_connect_timeout"] == cache.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS
+        assert kwargs["socket_timeout"] == cache.REDIS_SOCKET_TIMEOUT_SECONDS
+        assert kwargs["retry_on_timeout"] is False
+
+
+class TestCacheErrors:
+    """Tests that cache errors degrade to misses."""
+
+    @pytest.mark.parametrize("error", [TimeoutError("timed out"), ConnectionError("refused")])
+    async def test_get_error_is_a_miss(self, error):
+        """Test a failed read returns None instead of raising."""
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=error)
+
+        assert await cache.cache_get(redis, "key") is None
+
+    @pytest.mark.parametrize("error", [TimeoutError("timed out"), ConnectionError("refused")])
+    async def test_delete_error_is_swallowed(self, error):
+        """Test a failed invalidation does not fail the request."""
+        redis = MagicMock()
+        redis.delete = AsyncMock(side_effect=error)
+
+        await cache.cache_delete(redis, "a", "b")
+
+        redis.delete.assert_awaited_once_with("a", "b")
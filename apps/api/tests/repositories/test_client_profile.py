@@ -0,0 +1,194 @@
+"""Tests for the client profile repository's write paths and active profile cache."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.db_pool import record_to_dict
+from src.repositories.client_profile import ClientProfileRepository
+from src.schemas.client_profile import ClientProfileCreate
+
+PROFILE_ID = uuid.UUID("22222222-2222-4222-8222-222222222222")
+OTHER_ID = uuid.UUID("66666666-6666-4666-8666-666666666666")
+USER_ID = "77777777-7777-4777-8777-777777777777"
+ACTIVE_KEY = f"v1:cp:active:{USER_ID}"
+
+
+def make_profile_record(**overrides):
+    """Build a client_profiles row as returned by asyncpg."""
+    record = {
+        "id": PROFILE_ID,
+        "user_id": uuid.UUID(USER_ID),
+        "company_name": "Acme",
+        "industry": "Software",
+        "ideal_customer_profile": "Startups",
+        "services": None,
+        "additional_context": None,
+        "scoring_weight_overrides": None,
+        "is_active": True,
+        "created_at": "2024-05-01T12:00:00+00:00",
+        "updated_at": "2024-05-01T12:00:00+00:00",
+    }
+    record.update(overrides)
+    return record
+
+
+def make_redis(cached: bytes | None = None) -> MagicMock:
+    """Build a Redis client whose GET returns ``cached``."""
+    redis = MagicMock()
+    redis.get = AsyncMock(return_value=cached)
+    redis.set = AsyncMock()
+    redis.delete = AsyncMock()
+    return redis
+
+
+def make_response(data) -> MagicMock:
+    """Build a PostgREST response carrying ``data``."""
+    return MagicMock(data=data)
+
+
+class TestInsertProfile:
+    """Tests for the pooled profile insert."""
+
+    async def test_user_id_is_first_parameter(self):
+        """Test user_id binds as $1, which the first-profile check relies on."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(return_value=make_profile_record())
+        repo = ClientProfileRepository(MagicMock(), pool)
+
+        profile = await repo.create(
+            USER_ID,
+            ClientProfileCreate(
+                company_name="Acme", industry="Software", ideal_customer_profile="Startups"
+            ),
+        )
+
+        query, *params = pool.fetchrow.call_args.args
+        assert "WHERE user_id = $1" in query
+        assert params[:3] == [USER_ID, "Acme", "Software"]
+        assert profile.id == str(PROFILE_ID)
+        assert profile.services == []
+        assert profile.is_active is True
+
+
+class TestSetActiveAtomically:
+    """Tests for the single-statement activation."""
+
+    async def test_returns_activated_profile(self):
+        """Test the activated row is returned and the cached profile is dropped."""
+        pool = MagicMock()
+        pool.fetch = AsyncMock(
+            return_value=[
+                make_profile_record(id=OTHER_ID, is_active=False),
+                make_profile_record(),
+            ]
+        )
+        redis = make_redis()
+        repo = ClientProfileRepository(MagicMock(), pool, redis)
+
+        profile = await repo.set_active(str(PROFILE_ID), USER_ID)
+
+        assert pool.fetch.call_args.args[1:] == (str(PROFILE_ID), USER_ID)
+        assert profile.id == str(PROFILE_ID)
+        redis.delete.assert_awaited_once_with(ACTIVE_KEY)
+
+    async def test_unknown_profile_returns_none(self):
+        """Test no updated rows maps to None."""
+        pool = MagicMock()
+        pool.fetch = AsyncMock(return_value=[])
+        repo = ClientProfileRepository(MagicMock(), pool)
+
+        assert await repo.set_active(str(PROFILE_ID), USER_ID) is None
+
+
+class TestDeleteAndReassign:
+    """Tests for the single-statement delete."""
+
+    async def test_deleted(self):
+        """Test a deleted row reports success."""
+        pool = MagicMock()
+        pool.fetchval = AsyncMock(return_value=1)
+        repo = ClientProfileRepository(MagicMock(), pool)
+
+        assert await repo.delete(str(PROFILE_ID), USER_ID) is True
+        assert pool.fetchval.call_args.args[1:] == (str(PROFILE_ID), USER_ID)
+
+    async def test_not_found(self):
+        """Test no deleted row reports not found."""
+        pool = MagicMock()
+        pool.fetchval = AsyncMock(return_value=0)
+        repo = ClientProfileRepository(MagicMock(), pool)
+
+        assert await repo.delete(str(PROFILE_ID), USER_ID) is False
+
+
+class TestPostgrestWrites:
+    """Tests that PostgREST writes evict the shared active profile entry."""
+
+    async def test_set_active_evicts(self):
+        """Test activating a profile drops the cached active profile."""
+        redis = make_redis()
+        repo = ClientProfileRepository(MagicMock(), redis=redis)
+        responses = [make_response([record_to_dict(make_profile_record())]), make_response([])]
+
+        with patch(
+            "src.repositories.client_profile.execute_query", AsyncMock(side_effect=responses)
+        ):
+            profile = await repo.set_active(str(PROFILE_ID), USER_ID)
+
+        assert profile.id == str(PROFILE_ID)
+        redis.delete.assert_awaited_once_with(ACTIVE_KEY)
+
+    async def test_delete_evicts(self):
+        """Test deleting a profile drops the cached active profile."""
+        redis = make_redis()
+        repo = ClientProfileRepository(MagicMock(), redis=redis)
+
+        with patch(
+            "src.repositories.client_profile.execute_query",
+            AsyncMock(return_value=make_response([{"is_active": False}])),
+        ):
+            assert await repo.delete(str(PROFILE_ID), USER_ID) is True
+
+        redis.delete.assert_awaited_once_with(ACTIVE_KEY)
+
+
+class TestGetActive:
+    """Tests for the Redis-backed active profile lookup."""
+
+    async def test_cache_hit_skips_query(self):
+        """Test a cached profile is returned without querying PostgREST."""
+        cached = ClientProfileRepository(MagicMock())._row_to_profile(
+            record_to_dict(make_profile_record())
+        )
+        redis = make_redis(cached.model_dump_json().encode())
+        query = AsyncMock()
+        repo = ClientProfileRepository(MagicMock(), redis=redis)
+
+        with patch("src.repositories.client_profile.execute_query", query):
+            profile = await repo.get_active(USER_ID)
+
+        assert profile == cached
+        query.assert_not_awaited()
+
+    async def test_cached_null_is_no_profile(self):
+        """Test the route's cached ``null`` means the user has no active profile."""
+        repo = ClientProfileRepository(MagicMock(), redis=make_redis(b"null"))
+
+        with patch("src.repositories.client_profile.execute_query", AsyncMock()):
+            assert await repo.get_active(USER_ID) is None
+
+    async def test_miss_populates_cache(self):
+        """Test a miss queries PostgREST and stores the profile."""
+        redis = make_redis()
+        repo = ClientProfileRepository(MagicMock(), redis=redis)
+
+        with patch(
+            "src.repositories.client_profile.execute_query",
+            AsyncMock(return_value=make_response(record_to_dict(make_profile_record()))),
+        ):
+            profile = await repo.get_active(USER_ID)
+
+        key, body = redis.set.call_args.args
+        assert key == ACTIVE_KEY
+        assert profile.id == str(PROFILE_ID)
+        assert body == profile.model_dump_json().encode()
@@ -0,0 +1,146 @@
+"""Tests for the conversation repository's direct Postgres paths."""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.repositories.conversation import ConversationRepository
+from src.schemas.conversation import ConversationMessage, ConversationStatus, MessageRole
+
+CONVERSATION_ID = uuid.UUID("55555555-5555-4555-8555-555555555555")
+
+
+def make_conversation_record(**overrides):
+    """Build a conversations row as returned by asyncpg."""
+    record = {
+        "id": CONVERSATION_ID,
+        "user_id": None,
+        "client_profile_id": None,
+        "messages": [],
+        "status": "in_progress",
+        "extracted_profile": None,
+        "started_at": "2024-05-01T12:00:00+00:00",
+        "completed_at": None,
+    }
+    record.update(overrides)
+    return record
+
+
+def make_message(content: str) -> dict:
+    """Build a stored message."""
+    return {
+        "role": "assistant",
+        "content": content,
+        "timestamp": "2024-05-01T12:00:00+00:00",
+        "voice_input": False,
+    }
+
+
+class TestCreate:
+    """Tests for the pooled conversation insert."""
+
+    async def test_binds_initial_message_as_json(self):
+        """Test the initial message is sent as JSON text and the row is mapped."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(
+            return_value=make_conversation_record(messages=[make_message("Hi")])
+        )
+        repo = ConversationRepository(MagicMock(), pool)
+
+        conversation = await repo.create(
+            ConversationMessage(role=MessageRole.ASSISTANT, content="Hi")
+        )
+
+        query, messages_json, status = pool.fetchrow.call_args.args
+        assert "gen_random_uuid()" in query
+        assert [m["content"] for m in json.loads(messages_json)] == ["Hi"]
+        assert status == "in_progress"
+        assert conversation.id == str(CONVERSATION_ID)
+        assert conversation.messages[0].content == "Hi"
+
+
+class TestAppendMessage:
+    """Tests for the in-place message append."""
+
+    async def test_binds_message_json(self):
+        """Test the message is appended as JSON text and the row is mapped."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(
+            return_value=make_conversation_record(
+                messages=[make_message("Hi"), make_message("Hello")]
+            )
+        )
+        repo = ConversationRepository(MagicMock(), pool)
+
+        conversation = await repo.add_message(
+            str(CONVERSATION_ID),
+            ConversationMessage(role=MessageRole.USER, content="Hello"),
+        )
+
+        _, conversation_id, message_json = pool.fetchrow.call_args.args
+        assert conversation_id == str(CONVERSATION_ID)
+        assert json.loads(message_json)["content"] == "Hello"
+        assert len(conversation.messages) == 2
+
+    async def test_missing_conversation_raises(self):
+        """Test appending to an unknown conversation raises ValueError."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(return_value=None)
+        repo = ConversationRepository(MagicMock(), pool)
+
+        with pytest.raises(ValueError, match="not found"):
+            await repo.add_message(
+                str(CONVERSATION_ID),
+                ConversationMessage(role=MessageRole.USER, content="Hello"),
+            )
+
+
+class TestConvertToClientProfile:
+    """Tests for the single-transaction conversion."""
+
+    @staticmethod
+    def make_pool(linked):
+        """Build a pool whose transaction's fetchval returns ``linked``."""
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value=linked)
+        pool = MagicMock()
+        pool.acquire.return_value.__aenter__.return_value = conn
+        return pool, conn
+
+    async def test_binds_conversation_and_profile_values(self):
+        """Test the conversation values come first, then the profile columns."""
+        pool, conn = self.make_pool(CONVERSATION_ID)
+        redis = MagicMock()
+        redis.delete = AsyncMock()
+        repo = ConversationRepository(MagicMock(), pool, redis)
+        profile_data = {"id": "p-1", "user_id": "u-1", "company_name": "Acme"}
+
+        await repo.convert_to_client_profile(str(CONVERSATION_ID), "u-1", profile_data)
+
+        # The new profile is active, so the previously cached one is dropped
+        redis.delete.assert_awaited_once_with("v1:cp:active:u-1")
+
+        query, *params = conn.fetchval.call_args.args
+        assert "INSERT INTO client_profiles (id, user_id, company_name)" in query
+        assert "VALUES ($5, $6, $7)" in query
+        assert params == [
+            str(CONVERSATION_ID),
+            "u-1",
+            ConversationStatus.CONVERTED.value,
+            ["completed", "in_progress"],
+            "p-1",
+            "u-1",
+            "Acme",
+        ]
+
+    async def test_unconvertible_conversation_raises(self):
+        """Test no linked conversation raises so the profile insert rolls back."""
+        pool, _ = self.make_pool(None)
+        repo = ConversationRepository(MagicMock(), pool)
+
+        with pytest.raises(ValueError, match="not convertible"):
+            await repo.convert_to_client_profile(
+                str(CONVERSATION_ID), "u-1", {"id": "p-1", "user_id": "u-1"}
+            )
@@ -0,0 +1,89 @@
+"""Tests for the lead repository's direct Postgres paths."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.repositories.lead import LeadRepository
+from src.schemas.lead import LeadStatus, LeadUpdate
+
+LEAD_ID = uuid.UUID("11111111-1111-4111-8111-111111111111")
+PROFILE_ID = "22222222-2222-4222-8222-222222222222"
+
+
+def make_lead_record(**overrides):
+    """Build a leads row as returned by asyncpg."""
+    record = {
+        "id": LEAD_ID,
+        "client_profile_id": uuid.UUID(PROFILE_ID),
+        "search_id": uuid.UUID("33333333-3333-4333-8333-333333333333"),
+        "name": "Jane Doe",
+        "email": None,
+        "phone": None,
+        "company": "Acme",
+        "company_size": "small",
+        "intent_score": 72.5,
+        "score_breakdown": {},
+        "source": "manual",
+        "source_url": None,
+        "status": "contacted",
+        "accuracy": None,
+        "raw_data": None,
+        "created_at": "2024-05-01T12:00:00+00:00",
+        "updated_at": "2024-05-02T12:00:00+00:00",
+    }
+    record.update(overrides)
+    return record
+
+
+class TestUpdateWithHistory:
+    """Tests for the single-statement lead update."""
+
+    async def test_binds_update_and_history_values(self):
+        """Test unset fields bind as NULL and previous_status is not mapped."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(return_value=make_lead_record(previous_status="new"))
+        repo = LeadRepository(MagicMock(), pool)
+
+        with patch.object(repo, "_to_lead", wraps=repo._to_lead) as to_lead:
+            lead = await repo.update(
+                str(LEAD_ID),
+                PROFILE_ID,
+                LeadUpdate(status=LeadStatus.CONTACTED, notes="Called"),
+            )
+
+        args = pool.fetchrow.call_args.args
+        assert "INSERT INTO lead_status_history" in args[0]
+        assert args[1:] == (str(LEAD_ID), PROFILE_ID, "contacted", None, None, None, "Called")
+        assert "previous_status" not in to_lead.call_args.args[0]
+        assert lead.id == str(LEAD_ID)
+        assert lead.client_profile_id == PROFILE_ID
+        assert lead.status == LeadStatus.CONTACTED
+
+    async def test_missing_lead_returns_none(self):
+        """Test a lead outside the profile maps to None."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(return_value=None)
+        repo = LeadRepository(MagicMock(), pool)
+
+        assert await repo.update(str(LEAD_ID), PROFILE_ID, LeadUpdate(email="a@b.co")) is None
+
+
+class TestDeleteWithHistory:
+    """Tests for the single-statement lead delete."""
+
+    async def test_deleted(self):
+        """Test a deleted row reports success."""
+        pool = MagicMock()
+        pool.fetchval = AsyncMock(return_value=1)
+        repo = LeadRepository(MagicMock(), pool)
+
+        assert await repo.delete(str(LEAD_ID), PROFILE_ID) is True
+        assert pool.fetchval.call_args.args[1:] == (str(LEAD_ID), PROFILE_ID)
+
+    async def test_not_found(self):
+        """Test no deleted row reports not found."""
+        pool = MagicMock()
+        pool.fetchval = AsyncMock(return_value=0)
+        repo = LeadRepository(MagicMock(), pool)
+
+        assert await repo.delete(str(LEAD_ID), PROFILE_ID) is False
@@ -0,0 +1,59 @@
+"""Tests for the search repository's direct Postgres paths."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from src.repositories.search import SearchRepository
+from src.schemas.lead import LeadSource
+
+SEARCH_ID = uuid.UUID("44444444-4444-4444-8444-444444444444")
+
+
+def make_search_record(**overrides):
+    """Build a searches row as returned by asyncpg."""
+    record = {
+        "id": SEARCH_ID,
+        "client_profile_id": uuid.UUID("22222222-2222-4222-8222-222222222222"),
+        "search_type": "autonomous",
+        "manual_params": None,
+        "quality_setting": 0.7,
+        "status": "in_progress",
+        "sources_queried": ["reddit"],
+        "sources_successful": None,
+        "sources_failed": ["reddit"],
+        "lead_count": 5,
+        "started_at": "2024-05-01T12:00:00+00:00",
+        "completed_at": None,
+        "error_message": None,
+    }
+    record.update(overrides)
+    return record
+
+
+class TestMergeSourceResult:
+    """Tests for the atomic source result merge."""
+
+    async def test_binds_source_result(self):
+        """Test the source, outcome and lead count are bound and the row is mapped."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(return_value=make_search_record())
+        repo = SearchRepository(MagicMock(), pool)
+
+        search = await repo.add_source_result(
+            str(SEARCH_ID), LeadSource.REDDIT, success=False, leads_found=5
+        )
+
+        assert pool.fetchrow.call_args.args[1:] == (str(SEARCH_ID), "reddit", False, 5)
+        assert search.id == str(SEARCH_ID)
+        assert search.sources_queried == [LeadSource.REDDIT]
+        assert search.sources_successful == []
+        assert search.sources_failed == [LeadSource.REDDIT]
+        assert search.lead_count == 5
+
+    async def test_missing_search_returns_none(self):
+        """Test an unknown search maps to None."""
+        pool = MagicMock()
+        pool.fetchrow = AsyncMock(return_value=None)
+        repo = SearchRepository(MagicMock(), pool)
+
+        assert await repo.add_source_result(str(SEARCH_ID), LeadSource.REDDIT, True) is None
@@ -0,0 +1,36 @@
+"""Tests for keyset pagination cursors."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils import cursor
+
+
+class TestCursor:
+    """Tests for cursor encoding and seek filters."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes back to the sort value and ID."""
+        started = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+        assert cursor.decode_cursor(cursor.encode_cursor(87.5, "abc")) == (87.5, "abc")
+        assert cursor.decode_cursor(cursor.encode_cursor(started, "abc")) == (
+            "2024-05-01T12:30:00+00:00",
+            "abc",
+        )
+
+    @pytest.mark.parametrize("value", ["", "not-a-cursor!", "WzFd", "eyJhIjogMX0"])
+    def test_malformed_cursor_rejected(self, value):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            cursor.decode_cursor(value)
+
+    def test_seek_filter_quotes_values(self):
+        """Test values with PostgREST reserved characters are quoted."""
+        assert cursor.seek_filter("company", 'Acme, "Inc."', "id-1", desc=False) == (
+            'company.gt."Acme, \\"Inc.\\"",and(company.eq."Acme, \\"Inc.\\"",id.gt."id-1")'
+        )
+        assert cursor.seek_filter("intent_score", 90.0, "id-1", desc=True).startswith(
+            'intent_score.lt."90.0",'
+        )
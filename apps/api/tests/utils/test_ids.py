@@ -0,0 +1,32 @@
+"""Tests for pooled UUID generation."""
+
+import uuid
+
+from src.utils import ids
+
+
+class TestUuidPool:
+    """Tests for _UuidPool."""
+
+    def test_version_4_uuids(self):
+        """Test generated IDs are valid, unique version 4 UUIDs across refills."""
+        pool = ids._UuidPool()
+        generated = [pool.next() for _ in range(1000)]
+
+        assert all(u.version == 4 and u.variant == uuid.RFC_4122 for u in generated)
+        assert len(set(generated)) == len(generated)
+
+    def test_reset_discards_buffer(self):
+        """Test reset drops buffered bytes so a forked child draws fresh ones."""
+        pool = ids._UuidPool()
+        pool.next()
+        pool.reset()
+
+        assert pool._buf == b""
+        assert pool._offset == 0
+
+    def test_new_id_is_uuid_string(self):
+        """Test new_id returns a canonical UUID string."""
+        value = ids.new_id()
+
+        assert str(uuid.UUID(value)) == value